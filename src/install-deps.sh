@@ -17,6 +17,9 @@ if [[ $* == *--break-system-packages* ]]; then
 fi
 pip3 install $PIP_ARGS -r "$SCRIPT_DIR/requirements.txt"
 
+## install optional requirements (faster parsing of HTML)
+pip3 install $PIP_ARGS -r "$SCRIPT_DIR/requirements-fast.txt"
+
 
 echo
 echo "dependencies installation done"
@@ -10,7 +10,8 @@
 
 import logging
 import json
-import requests
+
+from rssforward.source.utils.httpclient import http_get, http_post
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,7 +26,7 @@ def get_auth_data(username: str, password: str):
     """Get authentication token and list of students IDs associated with the account."""
     url = "https://office-api.earlystage.pl/api/parent/auth/login"
     data = f'{{"email":"{username}","password":"{password}"}}'
-    response = requests.post(url, data=data, timeout=30)
+    response = http_post(url, data=data)
 
     if response.status_code != 200:
         message = f"unable to authenticate: {response.status_code}"
@@ -55,7 +56,7 @@ def get_auth_header(token):
 
 def get_json_data(token, url, *, throw=True):
     headers = get_auth_header(token)
-    response = requests.get(url, headers=headers, timeout=30)
+    response = http_get(url, headers=headers)
     if response.status_code != 200:
         if throw:
             message = f"unable to get data: {response.status_code}"
@@ -27,6 +27,8 @@ class ConfigKey(Enum):
     GENITEM = "item"
     SITE = "site"
     AUTH = "auth"
+    RATELIMIT = "ratelimit"
+    LOGGING = "logging"
 
 
 @unique
@@ -36,10 +38,20 @@ class ConfigField(Enum):
     STARTUPDELAY = "startupdelay"
     STARTSERVER = "startserver"
     PORT = "port"
+    MAXCONNECTIONS = "maxconnections"
+    FEEDCACHESIZE = "feedcachesize"
+    FRAGMENTCACHESIZE = "fragmentcachesize"
     REFRESHTIME = "refreshtime"
+    GENWORKERS = "genworkers"
+    MAXBROWSERS = "maxbrowsers"
+    COMPRESSFEEDS = "compressfeeds"
+    METRICS = "metrics"
     DATAROOT = "dataroot"
     LOGDIR = "logdir"
     LOGVIEWER = "logviewer"
+    TRACE = "trace"
+    TIMEZONE = "timezone"
+    ITEMHASH = "itemhash"
 
     GEN_ID = "generator"
     ENABLED = "enabled"
@@ -51,6 +63,17 @@ class ConfigField(Enum):
     AUTH_PASS = "pass"  # nosec
     AUTH_ITEMURL = "itemurl"  # nosec
 
+    RATELIMIT_RATE = "rate"
+    RATELIMIT_BURST = "burst"
+    RATELIMIT_MAXINFLIGHT = "maxinflight"
+    RATELIMIT_HOST = "host"
+
+    LOGGING_ASYNC = "async"
+    LOGGING_QUEUESIZE = "queuesize"
+    LOGGING_OVERFLOW = "overflow"
+    LOGGING_LEVEL = "level"
+    LOGGING_MODULES = "modules"
+
 
 # ==================================================
 
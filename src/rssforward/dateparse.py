@@ -0,0 +1,173 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import re
+import logging
+import datetime
+import functools
+from enum import Enum, unique
+from collections.abc import Iterable
+
+import pytz
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_TIMEZONE = "Europe/Warsaw"
+
+
+## values are 'strptime' formats of handled date strings
+@unique
+class DateFormat(Enum):
+    DATE = "%Y-%m-%d"  # 2024-06-04
+    DATE_DOTS = "%d.%m.%Y"  # 04.06.2024
+    DATETIME = "%Y-%m-%d %H:%M:%S"  # 2024-06-04 14:23:41
+    DATETIME_HM = "%Y-%m-%d %H:%M"  # 2024-06-04 14:23
+    ISO_Z = "%Y-%m-%dT%H:%M:%SZ"  # 2024-06-04T14:23:41Z
+    ISO_FRACTION_Z = "%Y-%m-%dT%H:%M:%S.%fZ"  # 2024-06-04T14:23:41.077Z
+    ISO = "iso"  # any other format accepted by 'datetime.fromisoformat()'
+
+
+## date with not padded month or day, e.g. 2024-6-4 (parsed by 'strptime()' with DATE format)
+_SHORT_DATE_REGEX = re.compile(r"\d{4}-\d{1,2}-\d{1,2}")
+
+
+## timezone assigned to dates without explicit zone
+## creating pytz timezone object is expensive, so it is kept once configured
+_TIMEZONE = None
+
+
+def get_timezone():
+    # ruff: noqa: PLW0603
+    global _TIMEZONE  # pylint: disable=W0603
+    if _TIMEZONE is None:
+        _TIMEZONE = pytz.timezone(DEFAULT_TIMEZONE)
+    return _TIMEZONE
+
+
+def configure_timezone(timezone_name=None):
+    global _TIMEZONE  # pylint: disable=W0603
+    if not timezone_name:
+        timezone_name = DEFAULT_TIMEZONE
+    _LOGGER.info("dates timezone: %s", timezone_name)
+    _TIMEZONE = pytz.timezone(timezone_name)
+    clear_parsed_dates()
+
+
+def clear_parsed_dates():
+    _parse_date_cached.cache_clear()
+
+
+def add_timezone(dt: datetime.datetime) -> datetime.datetime:
+    return get_timezone().localize(dt)
+
+
+def timestamp_to_date(timestamp) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(timestamp, tz=get_timezone())
+
+
+## detect format of date string by its shape (without trying consecutive parsers)
+def detect_format(date_string: str) -> DateFormat:
+    size = len(date_string)
+    if size == 10:
+        if date_string[4] == "-":
+            return DateFormat.DATE
+        if date_string[2] == ".":
+            return DateFormat.DATE_DOTS
+    elif size == 19 and date_string[10] == " ":
+        return DateFormat.DATETIME
+    elif size == 16 and date_string[10] == " ":
+        return DateFormat.DATETIME_HM
+    elif size >= 20 and date_string[10] == "T" and date_string[-1] == "Z":
+        if date_string[19] == ".":
+            return DateFormat.ISO_FRACTION_Z
+        return DateFormat.ISO_Z
+    elif size < 10 and _SHORT_DATE_REGEX.fullmatch(date_string):
+        return DateFormat.DATE
+    return DateFormat.ISO
+
+
+## parse date string in given format
+## returns date with configured timezone, raises ValueError if string does not match the format
+def parse_date_format(date_string: str, date_format: DateFormat) -> datetime.datetime:
+    return _parse_date_cached(date_string, date_format)
+
+
+## parse date string in any of handled formats
+def parse_date(date_string: str) -> datetime.datetime:
+    date_format = detect_format(date_string)
+    return parse_date_format(date_string, date_format)
+
+
+## parse all dates of a listing at once
+## format is detected once (on first item) and reused for following items,
+## repeated strings are parsed only once, None items are kept as None
+def parse_dates(dates_list: Iterable[str], date_format: DateFormat = None) -> list[datetime.datetime]:
+    parsed_dict: dict[str, datetime.datetime] = {}
+    ret_list: list[datetime.datetime] = []
+    for date_string in dates_list:
+        if date_string is None:
+            ret_list.append(None)
+            continue
+        item_date = parsed_dict.get(date_string)
+        if item_date is None:
+            if date_format is None:
+                date_format = detect_format(date_string)
+            try:
+                item_date = _parse_date_cached(date_string, date_format)
+            except ValueError:
+                ## item in different format than previous ones
+                item_date = _parse_date_cached(date_string, detect_format(date_string))
+            parsed_dict[date_string] = item_date
+        ret_list.append(item_date)
+    return ret_list
+
+
+## ============================================================
+
+
+## the same listings are read in every generation cycle, so parsed dates are kept
+## (localizing with pytz is more expensive than parsing itself)
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_string: str, date_format: DateFormat) -> datetime.datetime:
+    item_date = _parse_naive(date_string, date_format)
+    return get_timezone().localize(item_date)
+
+
+## fast path: 'fromisoformat()' is implemented in C and is much faster than 'strptime()'
+## it is used only if string has expected shape, otherwise 'strptime()' decides (e.g. for not padded numbers)
+def _parse_naive(date_string: str, date_format: DateFormat) -> datetime.datetime:
+    if date_format is DateFormat.ISO:
+        return datetime.datetime.fromisoformat(date_string)
+    if _is_iso_shape(date_string, date_format):
+        if date_format is DateFormat.DATE_DOTS:
+            return datetime.datetime.fromisoformat(f"{date_string[6:]}-{date_string[3:5]}-{date_string[:2]}")
+        if date_format in (DateFormat.ISO_Z, DateFormat.ISO_FRACTION_Z):
+            ## 'Z' suffix is ignored - such dates were always treated as local time
+            return datetime.datetime.fromisoformat(date_string[:-1])
+        return datetime.datetime.fromisoformat(date_string)
+    return datetime.datetime.strptime(date_string, date_format.value)
+
+
+def _is_iso_shape(date_string: str, date_format: DateFormat) -> bool:
+    size = len(date_string)
+    if date_format is DateFormat.DATE:
+        return size == 10 and date_string[4] == "-" and date_string[7] == "-"
+    if date_format is DateFormat.DATE_DOTS:
+        return size == 10 and date_string[2] == "." and date_string[5] == "."
+    if date_format is DateFormat.DATETIME:
+        return size == 19 and date_string[10] == " " and date_string[4] == "-"
+    if date_format is DateFormat.DATETIME_HM:
+        return size == 16 and date_string[10] == " " and date_string[4] == "-"
+    if date_format is DateFormat.ISO_Z:
+        return size == 20 and date_string[10] == "T" and date_string[19] == "Z"
+    if date_format is DateFormat.ISO_FRACTION_Z:
+        ## fromisoformat() of older Python versions handles only milli- and microseconds
+        return size in (24, 27) and date_string[10] == "T" and date_string[19] == "." and date_string[-1] == "Z"
+    return False
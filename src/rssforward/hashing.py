@@ -0,0 +1,61 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import logging
+import json
+import hashlib
+from enum import Enum, unique
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@unique
+class HashMode(Enum):
+    COMPAT = "compat"  # MD5 of 'json.dumps(sort_keys=True)' - the same items IDs as in previous versions
+    FAST = "fast"  # BLAKE2b of compact canonical JSON - changes IDs, so items will be published once again
+
+
+## encoders are created once - 'json.dumps()' with parameters creates new encoder on every call
+## compat encoder gives output identical to 'json.dumps(data, sort_keys=True)'
+_COMPAT_ENCODER = json.JSONEncoder(sort_keys=True, check_circular=False)
+_FAST_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), check_circular=False)
+
+_HASH_MODE = HashMode.COMPAT
+
+
+def get_hash_mode() -> HashMode:
+    return _HASH_MODE
+
+
+def configure_hashing(mode_name=None):
+    # ruff: noqa: PLW0603
+    global _HASH_MODE  # pylint: disable=W0603
+    if not mode_name:
+        mode_name = HashMode.COMPAT.value
+    _HASH_MODE = HashMode(mode_name)
+    _LOGGER.info("items hash mode: %s", _HASH_MODE.value)
+
+
+def canonical_form(data, mode: HashMode = None) -> str:
+    if mode is None:
+        mode = _HASH_MODE
+    if mode is HashMode.COMPAT:
+        return _COMPAT_ENCODER.encode(data)
+    return _FAST_ENCODER.encode(data)
+
+
+## calculate hash of JSON serializable data (e.g. dict of item fields)
+def calculate_data_hash(data, mode: HashMode = None) -> str:
+    if mode is None:
+        mode = _HASH_MODE
+    data_bytes = canonical_form(data, mode).encode("utf-8")
+    if mode is HashMode.COMPAT:
+        # ruff: noqa: S324
+        return hashlib.md5(data_bytes).hexdigest()  # nosec
+    return hashlib.blake2b(data_bytes, digest_size=16).hexdigest()
@@ -10,11 +10,34 @@ import os
 import sys
 import logging
 from logging import handlers
+import queue
+import atexit
+import threading
+from enum import Enum, unique
+from typing import cast
+
+from rssforward.configfile import ConfigField
 
 
 script_dir = os.path.dirname(__file__)
 logger_file = None
 
+DEFAULT_QUEUE_SIZE = 10000  # maximum number of records waiting for writer thread
+
+## levels of loggers applied before levels given in config
+DEFAULT_MODULES_LEVELS = {"matplotlib": "WARNING", "urllib3": "INFO"}
+
+
+@unique
+class OverflowPolicy(Enum):
+    DROP = "drop"  # records below WARNING are dropped when queue is full
+    BLOCK = "block"  # logging thread waits for free space in queue
+
+
+## listener writing records from queue (if async logging is enabled)
+_LISTENER = None
+_LISTENER_LOCK = threading.Lock()
+
 
 def get_logging_output_file(log_dir=None):
     log_out_dir = log_dir
@@ -29,7 +52,7 @@ def get_logging_output_file(log_dir=None):
     return os.path.join(log_out_dir, "log.txt")
 
 
-def configure(log_file=None, log_dir=None, log_level=None):
+def configure(log_file=None, log_dir=None, log_level=None, config_dict=None):
     # pylint: disable=W0603
     # ruff: noqa: PLW0603
     global logger_file
@@ -37,8 +60,11 @@ def configure(log_file=None, log_dir=None, log_level=None):
     if logger_file is None:
         logger_file = get_logging_output_file(log_dir)
 
+    if config_dict is None:
+        config_dict = {}
+
     if log_level is None:
-        log_level = logging.DEBUG
+        log_level = config_dict.get(ConfigField.LOGGING_LEVEL.value, logging.DEBUG)
 
     ## rotation of log files, 1048576 equals to 1MB
     file_handler = handlers.RotatingFileHandler(filename=logger_file, mode="a+", maxBytes=1048576, backupCount=999)
@@ -50,13 +76,19 @@ def configure(log_file=None, log_dir=None, log_level=None):
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    logging.root.addHandler(console_handler)
-    logging.root.addHandler(file_handler)
+    if config_dict.get(ConfigField.LOGGING_ASYNC.value, True):
+        queue_size = config_dict.get(ConfigField.LOGGING_QUEUESIZE.value, DEFAULT_QUEUE_SIZE)
+        overflow = OverflowPolicy(config_dict.get(ConfigField.LOGGING_OVERFLOW.value, OverflowPolicy.DROP.value))
+        start_async([console_handler, file_handler], queue_size, overflow)
+    else:
+        logging.root.addHandler(console_handler)
+        logging.root.addHandler(file_handler)
     logging.root.setLevel(log_level)
 
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
-
-    logging.getLogger("urllib3").setLevel(logging.INFO)
+    modules_levels = dict(DEFAULT_MODULES_LEVELS)
+    modules_levels.update(config_dict.get(ConfigField.LOGGING_MODULES.value, {}))
+    for module_name, module_level in modules_levels.items():
+        logging.getLogger(module_name).setLevel(module_level)
 
 
 ##     loggerFormat   = '%(asctime)s,%(msecs)-3d %(levelname)-8s %(threadName)s [%(filename)s:%(lineno)d] %(message)s'
@@ -101,14 +133,141 @@ def create_formatter(logger_format=None):
 
 
 class EmptyLineFormatter(logging.Formatter):
-    """Special formatter storing empty lines without formatting."""
+    """Special formatter storing empty lines without formatting.
+
+    Formatted text is kept in record, so the record passed to multiple handlers
+    sharing the formatter is formatted only once.
+    """
 
     ## override base class method
     def format(self, record):
-        msg = record.getMessage()
-        clear_msg = msg.replace("\n", "")
-        clear_msg = clear_msg.replace("\r", "")
-        if not clear_msg:
+        if getattr(record, "formatted_by", None) is self:
+            return record.formatted_text
+        record.formatted_text = self._format_record(record)
+        record.formatted_by = self
+        return record.formatted_text
+
+    def _format_record(self, record):
+        record.message = record.getMessage()
+        if not record.message.strip("\r\n"):
             # empty
-            return msg
-        return super().format(record)
+            return record.message
+        ## the same as base class method, but without calculating message again
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        text = self.formatMessage(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if text[-1:] != "\n":
+                text += "\n"
+            text += record.exc_text
+        if record.stack_info:
+            if text[-1:] != "\n":
+                text += "\n"
+            text += self.formatStack(record.stack_info)
+        return text
+
+
+## ============================================================
+
+
+class BoundedQueueHandler(handlers.QueueHandler):
+    """Handler passing records to bounded queue.
+
+    Only message of record is calculated in logging thread, formatting and writing
+    is done by listener thread. Records of level WARNING and above are never dropped.
+    """
+
+    def __init__(self, records_queue: queue.Queue, overflow=OverflowPolicy.DROP):
+        super().__init__(records_queue)
+        self.overflow = overflow
+        self.dropped = 0  # number of dropped records since last report
+        self.dropped_total = 0
+
+    ## override base class method
+    def prepare(self, record):
+        ## arguments can be modified by caller after logging, so message is calculated immediately
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    ## override base class method
+    def enqueue(self, record):
+        ## queue given in constructor
+        records_queue = cast("queue.Queue", self.queue)
+        if self.overflow is OverflowPolicy.BLOCK or record.levelno >= logging.WARNING:
+            records_queue.put(record)
+            return
+        try:
+            records_queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self.dropped_total += 1
+            return
+        if self.dropped > 0:
+            ## report lost records
+            dropped_record = logging.makeLogRecord(
+                {
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": logging.getLevelName(logging.WARNING),
+                    "msg": f"dropped {self.dropped} log records - logging queue full",
+                },
+            )
+            self.dropped = 0
+            records_queue.put(dropped_record)
+
+
+class BoundedQueueListener(handlers.QueueListener):
+    """Listener of bounded queue.
+
+    Base class puts sentinel stopping the listener without waiting, what raises 'queue.Full'
+    if the queue is full. Here sentinel waits for free space (listener thread empties the queue).
+    """
+
+    ## override base class method
+    def enqueue_sentinel(self):
+        records_queue = cast("queue.Queue", self.queue)
+        records_queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+def start_async(handlers_list, queue_size=DEFAULT_QUEUE_SIZE, overflow=OverflowPolicy.DROP) -> BoundedQueueHandler:
+    """Attach queue handler to root logger and write records to given handlers in separate thread."""
+    global _LISTENER  # pylint: disable=W0603
+    with _LISTENER_LOCK:
+        if _LISTENER is not None:
+            ## already started
+            return None
+        records_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        queue_handler = BoundedQueueHandler(records_queue, overflow)
+        listener = BoundedQueueListener(records_queue, *handlers_list, respect_handler_level=True)
+        listener.start()
+        logging.root.addHandler(queue_handler)
+        _LISTENER = listener
+    atexit.register(shutdown)
+    return queue_handler
+
+
+def is_async() -> bool:
+    return _LISTENER is not None
+
+
+def shutdown():
+    """Write all queued records and switch root logger to synchronous handlers."""
+    global _LISTENER  # pylint: disable=W0603
+    with _LISTENER_LOCK:
+        listener = _LISTENER
+        if listener is None:
+            return
+        _LISTENER = None
+    ## no new records are queued after removing queue handler
+    for handler in list(logging.root.handlers):
+        if isinstance(handler, BoundedQueueHandler) and handler.queue is listener.queue:
+            logging.root.removeHandler(handler)
+    ## waits for writing all records in queue
+    listener.stop()
+    ## following records are written directly (after all queued records to keep order)
+    for handler in listener.handlers:
+        handler.flush()
+        logging.root.addHandler(handler)
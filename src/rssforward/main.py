@@ -15,16 +15,28 @@ import time
 import subprocess  # nosec
 
 from rssforward import logger
-from rssforward.rss.rssserver import RSSServerManager
-from rssforward.rssmanager import RSSManager, ThreadedRSSManager
+from rssforward.rss.fragmentcache import configure_fragment_cache
+from rssforward.dateparse import configure_timezone
+from rssforward.hashing import configure_hashing
+from rssforward.tracing import configure_tracing, set_tracing_enabled, is_tracing_enabled
 from rssforward.configfile import load_config, ConfigField, ConfigKey
-from rssforward.systray.traymanager import TrayManager
+from rssforward.source.utils.ratelimit import configure_rate_limiter
+
+## modules required only by some of start modes (tray: pystray and PIL, server, generators manager)
+## are imported inside start functions to reduce startup time
+# ruff: noqa: PLC0415
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
 def start_with_tray(parameters):
+    from rssforward.rss.rssserver import RSSServerManager
+    from rssforward.rss.feedcache import FeedCache
+    from rssforward.metrics import get_metrics
+    from rssforward.rssmanager import RSSManager, ThreadedRSSManager
+    from rssforward.systray.traymanager import TrayManager
+
     general_section = parameters.get(ConfigKey.GENERAL.value, {})
     data_root = general_section.get(ConfigField.DATAROOT.value)
     log_dir = general_section.get(ConfigField.LOGDIR.value, "")
@@ -32,15 +44,23 @@ def start_with_tray(parameters):
     refresh_time = general_section.get(ConfigField.REFRESHTIME.value, 3600)
     start_server = general_section.get(ConfigField.STARTSERVER.value, True)
     rss_port = general_section.get(ConfigField.PORT.value, 8080)
+    max_connections = general_section.get(ConfigField.MAXCONNECTIONS.value, RSSServerManager.DEFAULT_MAX_CONNECTIONS)
+    feed_cache_size = general_section.get(ConfigField.FEEDCACHESIZE.value, 0)
+    metrics_enabled = general_section.get(ConfigField.METRICS.value, True)
     genloop = general_section.get(ConfigField.GENLOOP.value, True)
     startupdelay = general_section.get(ConfigField.STARTUPDELAY.value, 0)
 
-    tray_manager = TrayManager(server_state=start_server)
+    tray_manager = TrayManager(server_state=start_server, trace_state=is_tracing_enabled())
+    feed_cache = FeedCache(max_content_size=feed_cache_size)
 
     # async start of RSS server
     rss_server = RSSServerManager()
     rss_server.port = rss_port
+    rss_server.max_connections = max_connections
     rss_server.rootDir = data_root
+    rss_server.feed_cache = feed_cache
+    if metrics_enabled:
+        rss_server.metrics = get_metrics()
 
     if start_server:
         rss_server.start()
@@ -48,10 +68,12 @@ def start_with_tray(parameters):
         _LOGGER.info("starting RSS server disabled")
 
     manager = RSSManager(parameters)
+    manager.set_feed_cache(feed_cache)
     threaded_manager = ThreadedRSSManager(manager)
 
     tray_manager.set_rss_server_callback(rss_server.switch_state)
     tray_manager.set_refresh_callback(threaded_manager.execute_single)
+    tray_manager.set_trace_callback(set_tracing_enabled)
 
     threaded_manager.set_state_callback(tray_manager.set_state)
 
@@ -81,9 +103,10 @@ def start_with_tray(parameters):
         exit_code = 1
 
     finally:
-        manager.close()
+        ## wait for running generation before closing generators (e.g. web drivers pool)
         threaded_manager.stop()
         threaded_manager.join()
+        manager.close()
         rss_server.stop()
 
     return exit_code
@@ -91,19 +114,34 @@ def start_with_tray(parameters):
 
 def start_no_tray(parameters):
     """Start generation with RSS server."""
+    from rssforward.rss.rssserver import RSSServerManager
+    from rssforward.rss.feedcache import FeedCache
+    from rssforward.metrics import get_metrics
+    from rssforward.rssmanager import RSSManager, ThreadedRSSManager
+
     general_section = parameters.get(ConfigKey.GENERAL.value, {})
     data_root = general_section.get(ConfigField.DATAROOT.value)
     refresh_time = general_section.get(ConfigField.REFRESHTIME.value, 3600)
     rss_port = general_section.get(ConfigField.PORT.value, 8080)
+    max_connections = general_section.get(ConfigField.MAXCONNECTIONS.value, RSSServerManager.DEFAULT_MAX_CONNECTIONS)
+    feed_cache_size = general_section.get(ConfigField.FEEDCACHESIZE.value, 0)
+    metrics_enabled = general_section.get(ConfigField.METRICS.value, True)
     genloop = general_section.get(ConfigField.GENLOOP.value, True)
     startupdelay = general_section.get(ConfigField.STARTUPDELAY.value, 0)
 
+    feed_cache = FeedCache(max_content_size=feed_cache_size)
+
     # async start of RSS server
     rss_server = RSSServerManager()
     rss_server.port = rss_port
+    rss_server.max_connections = max_connections
+    rss_server.feed_cache = feed_cache
+    if metrics_enabled:
+        rss_server.metrics = get_metrics()
     rss_server.start(data_root)
 
     manager = RSSManager(parameters)
+    manager.set_feed_cache(feed_cache)
     threaded_manager = ThreadedRSSManager(manager)
 
     # data generation main loop
@@ -128,6 +166,7 @@ def start_no_tray(parameters):
         exit_code = 1
 
     finally:
+        manager.close()
         rss_server.stop()
 
     return exit_code
@@ -135,6 +174,8 @@ def start_no_tray(parameters):
 
 def start_raw(parameters):
     """Start raw generation loop."""
+    from rssforward.rssmanager import RSSManager, ThreadedRSSManager
+
     general_section = parameters.get(ConfigKey.GENERAL.value, {})
     refresh_time = general_section.get(ConfigField.REFRESHTIME.value, 3600)
     genloop = general_section.get(ConfigField.GENLOOP.value, True)
@@ -163,6 +204,9 @@ def start_raw(parameters):
         _LOGGER.exception("unhandled exception detected - exiting")
         exit_code = 1
 
+    finally:
+        manager.close()
+
     return exit_code
 
 
@@ -224,6 +268,14 @@ def main():
         required=False,
         help="Set delay in seconds before first generation (useful on startup to wait for KeePassXC to start before)",
     )
+    parser.add_argument(
+        "--trace",
+        choices=[True, False],
+        type=str_to_bool,
+        default=None,
+        required=False,
+        help="Store trace of each generation in log dir (overrides config 'trace' option)",
+    )
 
     args = parser.parse_args()
 
@@ -231,7 +283,7 @@ def main():
 
     general_section = parameters.get(ConfigKey.GENERAL.value, {})
     log_dir = general_section.get(ConfigField.LOGDIR.value)
-    logger.configure(log_dir=log_dir)
+    logger.configure(log_dir=log_dir, config_dict=parameters.get(ConfigKey.LOGGING.value))
 
     _LOGGER.info("============================== starting application ==============================")
     _LOGGER.info("Log output dir: %s", log_dir)
@@ -239,6 +291,11 @@ def main():
     data_root = general_section.get(ConfigField.DATAROOT.value)
     _LOGGER.info("RSS data root dir: %s", data_root)
 
+    configure_rate_limiter(parameters.get(ConfigKey.RATELIMIT.value))
+    configure_fragment_cache(general_section.get(ConfigField.FRAGMENTCACHESIZE.value, 0))
+    configure_timezone(general_section.get(ConfigField.TIMEZONE.value))
+    configure_hashing(general_section.get(ConfigField.ITEMHASH.value))
+
     if args.trayicon is not None:
         general_section[ConfigField.TRAYICON.value] = args.trayicon
     if args.startserver is not None:
@@ -247,6 +304,10 @@ def main():
         general_section[ConfigField.GENLOOP.value] = args.genloop
     if args.startupdelay is not None:
         general_section[ConfigField.STARTUPDELAY.value] = args.startupdelay
+    if args.trace is not None:
+        general_section[ConfigField.TRACE.value] = args.trace
+
+    configure_tracing(general_section.get(ConfigField.TRACE.value, False), log_dir)
 
     tray_icon = general_section.get(ConfigField.TRAYICON.value, True)
 
@@ -0,0 +1,211 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import logging
+import threading
+import bisect
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+## path of RSS server reserved for metrics
+METRICS_PATH = "/metrics"
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+## upper bounds (in seconds) of duration histograms buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class Metric:
+    """Base class of metric with labels. Values of labels are given in order of label names."""
+
+    TYPE: str = ""
+
+    def __init__(self, name, description, label_names=()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._values = {}  # label values -> value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        lines_list = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.TYPE}"]
+        with self._lock:
+            items_list = sorted(self._values.items())
+            lines_list.extend(self._render_values(items_list))
+        return lines_list
+
+    def _render_values(self, items_list) -> list[str]:
+        return [f"{self.name}{self._labels_text(labels)} {format_value(value)}" for labels, value in items_list]
+
+    def _labels_text(self, label_values, extra_labels=()) -> str:
+        pairs = list(zip(self.label_names, label_values, strict=True)) + list(extra_labels)
+        if not pairs:
+            return ""
+        labels = ",".join(f'{name}="{escape_label(str(value))}"' for name, value in pairs)
+        return f"{{{labels}}}"
+
+
+class Counter(Metric):
+    TYPE = "counter"
+
+    def inc(self, *label_values: str, value=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + value
+
+    def get(self, *label_values: str):
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+
+class Histogram(Metric):
+    TYPE = "histogram"
+
+    def __init__(self, name, description, label_names=(), buckets=DURATION_BUCKETS):
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *label_values: str):
+        with self._lock:
+            data = self._values.get(label_values)
+            if data is None:
+                ## buckets counts (last one is '+Inf'), sum, count
+                data = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._values[label_values] = data
+            data[0][bisect.bisect_left(self.buckets, value)] += 1
+            data[1] += value
+            data[2] += 1
+
+    # returns number of observations
+    def get_count(self, *label_values: str):
+        with self._lock:
+            data = self._values.get(label_values)
+            return data[2] if data else 0
+
+    def _render_values(self, items_list) -> list[str]:
+        lines_list = []
+        for labels, (bucket_counts, values_sum, values_count) in items_list:
+            cumulative = 0
+            ## last bucket ('+Inf') has no bound and is rendered separately
+            for bound, bucket_count in zip(self.buckets, bucket_counts, strict=False):
+                cumulative += bucket_count
+                labels_text = self._labels_text(labels, [("le", format_value(bound))])
+                lines_list.append(f"{self.name}_bucket{labels_text} {cumulative}")
+            labels_text = self._labels_text(labels, [("le", "+Inf")])
+            lines_list.append(f"{self.name}_bucket{labels_text} {values_count}")
+            lines_list.append(f"{self.name}_sum{self._labels_text(labels)} {format_value(values_sum)}")
+            lines_list.append(f"{self.name}_count{self._labels_text(labels)} {values_count}")
+        return lines_list
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered in Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: list[Metric] = []
+
+    def counter(self, name, description, label_names=()) -> Counter:
+        return self._add(Counter(name, description, label_names))
+
+    def histogram(self, name, description, label_names=(), buckets=DURATION_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, description, label_names, buckets))
+
+    def clear(self):
+        for metric in self._metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        lines_list = []
+        for metric in self._metrics:
+            lines_list.extend(metric.render())
+        lines_list.append("")
+        return "\n".join(lines_list)
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+
+def format_value(value) -> str:
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+## ============================================================
+
+
+_REGISTRY = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    return _REGISTRY
+
+
+GENERATOR_DURATION = _REGISTRY.histogram(
+    "rssforward_generator_duration_seconds",
+    "Duration of generator execution.",
+    ["generator"],
+)
+GENERATOR_RUNS = _REGISTRY.counter(
+    "rssforward_generator_runs_total",
+    "Number of generator executions.",
+    ["generator", "valid"],
+)
+GENERATOR_OUTPUT_BYTES = _REGISTRY.counter(
+    "rssforward_generator_output_bytes_total",
+    "Size of feeds produced by generator.",
+    ["generator"],
+)
+FEEDS_WRITTEN = _REGISTRY.counter(
+    "rssforward_feeds_written_total",
+    "Number of written feed files.",
+    ["generator"],
+)
+FEEDS_SKIPPED = _REGISTRY.counter(
+    "rssforward_feeds_skipped_total",
+    "Number of unchanged feed files not written.",
+    ["generator"],
+)
+
+HTTP_REQUESTS = _REGISTRY.counter(
+    "rssforward_http_requests_total",
+    "Number of requests sent to sites.",
+    ["host", "status"],
+)
+HTTP_DURATION = _REGISTRY.histogram(
+    "rssforward_http_request_duration_seconds",
+    "Latency of requests sent to sites.",
+    ["host"],
+)
+HTTP_RESPONSE_BYTES = _REGISTRY.counter(
+    "rssforward_http_response_bytes_total",
+    "Size of responses received from sites.",
+    ["host"],
+)
+
+SERVED_REQUESTS = _REGISTRY.counter(
+    "rssforward_served_requests_total",
+    "Number of requests handled by RSS server.",
+    ["status"],
+)
+SERVED_DURATION = _REGISTRY.histogram(
+    "rssforward_served_request_duration_seconds",
+    "Latency of requests handled by RSS server.",
+    ["status"],
+)
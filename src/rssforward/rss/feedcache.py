@@ -0,0 +1,139 @@
+#
+# Copyright (c) 2023, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+
+from rssforward.utils import calculate_bytes_hash
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FeedCache:
+    """Registry of digests and content of feed files.
+
+    Cache is updated when feed files are written, so digests (used as HTTP ETags) do not have to be
+    calculated on each request. Files modified outside of application are hashed once on first access.
+
+    Optionally content of recently written feeds is kept in memory (bounded by total size in bytes,
+    least recently used content is evicted first), so serving the feeds does not require access to disk.
+    """
+
+    class Entry:
+        """Digest of feed file with file's state at the moment of calculation."""
+
+        def __init__(self, etag, mtime, size):
+            self.etag: str = etag
+            self.mtime: float = mtime
+            self.size: int = size
+
+    class Content:
+        """Content of feed file (and optionally its gzip compressed form) kept in memory."""
+
+        def __init__(self, entry, data, gzip_data=None):
+            self.entry: FeedCache.Entry = entry
+            self.data: bytes = data
+            self.gzip_data: bytes = gzip_data
+
+        def size(self):
+            size = len(self.data)
+            if self.gzip_data is not None:
+                size += len(self.gzip_data)
+            return size
+
+    # 'max_content_size' - maximum total size in bytes of content kept in memory, 0 disables storing content
+    def __init__(self, max_content_size=0):
+        self._lock = threading.Lock()
+        self._entries: dict[str, FeedCache.Entry] = {}
+        self._contents: OrderedDict[str, FeedCache.Content] = OrderedDict()
+        self._contents_size = 0
+        self.max_content_size = max_content_size
+
+    # 'content' - content of file that was just written to 'file_path'
+    # 'gzip_content' - compressed content if compressed file was written as well
+    def update(self, file_path, content: str, gzip_content: bytes = None):
+        file_path = os.path.abspath(file_path)
+        data_bytes = content.encode("utf-8")
+        etag = f'"{calculate_bytes_hash(data_bytes)}"'
+        file_stat = os.stat(file_path)
+        entry = FeedCache.Entry(etag, file_stat.st_mtime, file_stat.st_size)
+        with self._lock:
+            self._entries[file_path] = entry
+            self._remove_content(file_path)
+            if self.max_content_size > 0:
+                self._add_content(file_path, FeedCache.Content(entry, data_bytes, gzip_content))
+
+    def get(self, file_path) -> "FeedCache.Entry":
+        """Return entry of given file. Returns 'None' if file does not exist."""
+        file_path = os.path.abspath(file_path)
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(file_path)
+        if entry and entry.mtime == file_stat.st_mtime and entry.size == file_stat.st_size:
+            return entry
+
+        # file changed outside of the cache - calculate digest again
+        _LOGGER.debug("calculating digest of file: %s", file_path)
+        try:
+            with open(file_path, "rb") as file:
+                content_bytes = file.read()
+        except OSError:
+            return None
+        etag = f'"{calculate_bytes_hash(content_bytes)}"'
+        entry = FeedCache.Entry(etag, file_stat.st_mtime, file_stat.st_size)
+        with self._lock:
+            self._entries[file_path] = entry
+            self._remove_content(file_path)
+        return entry
+
+    def get_content(self, file_path) -> "FeedCache.Content":
+        """Return content of given file kept in memory. Returns 'None' if content is not available.
+
+        File is not accessed, so the content is valid as long as file is modified through the cache.
+        """
+        file_path = os.path.abspath(file_path)
+        with self._lock:
+            content = self._contents.get(file_path)
+            if content is not None:
+                self._contents.move_to_end(file_path)
+            return content
+
+    def _add_content(self, file_path, content: "FeedCache.Content"):
+        content_size = content.size()
+        if content_size > self.max_content_size:
+            _LOGGER.debug("content of file too big to keep in memory: %s", file_path)
+            return
+        self._contents[file_path] = content
+        self._contents_size += content_size
+        while self._contents_size > self.max_content_size:
+            _evicted_path, evicted = self._contents.popitem(last=False)
+            self._contents_size -= evicted.size()
+
+    def _remove_content(self, file_path):
+        content = self._contents.pop(file_path, None)
+        if content is not None:
+            self._contents_size -= content.size()
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check if value of 'If-None-Match' header matches given ETag."""
+    if if_none_match is None or etag is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for item in if_none_match.split(","):
+        item_etag = item.strip().removeprefix("W/")  # weak comparison is used for GET requests
+        if item_etag == etag:
+            return True
+    return False
@@ -0,0 +1,250 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import datetime
+import functools
+from email.utils import format_datetime
+
+from rssforward.utils import calculate_str_hash
+from rssforward.rss.fragmentcache import FragmentCache
+
+
+XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8'?>\n"
+RSS_OPEN_TAG = (
+    '<rss xmlns:atom="http://www.w3.org/2005/Atom"'
+    ' xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">'
+)
+RSS_DOCS = "http://www.rssboard.org/rss-specification"
+RSS_GENERATOR = "rssforward"
+
+## characters not allowed in XML 1.0 documents (except surrogates, detected by encoding)
+INVALID_XML_CHARS = [chr(code) for code in range(0x20) if chr(code) not in "\t\n\r"] + ["\ufffe", "\uffff"]
+
+
+class FeedEntry:
+    """Item of RSS feed. Setters follow API of 'feedgen.entry.FeedEntry'."""
+
+    def __init__(self):
+        self._id = None
+        self._title = None
+        self._link = None
+        self._content = None
+        self._authors: list[str] = []
+        self._pub_date: datetime.datetime = None
+
+    def id(self, value):
+        self._id = value
+
+    def title(self, value):
+        self._title = value
+
+    def author(self, author: dict[str, str]):
+        """Add author. RSS requires email of author, so authors without email are ignored."""
+        email = author.get("email")
+        if not email:
+            return
+        name = author.get("name")
+        if name:
+            self._authors.append(f"{email} ({name})")
+        else:
+            self._authors.append(email)
+
+    def content(self, value):
+        self._content = value
+
+    def link(self, href, rel="alternate"):
+        if rel == "alternate":
+            self._link = href
+
+    ## name mirrors 'feedgen' API
+    def pubDate(self, value):  # noqa: N802 # pylint: disable=C0103
+        self._pub_date = to_datetime(value)
+
+    def get_pub_date(self) -> datetime.datetime:
+        return self._pub_date
+
+    # returns hash of content of entry, used as key of rendered fragment
+    def calculate_hash(self, indent=None) -> str:
+        pub_date = None
+        if self._pub_date:
+            pub_date = format_datetime(self._pub_date)
+        data_list = [self._id, self._title, self._link, self._content, pub_date, indent, *self._authors]
+        return calculate_str_hash("\0".join(str(item) for item in data_list))
+
+    def render(self, indent=None) -> str:
+        if not (self._title or self._content):
+            message = "Required fields not set"
+            raise ValueError(message)
+        parts: list[str] = []
+        writer = ElementWriter(parts, indent, 2)
+        writer.open_tag("item")
+        writer.element("title", self._title)
+        writer.element("link", self._link)
+        writer.element("description", self._content)
+        for author in self._authors:
+            writer.element("author", author)
+        if self._id:
+            writer.element("guid", self._id, ' isPermaLink="false"')
+        if self._pub_date:
+            writer.element("pubDate", format_datetime(self._pub_date))
+        writer.close_tag("item")
+        return "".join(parts)
+
+
+class FeedWriter:
+    """Lightweight RSS 2.0 feed writer.
+
+    Setters follow subset of API of 'feedgen.feed.FeedGenerator' used by generators, so the writer
+    can replace the generator. Entries are kept as given and serialized directly to list of strings
+    joined once, without building XML tree. As in 'feedgen' recently added entry is written first.
+
+    If build date is not set, then publish date of newest entry is used, so output does not change
+    between generations when entries do not change.
+
+    If 'fragment_cache' is given, then rendered entries are taken from the cache if content of entry
+    did not change.
+    """
+
+    def __init__(self, fragment_cache: FragmentCache = None):
+        self.fragment_cache = fragment_cache
+        self._title = None
+        self._link = None
+        self._description = None
+        self._language = None
+        self._last_build_date: datetime.datetime = None
+        self._entries: list[FeedEntry] = []
+
+    def title(self, value):
+        self._title = value
+
+    def link(self, href):
+        self._link = href
+
+    def description(self, value):
+        self._description = value
+
+    def language(self, value):
+        self._language = value
+
+    ## name mirrors 'feedgen' API
+    def lastBuildDate(self, value):  # noqa: N802 # pylint: disable=C0103
+        self._last_build_date = to_datetime(value)
+
+    def add_entry(self) -> FeedEntry:
+        feed_entry = FeedEntry()
+        self._entries.append(feed_entry)
+        return feed_entry
+
+    def entries_num(self):
+        return len(self._entries)
+
+    def dumps(self, *, pretty=False) -> str:
+        required_fields = {"title": self._title, "link": self._link, "description": self._description}
+        missing = [name for name, value in required_fields.items() if not value]
+        if missing:
+            missing_str = ", ".join(missing)
+            message = f"Required fields not set ({missing_str})"
+            raise ValueError(message)
+
+        indent = "  " if pretty else None
+        parts = [XML_DECLARATION, RSS_OPEN_TAG]
+        writer = ElementWriter(parts, indent, 1)
+        writer.open_tag("channel")
+        writer.element("title", self._title)
+        writer.element("link", self._link)
+        writer.element("description", self._description)
+        writer.element("docs", RSS_DOCS)
+        writer.element("generator", RSS_GENERATOR)
+        writer.element("language", self._language)
+        build_date = self._get_build_date()
+        if build_date:
+            writer.element("lastBuildDate", format_datetime(build_date))
+        ## each entry is joined separately, so small strings of elements are released early
+        for feed_entry in reversed(self._entries):
+            if self.fragment_cache is None:
+                parts.append(feed_entry.render(indent))
+                continue
+            entry_hash = feed_entry.calculate_hash(indent)
+            parts.append(self.fragment_cache.get_or_render(entry_hash, functools.partial(feed_entry.render, indent)))
+        writer.close_tag("channel")
+        parts.append("\n</rss>\n" if pretty else "</rss>")
+        return "".join(parts)
+
+    def _get_build_date(self) -> datetime.datetime:
+        if self._last_build_date:
+            return self._last_build_date
+        dates_list = [feed_entry.get_pub_date() for feed_entry in self._entries if feed_entry.get_pub_date()]
+        if not dates_list:
+            return None
+        return max(dates_list)
+
+
+class ElementWriter:
+    """Append elements to list of strings with optional indentation.
+
+    'depth' is nesting level of written elements (used only if 'indent' is set).
+    """
+
+    def __init__(self, parts: list[str], indent: str, depth: int):
+        self.parts = parts
+        self.indent = indent
+        self.depth = depth
+
+    def open_tag(self, name):
+        self.parts.append(f"{self._prefix()}<{name}>")
+        self.depth += 1
+
+    def close_tag(self, name):
+        self.depth -= 1
+        self.parts.append(f"{self._prefix()}</{name}>")
+
+    # skips element if value is empty
+    def element(self, name, value, attributes=""):
+        if not value:
+            return
+        self.parts.append(f"{self._prefix()}<{name}{attributes}>{escape_text(value)}</{name}>")
+
+    def _prefix(self):
+        if not self.indent:
+            return ""
+        return "\n" + self.indent * self.depth
+
+
+def escape_text(value) -> str:
+    value = str(value)
+    if not value.isprintable() and has_invalid_chars(value):
+        message = "All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters"
+        raise ValueError(message)
+    ## chained 'replace' is much faster than 'translate' or 're.sub' on long content
+    value = value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    if "\r" in value:
+        value = value.replace("\r", "&#13;")
+    return value
+
+
+# substring search is several times faster than regex character class on long content
+def has_invalid_chars(value: str) -> bool:
+    for char in INVALID_XML_CHARS:
+        if char in value:
+            return True
+    try:
+        value.encode("utf-8")
+    except UnicodeEncodeError:
+        ## surrogates
+        return True
+    return False
+
+
+def to_datetime(value) -> datetime.datetime:
+    if not isinstance(value, datetime.datetime):
+        message = "Invalid datetime format"
+        raise TypeError(message)
+    if value.tzinfo is None:
+        message = "Datetime object has no timezone info"
+        raise ValueError(message)
+    return value
@@ -0,0 +1,146 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from rssforward.utils import get_app_datadir, store_object_atomic, load_object_safe
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_fragmentcache_path():
+    data_dir = get_app_datadir()
+    return os.path.join(data_dir, "fragmentcache.obj")
+
+
+class FragmentCache:
+    """Persistent cache of rendered feed items (XML fragments).
+
+    Fragments are identified by hash of item's content, so unchanged items are not serialized again
+    on each generation. Cache is bounded by total size of fragments (in characters), least recently
+    used fragments are evicted first.
+    """
+
+    def __init__(self, max_size, cache_path=None):
+        if cache_path is None:
+            cache_path = get_fragmentcache_path()
+        self.max_size = max_size
+        self._cache_path = cache_path
+        self._lock = threading.Lock()
+        self._fragments: OrderedDict[str, str] = None
+        self._size = 0
+        self._modified = False
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key) -> str:
+        with self._lock:
+            self._load()
+            fragment = self._fragments.get(key)
+            if fragment is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._fragments.move_to_end(key)
+            return fragment
+
+    def set(self, key, fragment: str):
+        with self._lock:
+            self._load()
+            self._remove(key)
+            if len(fragment) > self.max_size:
+                return
+            self._fragments[key] = fragment
+            self._size += len(fragment)
+            self._modified = True
+            while self._size > self.max_size:
+                oldest_key = next(iter(self._fragments))
+                self._remove(oldest_key)
+
+    def fragments_num(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._fragments)
+
+    def get_or_render(self, key, render_function: Callable[[], str]) -> str:
+        fragment = self.get(key)
+        if fragment is not None:
+            return fragment
+        fragment = render_function()
+        self.set(key, fragment)
+        return fragment
+
+    def store(self):
+        with self._lock:
+            self._load()
+            _LOGGER.info(
+                "fragment cache: hits: %s misses: %s fragments: %s size: %s",
+                self._hits,
+                self._misses,
+                len(self._fragments),
+                self._size,
+            )
+            if self._modified:
+                store_object_atomic(self._fragments, self._cache_path)
+            self._modified = False
+            self._hits = 0
+            self._misses = 0
+
+    def _remove(self, key):
+        fragment = self._fragments.pop(key, None)
+        if fragment is not None:
+            self._size -= len(fragment)
+            self._modified = True
+
+    def _load(self):
+        if self._fragments is not None:
+            return
+        ## corrupted cache file is treated as empty cache
+        fragments = load_object_safe(self._cache_path, None)
+        self._fragments = OrderedDict()
+        self._size = 0
+        if not fragments:
+            return
+        for key, fragment in fragments.items():
+            self._fragments[key] = fragment
+            self._size += len(fragment)
+        while self._size > self.max_size:
+            oldest_key = next(iter(self._fragments))
+            self._remove(oldest_key)
+
+
+_FRAGMENT_CACHE: FragmentCache = None
+_FRAGMENT_CACHE_LOCK = threading.Lock()
+
+
+# returns cache shared by all generators or 'None' if cache is disabled
+def get_fragment_cache() -> FragmentCache:
+    with _FRAGMENT_CACHE_LOCK:
+        return _FRAGMENT_CACHE
+
+
+# 'max_size' - maximum total size of cached fragments, 0 disables the cache
+def configure_fragment_cache(max_size):
+    # ruff: noqa: PLW0603
+    global _FRAGMENT_CACHE  # pylint: disable=W0603
+    fragment_cache = None
+    if max_size > 0:
+        fragment_cache = FragmentCache(max_size)
+    with _FRAGMENT_CACHE_LOCK:
+        _FRAGMENT_CACHE = fragment_cache
+
+
+def store_fragment_cache():
+    fragment_cache = get_fragment_cache()
+    if fragment_cache is not None:
+        fragment_cache.store()
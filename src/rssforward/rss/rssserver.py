@@ -19,22 +19,178 @@
 import os
 import logging
 import threading
+import time
 from enum import Enum, unique
 from typing import Callable
 
 import socket
 import socketserver
 import urllib.parse
+import io
 import posixpath
+import datetime
+import email.utils
 
+from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler
 
+from rssforward.rss.feedcache import FeedCache, etag_matches
+from rssforward.metrics import (
+    MetricsRegistry,
+    METRICS_PATH,
+    METRICS_CONTENT_TYPE,
+    SERVED_REQUESTS,
+    SERVED_DURATION,
+)
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
 ## implementation allows to pass custom base path
+## if server has feed cache, then ETag headers are sent and conditional requests are handled
+## ('If-None-Match' and 'If-Modified-Since')
+## if client accepts gzip encoding and compressed copy of file ('*.gz') is up to date, then the copy is served
+## if server has metrics registry, then metrics are served under reserved path
 class RootedHTTPRequestHandler(SimpleHTTPRequestHandler):
+    def __init__(self, request, client_address, server):
+        self._etag = None
+        self._vary_encoding = False
+        self._status = None
+        super().__init__(request, client_address, server)
+
+    def handle_one_request(self):
+        self._status = None
+        start_time = time.perf_counter()
+        super().handle_one_request()
+        if self._status is None:
+            ## no request (e.g. closed keep-alive connection)
+            return
+        status = str(int(self._status))
+        SERVED_REQUESTS.inc(status)
+        SERVED_DURATION.observe(time.perf_counter() - start_time, status)
+
+    def log_request(self, code="-", size="-"):
+        self._status = code
+        super().log_request(code, size)
+
+    def send_head(self):
+        self._etag = None
+        self._vary_encoding = False
+        metrics: MetricsRegistry = getattr(self.server, "metrics", None)
+        if metrics is not None and urllib.parse.urlsplit(self.path).path == METRICS_PATH:
+            return self._send_head_metrics(metrics)
+        path = self.translate_path(self.path)
+        feed_cache: FeedCache = getattr(self.server, "feed_cache", None)
+        if feed_cache is not None:
+            content = feed_cache.get_content(path)
+            if content is not None:
+                return self._send_head_memory(path, content)
+
+        if not os.path.isfile(path):
+            return super().send_head()
+
+        gzip_path = path + ".gz"
+        gzip_fresh = is_file_fresh(gzip_path, path)
+        self._vary_encoding = gzip_fresh
+        if gzip_fresh and accepts_gzip(self.headers.get("Accept-Encoding")):
+            return self._send_head_gzip(path, gzip_path)
+
+        if feed_cache is None:
+            return super().send_head()
+        entry = feed_cache.get(path)
+        if entry is None:
+            return super().send_head()
+
+        self._etag = entry.etag
+        if etag_matches(self.headers.get("If-None-Match"), entry.etag):
+            self._send_not_modified(entry.mtime)
+            return None
+        return super().send_head()
+
+    ## serve content kept in memory - no disk access
+    def _send_head_memory(self, path, content: FeedCache.Content):
+        entry = content.entry
+        data = content.data
+        self._etag = entry.etag
+        self._vary_encoding = content.gzip_data is not None
+        send_gzip = self._vary_encoding and accepts_gzip(self.headers.get("Accept-Encoding"))
+        if send_gzip:
+            data = content.gzip_data
+            self._etag = entry.etag[:-1] + '-gzip"'
+        if self._is_not_modified(entry.mtime):
+            self._send_not_modified(entry.mtime)
+            return None
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", self.guess_type(path))
+        if send_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Last-Modified", self.date_time_string(entry.mtime))
+        self.end_headers()
+        return io.BytesIO(data)
+
+    def _send_head_metrics(self, metrics: MetricsRegistry):
+        data = metrics.render().encode("utf-8")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", METRICS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        return io.BytesIO(data)
+
+    def _send_head_gzip(self, path, gzip_path):
+        try:
+            file_stat = os.stat(path)
+            # pylint: disable=R1732
+            gzip_file = open(gzip_path, "rb")  # noqa: SIM115
+        except OSError:
+            return super().send_head()
+
+        feed_cache: FeedCache = getattr(self.server, "feed_cache", None)
+        if feed_cache is not None:
+            entry = feed_cache.get(path)
+            if entry is not None:
+                # compressed representation requires distinct tag
+                self._etag = entry.etag[:-1] + '-gzip"'
+        if self._is_not_modified(file_stat.st_mtime):
+            gzip_file.close()
+            self._send_not_modified(file_stat.st_mtime)
+            return None
+
+        try:
+            gzip_stat = os.fstat(gzip_file.fileno())
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-type", self.guess_type(path))
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(gzip_stat.st_size))
+            self.send_header("Last-Modified", self.date_time_string(file_stat.st_mtime))
+            self.end_headers()
+        except:  # noqa: E722
+            gzip_file.close()
+            raise
+        return gzip_file
+
+    ## validators checked in the same way as by base class: 'If-Modified-Since' is ignored if 'If-None-Match' is present
+    def _is_not_modified(self, mtime) -> bool:
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag_matches(if_none_match, self._etag)
+        return is_not_modified_since(self.headers.get("If-Modified-Since"), mtime)
+
+    def _send_not_modified(self, mtime):
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        self.end_headers()
+
+    def end_headers(self):
+        if self._etag:
+            self.send_header("ETag", self._etag)
+        if self._vary_encoding:
+            self.send_header("Vary", "Accept-Encoding")
+        super().end_headers()
+
     def translate_path(self, path):
         base_path = self.server.base_path  # type: ignore[attr-defined]
         if base_path is None:
@@ -54,13 +210,94 @@ class RootedHTTPRequestHandler(SimpleHTTPRequestHandler):
         return path
 
 
+# check if 'file_path' exists and is not older than 'source_path'
+def is_file_fresh(file_path, source_path) -> bool:
+    try:
+        return os.stat(file_path).st_mtime >= os.stat(source_path).st_mtime
+    except OSError:
+        return False
+
+
+def is_not_modified_since(if_modified_since: str, mtime: float) -> bool:
+    """Check if file modified at 'mtime' was not modified since date given in 'If-Modified-Since' header."""
+    if not if_modified_since:
+        return False
+    try:
+        since_date = email.utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return False
+    if since_date.tzinfo is None:
+        since_date = since_date.replace(tzinfo=datetime.timezone.utc)
+    ## header has resolution of seconds
+    last_modified = datetime.datetime.fromtimestamp(mtime, datetime.timezone.utc).replace(microsecond=0)
+    return last_modified <= since_date
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Check if value of 'Accept-Encoding' header allows gzip encoding."""
+    if not accept_encoding:
+        return False
+    for item in accept_encoding.split(","):
+        coding, _sep, params = item.partition(";")
+        if coding.strip().lower() not in ("gzip", "x-gzip"):
+            continue
+        params = params.replace(" ", "")
+        return params not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
 ## ======================================================
 
 
-class RSSServer(socketserver.TCPServer):
-    def __init__(self, server_address, request_handler_class, *, bind_and_activate=True):
+class RSSServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Server handling each request in separate thread.
+
+    Number of concurrently handled requests is limited by 'max_connections'. Requests above the limit
+    are rejected with '503 Service Unavailable' response.
+    """
+
+    daemon_threads = True  # do not wait for slow clients on shutdown
+    block_on_close = False
+
+    def __init__(self, server_address, request_handler_class, *, bind_and_activate=True, max_connections=None):
         super().__init__(server_address, request_handler_class, bind_and_activate)
         self.base_path = None
+        self.feed_cache: FeedCache = None
+        self.metrics: MetricsRegistry = None
+        self._connections_semaphore = None
+        if max_connections:
+            self._connections_semaphore = threading.BoundedSemaphore(max_connections)
+
+    def process_request(self, request, client_address):
+        if self._connections_semaphore is None:
+            super().process_request(request, client_address)
+            return
+        ## semaphore is released by thread handling the request
+        if not self._connections_semaphore.acquire(blocking=False):  # pylint: disable=R1732
+            _LOGGER.warning("connections limit reached - rejecting request from %s", client_address)
+            reject_request(request)
+            self.shutdown_request(request)
+            SERVED_REQUESTS.inc(str(int(HTTPStatus.SERVICE_UNAVAILABLE)))
+            return
+        try:
+            super().process_request(request, client_address)
+        except:  # noqa: E722
+            self._connections_semaphore.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            if self._connections_semaphore is not None:
+                self._connections_semaphore.release()
+
+
+def reject_request(request):
+    try:
+        request.sendall(b"HTTP/1.0 503 Service Unavailable\r\nRetry-After: 5\r\nContent-Length: 0\r\n\r\n")
+    except OSError:
+        _LOGGER.warning("unable to send reject response")
 
 
 ## ======================================================
@@ -75,13 +312,17 @@ class RSSServerManager:
         STOPPED = "Stopped"
 
     DEFAULT_PORT = 8080
+    DEFAULT_MAX_CONNECTIONS = 32
     Handler = RootedHTTPRequestHandler
     # Handler = SimpleHTTPRequestHandler
 
     def __init__(self):
         socketserver.TCPServer.allow_reuse_address = True
         self.port = RSSServerManager.DEFAULT_PORT
+        self.max_connections = RSSServerManager.DEFAULT_MAX_CONNECTIONS
         self.rootDir = None
+        self.feed_cache: FeedCache = None
+        self.metrics: MetricsRegistry = None  # metrics served under reserved path, 'None' disables
         self._service: RSSServer = None
         self._thread = None
         self.startedCallback: Callable = None
@@ -159,12 +400,18 @@ class RSSServerManager:
 
     def _run(self):
         try:
-            with RSSServer(("", self.port), RSSServerManager.Handler) as httpd:
+            with RSSServer(
+                ("", self.port),
+                RSSServerManager.Handler,
+                max_connections=self.max_connections,
+            ) as httpd:
                 #         with socketserver.TCPServer(("", self.port), RSSServerManager.Handler) as httpd:
                 if self.rootDir:
                     os.makedirs(self.rootDir, exist_ok=True)
                 self._service = httpd
                 self._service.base_path = self.rootDir
+                self._service.feed_cache = self.feed_cache
+                self._service.metrics = self.metrics
                 try:
                     _LOGGER.info("serving at port %s", self.port)
                     httpd.allow_reuse_address = True
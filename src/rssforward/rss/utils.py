@@ -9,20 +9,22 @@
 import logging
 from typing import Any
 
-from feedgen.feed import FeedGenerator
+from rssforward.rss.feedwriter import FeedWriter
+from rssforward.rss.fragmentcache import get_fragment_cache
+from rssforward.tracing import trace_span
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def init_feed_gen(main_link, lang="pl") -> FeedGenerator:
-    feed_gen = FeedGenerator()
+def init_feed_gen(main_link, lang="pl") -> FeedWriter:
+    feed_gen = FeedWriter(fragment_cache=get_fragment_cache())
     feed_gen.link(href=main_link)
     feed_gen.language(lang)
     return feed_gen
 
 
-def add_data_to_feed(feed_gen: FeedGenerator, data_dict: dict[str, Any]):
+def add_data_to_feed(feed_gen: FeedWriter, data_dict: dict[str, Any]):
     feed_item = feed_gen.add_entry()
 
     feed_item.id(data_dict["id"])
@@ -34,10 +36,7 @@ def add_data_to_feed(feed_gen: FeedGenerator, data_dict: dict[str, Any]):
     # feed_item.link( data_dict["link"], rel="via" )          # does not work in thunderbird
 
 
-def dumps_feed_gen(feed_gen: FeedGenerator):
-    # pylint: disable=W0212
-    # ruff: noqa: SLF001
-    items_num = len(feed_gen._FeedGenerator__feed_entries)
-    _LOGGER.info("generating %s feed items", items_num)
-    content_bytes = feed_gen.rss_str(pretty=True)
-    return content_bytes.decode()
+def dumps_feed_gen(feed_gen: FeedWriter, *, pretty=False) -> str:
+    _LOGGER.info("generating %s feed items", feed_gen.entries_num())
+    with trace_span("dump feed", "feed", items=feed_gen.entries_num()):
+        return feed_gen.dumps(pretty=pretty)
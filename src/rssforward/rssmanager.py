@@ -9,45 +9,65 @@
 import os
 import logging
 import threading
-
-import pkgutil
-
-from rssforward.utils import save_recent_date, get_recent_date, write_data
+import time
+import heapq
+
+from concurrent.futures import ThreadPoolExecutor
+
+from rssforward.utils import (
+    save_recent_date,
+    get_recent_date,
+    read_feed_digests,
+    save_feed_digests,
+    write_data_atomic,
+    write_gzip_data,
+    compress_str,
+    calculate_str_hash,
+)
 from rssforward.rssgenerator import RSSGenerator
+from rssforward.rss.feedcache import FeedCache
+from rssforward.rss.fragmentcache import store_fragment_cache
+from rssforward.tracing import get_tracer, trace_span
+from rssforward.metrics import (
+    GENERATOR_DURATION,
+    GENERATOR_RUNS,
+    GENERATOR_OUTPUT_BYTES,
+    FEEDS_WRITTEN,
+    FEEDS_SKIPPED,
+)
 from rssforward.configfile import ConfigField, ConfigKey, AuthType
 from rssforward.access.keepassxcauth import get_auth_data as get_keepassxc_auth_data, close as keepassxc_close
-
-import rssforward.source
+from rssforward.source import registry
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
 # returns list of instances of base generator class
+# imports modules of all generators - use 'registry.get_generators_ids()' to enumerate generators without importing
 def get_generators() -> dict[str, RSSGenerator]:
     ret_data = {}
 
-    generators_module = rssforward.source
-    generators_path = os.path.dirname(generators_module.__file__)
-
-    modules_list = pkgutil.iter_modules([generators_path])
-    for mod_info in modules_list:
-        mod_name = mod_info.name
-        generator: RSSGenerator = get_generator(mod_name)
+    for gen_id in registry.get_generators_ids():
+        generator: RSSGenerator = get_generator(gen_id)
         if generator:
-            ret_data[mod_name] = generator
+            ret_data[gen_id] = generator
 
     return ret_data
 
 
+## only module of requested generator is imported
 def get_generator(generator_id, generator_params_dict=None) -> RSSGenerator:
-    generators_module = rssforward.source
-    mod_full_name = f"{generators_module.__name__}.{generator_id}"
-    mod = __import__(mod_full_name, fromlist=[""])
+    mod = registry.load_generator_module(generator_id)
+    if mod is None:
+        return None
+    unknown_params = registry.find_unknown_params(generator_id, generator_params_dict)
+    if unknown_params:
+        _LOGGER.warning("unknown parameters of generator %s: %s", generator_id, unknown_params)
     try:
         return mod.get_generator(generator_params_dict)
     except AttributeError as exc:
-        _LOGGER.warning("unable to load generator from module %s, reason: %s", mod_full_name, exc)
+        _LOGGER.warning("unable to load generator from module %s, reason: %s", mod.__name__, exc)
         return None
 
 
@@ -78,6 +98,10 @@ class RSSManager:
         def __init__(self, generator: RSSGenerator = None):
             self.generator: RSSGenerator = generator
             self.valid = True  # answers question: is problem with generator?
+            self.duration: float = None  # wall time in seconds of recent generation
+            self.refresh_time: int = None  # time in seconds between generations, 'None' means default
+            self.written: int = 0  # number of feed files written in recent generation
+            self.skipped: int = 0  # number of unchanged feed files in recent generation
             # self.auth_data = auth_data
 
         # def authenticate(self):
@@ -93,6 +117,13 @@ class RSSManager:
         self._generators: list[tuple[str, RSSManager.State]] = None
         if generators:
             self._generators = generators
+        self._feed_cache: FeedCache = None
+        self._digests: dict[str, str] = None  # feed path -> digest of recently written content
+        self._digests_lock = threading.Lock()
+
+    # set cache to update after writing feed files
+    def set_feed_cache(self, feed_cache: FeedCache):
+        self._feed_cache = feed_cache
 
     def is_gen_valid(self) -> bool:
         """Check if all generators are valid.
@@ -109,36 +140,117 @@ class RSSManager:
         # everything ok
         return True
 
-    # returns 'True' if everything is OK, otherwise 'False'
-    def generate_data(self):
+    def get_refresh_times(self, default_refresh_time) -> list[int]:
+        """Return refresh time of each generator (in order of generators)."""
+        if self._generators is None:
+            self._initialize_generators()
+        ret_list = []
+        for _gen_id, gen_state in self._generators:
+            refresh_time = gen_state.refresh_time
+            if refresh_time is None:
+                refresh_time = default_refresh_time
+            ret_list.append(refresh_time)
+        return ret_list
+
+    def find_generators(self, generator_id=None) -> list[int]:
+        """Return indexes of generators with given id. 'None' matches all generators."""
+        if self._generators is None:
+            self._initialize_generators()
+        return [
+            index
+            for index, (gen_id, _gen_state) in enumerate(self._generators)
+            if generator_id is None or gen_id == generator_id
+        ]
+
+    # 'gen_indexes' - indexes of generators to execute, 'None' means all generators
+    def generate_data(self, gen_indexes: list[int] = None):
+        tracer = get_tracer()
+        tracer.begin_cycle()
+        try:
+            with tracer.span("generation cycle", "cycle"):
+                self._generate_data(gen_indexes)
+        finally:
+            tracer.end_cycle()
+
+    def _generate_data(self, gen_indexes: list[int] = None):
         if self._generators is None:
             self._initialize_generators()
         if not self._generators:
             _LOGGER.warning("generators not initialized")
             return
 
+        if self._digests is None:
+            self._digests = read_feed_digests()
+
+        gen_list = self._generators
+        if gen_indexes is not None:
+            gen_list = [self._generators[index] for index in gen_indexes]
+        if not gen_list:
+            _LOGGER.warning("no generators to execute")
+            return
+
         _LOGGER.info("========== generating RSS data ==========")
         recent_datetime = get_recent_date()
+        start_time = time.perf_counter()
+
+        general_section = self._params.get(ConfigKey.GENERAL.value, {})
+        workers_num = general_section.get(ConfigField.GENWORKERS.value, 1)
+        workers_num = max(1, min(workers_num, len(gen_list)))
+        if workers_num > 1:
+            _LOGGER.info("running %s generators using %s workers", len(gen_list), workers_num)
+            with ThreadPoolExecutor(max_workers=workers_num, thread_name_prefix="generator") as executor:
+                # consume results to wait for all generators
+                list(executor.map(self._run_generator, gen_list))
+        else:
+            for gen_pair in gen_list:
+                self._run_generator(gen_pair)
 
-        for gen_id, gen_state in self._generators:
-            gen = gen_state.generator
-
+        save_recent_date(recent_datetime)
+        with self._digests_lock:
+            save_feed_digests(self._digests)
+        store_fragment_cache()
+        written_num = 0
+        skipped_num = 0
+        for gen_id, gen_state in gen_list:
+            _LOGGER.info(
+                "generator %s duration: %.2f s valid: %s feeds written: %s skipped: %s",
+                gen_id,
+                gen_state.duration,
+                gen_state.valid,
+                gen_state.written,
+                gen_state.skipped,
+            )
+            written_num += gen_state.written
+            skipped_num += gen_state.skipped
+        _LOGGER.info("feeds written: %s skipped (unchanged): %s", written_num, skipped_num)
+        _LOGGER.info("========== generation ended in %.2f s ==========", time.perf_counter() - start_time)
+
+    def _run_generator(self, gen_pair: tuple[str, "RSSManager.State"]):
+        gen_id, gen_state = gen_pair
+        gen = gen_state.generator
+        gen_state.written = 0
+        gen_state.skipped = 0
+        start_time = time.perf_counter()
+        try:
             try:
-                gen_data: dict[str, str] = gen.generate()
+                with trace_span(gen_id, "generator"):
+                    gen_data: dict[str, str] = gen.generate()
             except Exception:  # pylint: disable=W0703
-                _LOGGER.exception("exception raised during generator execution")
+                _LOGGER.exception("exception raised during execution of generator %s", gen_id)
                 gen_state.valid = False
-                continue
+                return
 
             if gen_data is None:
                 _LOGGER.info("generation not completed for generator %s", gen_id)
                 gen_state.valid = False
             else:
                 gen_state.valid = True
-                self._write_data(gen_id, gen_data)
-
-        save_recent_date(recent_datetime)
-        _LOGGER.info("========== generation ended ==========")
+                with trace_span("write feeds", "feed", generator=gen_id):
+                    self._write_data(gen_id, gen_state, gen_data)
+        finally:
+            gen_state.duration = time.perf_counter() - start_time
+            GENERATOR_DURATION.observe(gen_state.duration, gen_id)
+            GENERATOR_RUNS.inc(gen_id, str(gen_state.valid).lower())
 
     def close(self):
         if self._generators:
@@ -174,10 +286,12 @@ class RSSManager:
                 auth_params = gen_params.get(ConfigKey.AUTH.value, {})
                 auth_data = get_auth_data(auth_params)
                 gen_state = RSSManager.State(generator)
+                gen_state.refresh_time = gen_params.get(ConfigField.REFRESHTIME.value)
 
                 # gen_state.authenticate()
                 login, password = auth_data
-                generator.authenticate(login, password)
+                with trace_span("authenticate", "auth", generator=gen_id):
+                    generator.authenticate(login, password)
 
                 self._generators.append((gen_id, gen_state))
 
@@ -186,11 +300,26 @@ class RSSManager:
                 _LOGGER.exception("error during authentication of %s", gen_id)
 
         _LOGGER.info("generators initialized: %s", len(self._generators))
+        self._configure_driver_pool()
+
+    def _configure_driver_pool(self):
+        gen_ids = [gen_id for gen_id, _ in self._generators]
+        if not any("selenium" in registry.get_generator_info(gen_id).dependencies for gen_id in gen_ids):
+            return
+        ## imported only if any generator uses web browser (selenium is optional dependency)
+        from rssforward.source.utils.selenium import configure_driver_pool  # noqa: PLC0415
+
+        general_section = self._params.get(ConfigKey.GENERAL.value, {})
+        workers_num = general_section.get(ConfigField.GENWORKERS.value, 1)
+        ## by default each of concurrently executed generators can use own browser
+        configure_driver_pool(general_section.get(ConfigField.MAXBROWSERS.value, workers_num))
 
-    def _write_data(self, generator_id, generator_data: dict[str, str]):
+    def _write_data(self, generator_id, gen_state: "RSSManager.State", generator_data: dict[str, str]):
         if not generator_data:
             return
-        data_root_dir = self._params.get(ConfigKey.GENERAL.value, {}).get(ConfigField.DATAROOT.value)
+        general_section = self._params.get(ConfigKey.GENERAL.value, {})
+        data_root_dir = general_section.get(ConfigField.DATAROOT.value)
+        compress_feeds = general_section.get(ConfigField.COMPRESSFEEDS.value, False)
         for rss_out, content in generator_data.items():
             out_dir = os.path.join(data_root_dir, generator_id)
             feed_path = os.path.join(out_dir, rss_out)
@@ -198,15 +327,50 @@ class RSSManager:
             os.makedirs(feed_dir, exist_ok=True)
             if content is None:
                 _LOGGER.warning("unable to write %s content to file: %s", generator_id, feed_path)
+                continue
+
+            GENERATOR_OUTPUT_BYTES.inc(generator_id, value=len(content.encode("utf-8")))
+            digest_key = os.path.abspath(feed_path)
+            digest = calculate_str_hash(content)
+            with self._digests_lock:
+                prev_digest = self._digests.get(digest_key)
+            gzip_content = None
+            if prev_digest == digest and self._is_feed_stored(feed_path, compress_feeds):
+                _LOGGER.debug("%s content unchanged, skipping file: %s", generator_id, feed_path)
+                gen_state.skipped += 1
+                FEEDS_SKIPPED.inc(generator_id)
+                if self._feed_cache is None or self._feed_cache.get_content(feed_path) is not None:
+                    continue
+                if compress_feeds and self._feed_cache.max_content_size > 0:
+                    gzip_content = compress_str(content)
             else:
                 _LOGGER.info("writing %s content to file: %s", generator_id, feed_path)
-                write_data(feed_path, content)
+                write_data_atomic(feed_path, content)
+                if compress_feeds:
+                    # compressed file has to be written after feed file (newer modification time)
+                    gzip_content = write_gzip_data(feed_path + ".gz", content)
+                with self._digests_lock:
+                    self._digests[digest_key] = digest
+                gen_state.written += 1
+                FEEDS_WRITTEN.inc(generator_id)
+
+            if self._feed_cache is not None:
+                self._feed_cache.update(feed_path, content, gzip_content)
+
+    @staticmethod
+    def _is_feed_stored(feed_path, compress_feeds) -> bool:
+        if not os.path.isfile(feed_path):
+            return False
+        if compress_feeds:
+            return os.path.isfile(feed_path + ".gz")
+        return True
 
 
 class ThreadedRSSManager:
     def __init__(self, manager):
         self._manager = manager
         self._execute_loop = False  # flag to stop thread loop
+        self._forced_list: list[str] = []  # ids of generators requested to refresh, 'None' means all generators
         self._state_callback = None
         self._lock = threading.RLock()
         self._wait_object = threading.Condition()
@@ -216,6 +380,7 @@ class ThreadedRSSManager:
     def set_state_callback(self, callback):
         self._state_callback = callback
 
+    # 'refresh_time' - default time between generations (used for generators without own refresh time)
     def start(self, refresh_time, startupdelay):
         """Start thread."""
         with self._lock:
@@ -247,21 +412,23 @@ class ThreadedRSSManager:
             self._execute_loop = True
         self._run_loop(refresh_time, startupdelay)
 
-    def execute_single(self):
-        """Trigger single generation."""
+    def execute_single(self, generator_id=None):
+        """Trigger single generation of given generator. 'None' means all generators."""
         with self._lock:
             if not self._thread:
                 _LOGGER.info("executing RSS manager")
-                self._call_gen()
+                gen_indexes = self._manager.find_generators(generator_id)
+                self._call_gen(gen_indexes)
                 return
+            self._forced_list.append(generator_id)
 
-            try:
-                with self._wait_object:  # lock the object
-                    _LOGGER.info("waking up RSS thread")
-                    self._wait_object.notifyAll()  # pylint: disable=W4902
-            except RuntimeError:
-                # no threads wait for notification
-                _LOGGER.info("thread does not wait")
+        try:
+            with self._wait_object:  # lock the object
+                _LOGGER.info("waking up RSS thread")
+                self._wait_object.notifyAll()  # pylint: disable=W4902
+        except RuntimeError:
+            # no threads wait for notification
+            _LOGGER.info("thread does not wait")
 
     def _run_loop(self, refresh_time, startupdelay):
         try:
@@ -270,19 +437,37 @@ class ThreadedRSSManager:
                 with self._wait_object:  # lock the object
                     self._wait_object.wait(startupdelay)
 
+            refresh_list = self._manager.get_refresh_times(refresh_time)
+            start_time = time.monotonic()
+            # heap of pairs: (next due time, generator index)
+            schedule: list[tuple[float, int]] = [(start_time, index) for index in range(len(refresh_list))]
+            heapq.heapify(schedule)
+
             while True:
                 with self._lock:
                     if not self._execute_loop:
                         break
+                    forced_list = self._forced_list
+                    self._forced_list = []
 
-                self._call_gen()
+                gen_indexes = self._get_scheduled(schedule, forced_list)
+                if gen_indexes:
+                    self._call_gen(gen_indexes)
+                    self._reschedule(schedule, gen_indexes, refresh_list)
 
                 with self._wait_object:  # lock the object
                     with self._lock:
                         if not self._execute_loop:
                             break
-                    _LOGGER.info("waiting %s seconds before next fetch", refresh_time)
-                    self._wait_object.wait(refresh_time)
+                        if self._forced_list:
+                            # refresh requested during generation
+                            continue
+                    wait_time = refresh_time
+                    if schedule:
+                        wait_time = schedule[0][0] - time.monotonic()
+                    if wait_time > 0:
+                        _LOGGER.info("waiting %.0f seconds before next fetch", wait_time)
+                        self._wait_object.wait(wait_time)
 
             _LOGGER.info("thread loop ended")
 
@@ -300,12 +485,32 @@ class ThreadedRSSManager:
             with self._lock:
                 self._execute_loop = False
 
-    def _call_gen(self):
+    def _get_scheduled(self, schedule, forced_list) -> list[int]:
+        """Return indexes of generators that are due or were requested to refresh."""
+        gen_indexes = set()
+        for generator_id in forced_list:
+            gen_indexes.update(self._manager.find_generators(generator_id))
+        curr_time = time.monotonic()
+        for due_time, index in schedule:
+            if due_time <= curr_time:
+                gen_indexes.add(index)
+        return sorted(gen_indexes)
+
+    @staticmethod
+    def _reschedule(schedule, gen_indexes, refresh_list) -> None:
+        curr_time = time.monotonic()
+        executed = set(gen_indexes)
+        schedule[:] = [item for item in schedule if item[1] not in executed]
+        schedule.extend((curr_time + refresh_list[index], index) for index in executed)
+        heapq.heapify(schedule)
+
+    # 'gen_indexes' - indexes of generators to execute, 'None' means all generators
+    def _call_gen(self, gen_indexes: list[int] = None):
         if self._state_callback:
             self._state_callback(new_state=0)
 
         try:
-            self._manager.generate_data()
+            self._manager.generate_data(gen_indexes)
 
         except RuntimeError as exc:
             _LOGGER.error("exception occurred when calling generator: %s", exc)
@@ -9,20 +9,18 @@
 # pylint: disable=E0401 (import-error)
 
 import logging
-import time
 from enum import Enum, unique
-import datetime
 
-import random
 import pprint
-import json
-import requests
-
-from bs4 import BeautifulSoup
 
 from rssforward.utils import convert_to_html, string_to_date, escape_html, normalize_string
 from rssforward.rssgenerator import RSSGenerator
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen
+from rssforward.source.utils.httpclient import http_get
+from rssforward.source.utils.itemcache import ItemCache
+from rssforward.source.utils.pipeline import ListingPipeline
+from rssforward.source.utils.htmlparser import make_soup
+from rssforward.source.utils.react import extract_script_json
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,6 +36,7 @@ class ParamsField(Enum):
     URL = "url"
     ITEMSPERFETCH = "itemsperfetch"
     OUTFILE = "outfile"
+    WORKERS = "workers"
 
 
 class BullDogJobGenerator(RSSGenerator):
@@ -47,6 +46,8 @@ class BullDogJobGenerator(RSSGenerator):
         if params_dict:
             self.params = params_dict.copy()
         self.filters_list = self.params.get(ParamsField.FILTER.value)
+        self.workers = self.params.get(ParamsField.WORKERS.value, 1)
+        self.item_cache = ItemCache("bulldogjob")
 
     def authenticate(self, _login, _password):
         return True
@@ -64,15 +65,20 @@ class BullDogJobGenerator(RSSGenerator):
             filter_items = filter_data.get(ParamsField.ITEMSPERFETCH.value, 20)
             _LOGGER.info("accessing: %s", filter_label)
             outfile = filter_data.get(ParamsField.OUTFILE.value)
-            content = get_offers_content(filter_label, filter_url, filter_items)
+            content = get_offers_content(
+                filter_label,
+                filter_url,
+                filter_items,
+                item_cache=self.item_cache,
+                workers=self.workers,
+            )
             ret_dict[outfile] = content
+        self.item_cache.store()
         return ret_dict
 
 
-def get_offers_content(label, filter_url, filter_items, *, throw=True):
-    # sleep_random(4)
-    headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-    response = requests.get(filter_url, headers=headers, timeout=10)
+def get_offers_content(label, filter_url, filter_items, *, throw=True, item_cache=None, workers=1):
+    response = http_get(filter_url, timeout=10)
 
     if response.status_code not in (200, 204):
         if throw:
@@ -86,54 +92,48 @@ def get_offers_content(label, filter_url, filter_items, *, throw=True):
 
     content_bytes = response.content
     content = content_bytes.decode("utf-8")
-    soup = BeautifulSoup(content, "html.parser")
+    soup = make_soup(content)
 
     offers_content_list = soup.select(".container a")
-    items_num = min(filter_items, len(offers_content_list))
-    offers_content_tags = offers_content_list[0:items_num]
-
-    for offer_item in offers_content_tags:
-        offer_url = offer_item["href"]
-        add_offer(feed_gen, label, offer_url)
+    offers_urls = [offer_item["href"] for offer_item in offers_content_list]
+
+    ## publish date is known only from offer details, so stale offers are remembered in item cache
+    ## do not add older offers - on the site refreshed/renewed offers change its ID, so
+    ## the offer will appear again in RSS with original publish date
+    pipeline = ListingPipeline(item_cache, items_num=filter_items, max_age_days=7, workers=workers)
+    offers_list = pipeline.run(
+        offers_urls,
+        get_key=lambda offer_url: offer_url,
+        fetch_detail=get_offer_data,
+        get_detail_date=lambda data_dict: string_to_date(data_dict["datePosted"]),
+    )
+    for offer_url, data_dict in offers_list:
+        add_offer(feed_gen, label, offer_url, data_dict)
 
     return dumps_feed_gen(feed_gen)
 
 
-def add_offer(feed_gen, label, offer_url):
-    # sleep_random(4)
+def get_offer_data(offer_url):
     _LOGGER.info("getting offer details: %s", offer_url)
-    headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-    response = requests.get(offer_url, headers=headers, timeout=10)
+    response = http_get(offer_url, timeout=10)
 
     if response.status_code not in (200, 204):
         _LOGGER.warning("unable to get job offer content, response status: %s", response.status_code)
-        return
-
-    content_bytes = response.content
-    content = content_bytes.decode("utf-8")
-    soup = BeautifulSoup(content, "html.parser")
+        return None
 
-    offer_json_list = soup.findAll("script", {"type": "application/ld+json"})
-    if len(offer_json_list) < 1:
+    ## scan raw page for embedded data (without building DOM of the page)
+    data_dict = extract_script_json(response.content, {"type": "application/ld+json"})
+    if data_dict is None:
         _LOGGER.warning("unable to find job offer json")
-        return
+    return data_dict
 
-    json_content = offer_json_list[0].string
-    data_dict = json.loads(json_content)
 
+def add_offer(feed_gen, label, offer_url, data_dict):
     offer_id = data_dict["@id"]
     offer_title = data_dict["title"]
     offer_company = data_dict["hiringOrganization"]["name"]
     offer_published = data_dict["datePosted"]
-    item_date: datetime.datetime = string_to_date(offer_published)
-
-    curr_time = datetime.datetime.now(tz=datetime.timezone.utc)
-    time_diff = curr_time - item_date
-    diff_days = time_diff.total_seconds() / (60 * 60 * 24)
-    if diff_days > 7:
-        ## do not add older offers - on the site refreshed/renewed offers change its ID, so
-        ## the offer will appear again in RSS with original publish date
-        return
+    item_date = string_to_date(offer_published)
 
     ########
 
@@ -187,12 +187,6 @@ def match_nested(item_list, nested_list):
     return match_nested(sub_list, nested_list[1:])
 
 
-def sleep_random(max_seconds):
-    # ruff: noqa: S311
-    rand_secs = random.randint(1, max_seconds)  # nosec
-    time.sleep(rand_secs)
-
-
 # ============================================================
 
 
@@ -12,10 +12,9 @@ import logging
 from enum import Enum, unique
 import datetime
 
-from feedgen.feed import FeedGenerator
-
 from rssforward.utils import escape_html, normalize_string, prepare_filename, encode_base64
 from rssforward.rssgenerator import RSSGenerator
+from rssforward.rss.feedwriter import FeedWriter
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen, add_data_to_feed
 from rssforward.access.facebookscraper import FacebookScraper
 
@@ -72,7 +71,7 @@ def get_page_content(label, page_id, posts_num):
         items_list = scraper.get_page_items(page_id, posts_num)
         _LOGGER.debug("found items: %s", len(items_list))
 
-        feed_gen: FeedGenerator = init_feed_gen(MAIN_URL)
+        feed_gen: FeedWriter = init_feed_gen(MAIN_URL)
         feed_gen.title(label)
         feed_gen.description(label)
 
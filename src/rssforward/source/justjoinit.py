@@ -10,17 +10,19 @@
 
 import logging
 from enum import Enum, unique
-import time
 
 import pprint
 import json
-import requests
 
-from bs4 import BeautifulSoup
+from requests.exceptions import RequestException
 
 from rssforward.utils import convert_to_html, stringisoz_to_date, escape_html, normalize_string
 from rssforward.rssgenerator import RSSGenerator
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen
+from rssforward.source.utils.httpclient import http_get
+from rssforward.source.utils.itemcache import ItemCache
+from rssforward.source.utils.pipeline import ListingPipeline
+from rssforward.source.utils.htmlparser import make_soup
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +30,8 @@ _LOGGER = logging.getLogger(__name__)
 
 MAIN_URL = "https://justjoin.it/"
 
+API_HEADERS = {"Version": "2"}
+
 
 @unique
 class ParamsField(Enum):
@@ -36,6 +40,7 @@ class ParamsField(Enum):
     URL = "url"
     ITEMSPERFETCH = "itemsperfetch"
     OUTFILE = "outfile"
+    WORKERS = "workers"
 
 
 class JustJoinItGenerator(RSSGenerator):
@@ -46,6 +51,8 @@ class JustJoinItGenerator(RSSGenerator):
             self.params = params_dict.copy()
 
         self.filters_list = self.params.get(ParamsField.FILTER.value)
+        self.workers = self.params.get(ParamsField.WORKERS.value, 1)
+        self.item_cache = ItemCache("justjoinit")
 
     def authenticate(self, _login, _password):
         return True
@@ -62,17 +69,20 @@ class JustJoinItGenerator(RSSGenerator):
             filter_items = filter_data.get(ParamsField.ITEMSPERFETCH.value, 20)
             _LOGGER.info("accessing: %s", filter_label)
             outfile = filter_data.get(ParamsField.OUTFILE.value)
-            content = get_offers_content(filter_label, filter_url, filter_items)
+            content = get_offers_content(
+                filter_label,
+                filter_url,
+                filter_items,
+                item_cache=self.item_cache,
+                workers=self.workers,
+            )
             ret_dict[outfile] = content
+        self.item_cache.store()
         return ret_dict
 
 
-def get_offers_content(label, filter_url, filter_items, attempts=3, *, throw=True):
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0",
-        "Version": "2",
-    }
-    response = requests.get(filter_url, headers=headers, timeout=30)
+def get_offers_content(label, filter_url, filter_items, *, throw=True, item_cache=None, workers=1):
+    response = http_get(filter_url, headers=API_HEADERS)
 
     if response.status_code not in (200, 204):
         if throw:
@@ -87,17 +97,40 @@ def get_offers_content(label, filter_url, filter_items, attempts=3, *, throw=Tru
     feed_gen.description(label)
 
     json_offers_list = response_json["data"]
-    items_num = min(filter_items, len(json_offers_list))
-    json_offers_list = json_offers_list[0:items_num]
-
     _LOGGER.info("found %s items", len(json_offers_list))
-    for offer in json_offers_list:
-        add_offer(feed_gen, label, offer, attempts=attempts)
+
+    ## offers without description are added anyway, description is fetched again in next generation
+    pipeline = ListingPipeline(item_cache, items_num=filter_items, workers=workers, skip_missing=False)
+    offers_list = pipeline.run(json_offers_list, get_key=get_offer_id, fetch_detail=get_offer_description)
+    for offer, item_desc in offers_list:
+        add_offer(feed_gen, label, offer, item_desc)
 
     return dumps_feed_gen(feed_gen)
 
 
-def add_offer(feed_gen, label, data_dict, attempts=3):
+def get_offer_id(data_dict):
+    # data_hash = calculate_dict_hash(data_dict)
+    # calculating hash from data dict is to "fragile"
+    # add date to prevent hash collision (very unlikely, but still...)
+    return f"""{data_dict["publishedAt"]}_{data_dict["slug"]}"""
+
+
+def get_offer_url(data_dict):
+    return f"""https://justjoin.it/offers/{data_dict["slug"]}"""
+
+
+def get_offer_description(data_dict):
+    desc_url = get_offer_url(data_dict)
+    item_desc = get_description(desc_url)
+    if item_desc is None:
+        ## 'None' is not stored in item cache
+        _LOGGER.error("no description for url: %s", desc_url)
+    return item_desc
+
+
+def add_offer(feed_gen, label, data_dict, item_desc):
+    if item_desc is None:
+        item_desc = ""
     offer_title = data_dict["title"]
     offer_company = data_dict["companyName"]
     offer_published = data_dict["publishedAt"]
@@ -111,30 +144,14 @@ def add_offer(feed_gen, label, data_dict, attempts=3):
 
     feed_item = feed_gen.add_entry()
 
-    slug = data_dict["slug"]
-
-    # data_hash = calculate_dict_hash(data_dict)
-    # calculating hash from data dict is to "fragile"
-    # add date to prevent hash collision (very unlikely, but still...)
-    item_id = f"{offer_published}_{slug}"
+    item_id = get_offer_id(data_dict)
     feed_item.id(item_id)
 
     feed_item.title(f"{label}: {offer_company} - {offer_title}")
     feed_item.author({"name": "justjoin.it", "email": "justjoin.it"})
 
     # fill description
-    desc_url = f"https://justjoin.it/offers/{slug}"
-    _LOGGER.info("getting offer details: %s", desc_url)
-
-    for rep in range(attempts):
-        item_desc = get_description(desc_url)
-        if item_desc is not None:
-            break
-        time.sleep(1.5)
-        _LOGGER.error("no description for url (attempt: %s) %s", rep + 1, desc_url)
-    else:
-        _LOGGER.error("no description for url after %s attempts: %s", attempts, desc_url)
-        item_desc = ""
+    desc_url = get_offer_url(data_dict)
 
     employment_details = ""
     employment_types = data_dict["employmentTypes"]
@@ -193,31 +210,21 @@ Data:<br/>
 
 
 def get_description(url):
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0",
-        "Version": "2",
-    }
-
-    for _i in range(2):
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            if response.status_code in (200, 204):
-                # got response - break the loop
-                break
-            # sometimes server responds witn code 500 - in this case send another request
-            _LOGGER.warning("unable to get description from url: %s response: %s", url, response.status_code)
-        except requests.exceptions.ReadTimeout as exc:
-            _LOGGER.warning("unable to get description from url: %s exception: %s", url, exc)
-        # next iteration
-        time.sleep(2.0)
-    else:
+    _LOGGER.info("getting offer details: %s", url)
+    # sometimes server responds witn code 500 - requests are repeated by http client
+    try:
+        response = http_get(url, headers=API_HEADERS)
+    except RequestException as exc:
+        _LOGGER.warning("unable to get description from url: %s exception: %s", url, exc)
+        return None
+    if response.status_code not in (200, 204):
         # could not reach description page
-        _LOGGER.warning("unable to get description from url: %s after several attempts", url)
+        _LOGGER.warning("unable to get description from url: %s response: %s", url, response.status_code)
         return None
 
     content_bytes = response.content
     content = content_bytes.decode("utf-8")
-    soup = BeautifulSoup(content, "html.parser")
+    soup = make_soup(content)
 
     ## remove all style elements
     for style in soup.find_all("style"):
@@ -10,22 +10,21 @@
 
 import logging
 import datetime
-import random
-import time
 
 import pprint
 import json
-import requests
-
-from feedgen.feed import FeedGenerator
 
 from rssforward.utils import (
     write_data,
     normalize_string,
     escape_html,
+    calculate_dict_hash,
 )
 from rssforward.rssgenerator import RSSGenerator
+from rssforward.rss.feedwriter import FeedWriter
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen, add_data_to_feed
+from rssforward.source.utils.httpclient import http_get
+from rssforward.source.utils.itemcache import ItemCache, get_cached_item
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,27 +35,31 @@ MAIN_URL = "https://kidsalert.pl"
 
 
 class KidsAlertGenerator(RSSGenerator):
+    def __init__(self):
+        super().__init__()
+        self.item_cache = ItemCache("kidsalert")
 
     def authenticate(self, _login, _password):
         return True
 
     def generate(self) -> dict[str, str]:
         _LOGGER.info("========== running %s scraper ==========", MAIN_NAME)
-        content = get_content()
+        content = get_content(item_cache=self.item_cache)
+        self.item_cache.store()
         return {"news.xml": content}
 
 
-def get_content(items_num=20, html_output=None):
-    items_list = get_news_links(items_num, throw=False)
+def get_content(items_num=20, html_output=None, item_cache=None):
+    items_list = get_news_items(items_num, throw=False)
     if not items_list:
         return None
 
-    feed_gen: FeedGenerator = init_feed_gen(MAIN_URL)
+    feed_gen: FeedWriter = init_feed_gen(MAIN_URL)
     feed_gen.title(MAIN_NAME)
     feed_gen.description(MAIN_NAME)
 
-    for item_url in items_list:
-        add_news(feed_gen, item_url, html_output)
+    for item_url, item_key in items_list:
+        add_news(feed_gen, item_url, html_output, item_key=item_key, item_cache=item_cache)
 
     try:
         content = dumps_feed_gen(feed_gen)
@@ -68,8 +71,15 @@ def get_content(items_num=20, html_output=None):
 
 
 def get_news_links(posts_num=9999, *, throw=True):
-    headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-    response = requests.get("https://kidsalert.pl/alerts/?lang=pl", headers=headers, timeout=10)
+    news_items = get_news_items(posts_num, throw=throw)
+    if news_items is None:
+        return None
+    return [item_url for item_url, _item_key in news_items]
+
+
+# returns list of pairs: (url, key identifying state of item on the list)
+def get_news_items(posts_num=9999, *, throw=True):
+    response = http_get("https://kidsalert.pl/alerts/?lang=pl", timeout=10)
 
     if response.status_code not in (200, 204):
         if throw:
@@ -84,11 +94,18 @@ def get_news_links(posts_num=9999, *, throw=True):
 
     items_num = min(posts_num, len(data_list))
     data_list = data_list[0:items_num]
-    return [f"""https://kidsalert.pl/alerts/{item["id"]}/?lang=pl""" for item in data_list]
-
-
-def add_news(feed_gen, item_url, html_output=None):
-    offer_data = extract_news_data(item_url)
+    ret_list = []
+    for item in data_list:
+        item_url = f"""https://kidsalert.pl/alerts/{item["id"]}/?lang=pl"""
+        item_key = f"{item_url}_{calculate_dict_hash(item)}"
+        ret_list.append((item_url, item_key))
+    return ret_list
+
+
+def add_news(feed_gen, item_url, html_output=None, item_key=None, item_cache=None):
+    if item_key is None:
+        item_key = item_url
+    offer_data = get_cached_item(item_cache, item_key, lambda: extract_news_data(item_url))
     if not offer_data:
         return
     if html_output:
@@ -99,11 +116,9 @@ def add_news(feed_gen, item_url, html_output=None):
 
 
 def extract_news_data(item_url=None, content=None):
-    # sleep_random(3)
     if item_url is not None:
         _LOGGER.info("getting offer details: %s", item_url)
-        headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-        response = requests.get(item_url, headers=headers, timeout=10)
+        response = http_get(item_url, timeout=10)
 
         if response.status_code not in (200, 204):
             _LOGGER.warning("unable to get job offer content")
@@ -171,12 +186,6 @@ Data:<br/>
     }
 
 
-def sleep_random(max_seconds):
-    # ruff: noqa: S311
-    rand_secs = random.randint(1, max_seconds)  # nosec
-    time.sleep(rand_secs)
-
-
 # ============================================================
 
 
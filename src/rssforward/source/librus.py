@@ -9,6 +9,7 @@
 # pylint: disable=E0401 (import-error)
 
 import logging
+import functools
 from typing import Any
 import datetime
 
@@ -28,6 +29,7 @@ from librus_apix.client import Client, new_client
 from rssforward.utils import read_recent_date, convert_to_html, string_to_date, string_to_datetime, calculate_dict_hash
 from rssforward.rssgenerator import RSSGenerator
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen
+from rssforward.source.utils.itemcache import ItemCache, get_cached_item
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +44,7 @@ class LibusGenerator(RSSGenerator):
         self._username = None
         self._password = None
         self._client: Client = None
+        self._item_cache = ItemCache("librus")
 
     def authenticate(self, login, password):
         self._username = login
@@ -53,12 +56,15 @@ class LibusGenerator(RSSGenerator):
         _LOGGER.info("========== running librus scraper ==========")
 
         try:
-            return generate_content(self._client)
+            ret_dict = generate_content(self._client, self._item_cache)
         except TokenError as exc:
             _LOGGER.warning("token error - try one more time with new token (%s)", exc)
+            self._get_token()
+            ret_dict = generate_content(self._client, self._item_cache)
 
-        self._get_token()
-        return generate_content(self._client)
+        if ret_dict is not None:
+            self._item_cache.store()
+        return ret_dict
 
     def _get_token(self):
         try:
@@ -97,7 +103,7 @@ def get_announcements_by_date(token, start_datetime=None):
     return ret_announcements
 
 
-def generate_content(client: Client) -> dict[str, str]:
+def generate_content(client: Client, item_cache: ItemCache = None) -> dict[str, str]:
     if client is None:
         _LOGGER.warning("unable to generate content, because generator is not authenticated")
         return None
@@ -126,7 +132,7 @@ def generate_content(client: Client) -> dict[str, str]:
     _LOGGER.info("accessing messages")
     messages = get_messages_by_date(client, recent_datetime)
     _LOGGER.info("got %s messages since reference date %s", len(messages), recent_datetime)
-    gen_data = generate_messages_feed(messages, client)
+    gen_data = generate_messages_feed(messages, client, item_cache)
     ret_dict.update(gen_data)
 
     _LOGGER.info("accessing announcements")
@@ -322,19 +328,20 @@ Czy wycieczka: {excursion}
     feed_item.pubDate(item_date)
 
 
-def generate_messages_feed(messages: list[Message], token):
+def generate_messages_feed(messages: list[Message], token, item_cache: ItemCache = None):
     feed_gen = init_feed_gen(MAIN_URL)
     feed_gen.title("Wiadomości")
     feed_gen.description("wiadomości")
 
     for item in messages:
         # pprint.pprint(item)
-        item_desc: MessageData = message_content(token, item.href)
+        ## received messages do not change - content is downloaded only once
+        item_content = get_cached_item(item_cache, item.href, functools.partial(get_message_content, token, item.href))
         data_dict = {
             "item_date": item.date,
             "title": item.title,
             "author": item.author,
-            "content": item_desc.content,
+            "content": item_content,
             "has_attachment": item.has_attachment,
         }
         add_message(feed_gen, data_dict)
@@ -343,6 +350,11 @@ def generate_messages_feed(messages: list[Message], token):
     return {"message.xml": content}
 
 
+def get_message_content(token, href) -> str:
+    item_desc: MessageData = message_content(token, href)
+    return item_desc.content
+
+
 def add_message(feed_gen, data_dict):
     item_date = data_dict["item_date"]
     title = data_dict["title"]
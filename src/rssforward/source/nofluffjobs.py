@@ -10,23 +10,20 @@
 
 import logging
 from enum import Enum, unique
-import datetime
 from typing import Any
-import contextlib
-
-import json
-import requests
-
-from bs4 import BeautifulSoup
-
-from feedgen.feed import FeedGenerator
 
 from rssforward.utils import (
     timestamp_to_date,
     write_data,
 )
 from rssforward.rssgenerator import RSSGenerator
+from rssforward.rss.feedwriter import FeedWriter
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen, add_data_to_feed
+from rssforward.source.utils.httpclient import http_get
+from rssforward.source.utils.itemcache import ItemCache
+from rssforward.source.utils.pipeline import ListingPipeline
+from rssforward.source.utils.htmlparser import make_soup
+from rssforward.source.utils.react import extract_script_json
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +40,7 @@ class ParamsField(Enum):
     URL = "url"
     ITEMSPERFETCH = "itemsperfetch"
     OUTFILE = "outfile"
+    WORKERS = "workers"
 
 
 class NoFluffJobsGenerator(RSSGenerator):
@@ -52,6 +50,8 @@ class NoFluffJobsGenerator(RSSGenerator):
         if params_dict:
             self.params = params_dict.copy()
         self.filters_list = self.params.get(ParamsField.FILTER.value)
+        self.workers = self.params.get(ParamsField.WORKERS.value, 1)
+        self.item_cache = ItemCache("nofluffjobs")
 
     def authenticate(self, _login, _password):
         return True
@@ -69,29 +69,53 @@ class NoFluffJobsGenerator(RSSGenerator):
             filter_items = filter_data.get(ParamsField.ITEMSPERFETCH.value, 20)
             _LOGGER.info("accessing: %s", filter_label)
             outfile = filter_data.get(ParamsField.OUTFILE.value)
-            content = get_offers_content(filter_label, filter_url, filter_items)
+            content = get_offers_content(
+                filter_label,
+                filter_url,
+                filter_items,
+                item_cache=self.item_cache,
+                workers=self.workers,
+            )
             ret_dict[outfile] = content
+        self.item_cache.store()
         return ret_dict
 
 
-def get_offers_content(label, filter_url, filter_items, html_out_path=None, *, throw=True):
+def get_offers_content(
+    label,
+    filter_url,
+    filter_items,
+    html_out_path=None,
+    *,
+    throw=True,
+    item_cache=None,
+    workers=1,
+):
     offers_links_list: list[Any] = get_offers_links(filter_url, throw=throw)
     if not offers_links_list:
         return None
 
-    offers_links_list.sort(key=lambda item: item["pub_date"])
+    ## newest first
+    offers_links_list.sort(key=lambda item: item["pub_date"], reverse=True)
     _LOGGER.debug("found offers: %s", len(offers_links_list))
 
-    if filter_items:
-        recent_items = min(filter_items, len(offers_links_list))
-        offers_links_list = offers_links_list[-recent_items:]
-
-    feed_gen: FeedGenerator = init_feed_gen(MAIN_URL)
+    feed_gen: FeedWriter = init_feed_gen(MAIN_URL)
     feed_gen.title(label)
     feed_gen.description(label)
 
-    for full_url in offers_links_list:
-        add_offer(feed_gen, label, full_url, html_out_path=html_out_path)
+    ## do not add older offers - on the site refreshed/renewed offers change its ID, so
+    ## the offer will appear again in RSS with original publish date
+    pipeline = ListingPipeline(item_cache, items_num=filter_items, max_age_days=7, workers=workers)
+    ## offer id contains publish timestamp, so renewed offer is downloaded again
+    offers_list = pipeline.run(
+        offers_links_list,
+        get_key=lambda offer_data: offer_data["id"],
+        fetch_detail=lambda offer_data: get_offer_data(offer_data, html_out_path=html_out_path),
+        get_date=lambda offer_data: offer_data["pub_date"],
+    )
+    ## add oldest first
+    for _offer_link, offer_data in reversed(offers_list):
+        add_offer(feed_gen, label, offer_data)
 
     try:
         content = dumps_feed_gen(feed_gen)
@@ -103,10 +127,8 @@ def get_offers_content(label, filter_url, filter_items, html_out_path=None, *, t
 
 
 def get_offers_links(filter_url, *, throw=True):
-    # sleep_random(4)
     _LOGGER.info("getting offers list from: %s", filter_url)
-    headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-    response = requests.get(filter_url, headers=headers, timeout=10)
+    response = http_get(filter_url, timeout=10)
 
     if response.status_code not in (200, 204):
         if throw:
@@ -114,36 +136,16 @@ def get_offers_links(filter_url, *, throw=True):
             raise RuntimeError(message)
         return None
 
-    content_bytes = response.content
-    content = content_bytes.decode("utf-8")
-    soup = BeautifulSoup(content, "html.parser")
-
-    offer_json_list = soup.findAll("script", {"id": "serverApp-state"})
-    if len(offer_json_list) < 1:
+    ## scan raw page for embedded state and take only list of offers (without building DOM of the page)
+    data_list = extract_script_json(
+        response.content,
+        {"id": "serverApp-state"},
+        ["STORE_KEY", "searchResponse", "postings"],
+    )
+    if data_list is None:
         _LOGGER.warning("unable to find job offer json")
         return None
 
-    json_content = offer_json_list[0].string
-    data_dict = json.loads(json_content)
-    del data_dict["USER_COUNTRY"]
-    del data_dict["__nghData__"]
-    del data_dict["translations_pl-PL"]
-    try:
-        del data_dict["assigned on server"]
-    except KeyError:
-        contextlib.suppress(KeyError)
-
-    for key in list(data_dict.keys()):
-        if key.startswith("assets/"):
-            del data_dict[key]
-        if key.startswith("/joboffers/autocomplete"):
-            del data_dict[key]
-        if key.startswith("/joboffers/count"):
-            del data_dict[key]
-    # pprint.pprint(data_dict.keys())
-
-    data_list = data_dict["STORE_KEY"]["searchResponse"]["postings"]
-
     offser_links = []
     for offer_data in data_list:
         data_posted = offer_data["posted"]  ## timestamp
@@ -165,22 +167,16 @@ def get_offers_links(filter_url, *, throw=True):
     return offser_links
 
 
-def add_offer(feed_gen, label, offer_data, html_out_path=None):
-    offer_data = add_offer_content(offer_data, html_out_path=html_out_path)
+# returns offer data with content or 'None' if offer could not be fetched
+def get_offer_data(offer_data, html_out_path=None):
+    offer_data = add_offer_content(offer_data.copy(), html_out_path=html_out_path)
     if not offer_data:
         _LOGGER.warning("could not get offer data")
-        return
-
-    pub_date: datetime.datetime = offer_data["pub_date"]
-    curr_time = datetime.datetime.now(tz=datetime.timezone.utc)
-    time_diff = curr_time - pub_date
-    diff_days = time_diff.total_seconds() / (60 * 60 * 24)
-    if diff_days > 7:
-        ## do not add older offers - on the site refreshed/renewed offers change its ID, so
-        ## the offer will appear again in RSS with original publish date
-        _LOGGER.debug("skipping old offer, pub date: %s", pub_date)
-        return
+    return offer_data
+
 
+def add_offer(feed_gen, label, offer_data):
+    offer_data = offer_data.copy()  # do not modify cached item
     offer_data["title"] = label + ": " + offer_data["title"]
     add_data_to_feed(feed_gen, offer_data)
 
@@ -189,15 +185,14 @@ def add_offer_content(offer_data, html_out_path=None):
     offer_url = offer_data["link"]
 
     _LOGGER.debug("getting offer info: %s", offer_url)
-    headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-    response = requests.get(offer_url, headers=headers, timeout=10)
+    response = http_get(offer_url, timeout=10)
 
     if response.status_code not in (200, 204):
         return None
 
     content_bytes = response.content
     content = content_bytes.decode("utf-8")
-    soup = BeautifulSoup(content, "html.parser")
+    soup = make_soup(content)
 
     # offer_name_list = soup.findAll("div", {"class": "posting-details-description"})
     # if len(offer_name_list) < 1:
@@ -9,23 +9,20 @@
 # pylint: disable=E0401 (import-error)
 
 import logging
-import time
 from enum import Enum, unique
 import datetime
 import pprint
 
-import random
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-from feedgen.feed import FeedGenerator
-
 from rssforward.utils import stringisoauto_to_date, escape_html, normalize_string
 from rssforward.rssgenerator import RSSGenerator
+from rssforward.rss.feedwriter import FeedWriter
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen, add_data_to_feed
 from rssforward.source.utils.react import extract_data_dict, get_nested_dict
 from rssforward.source.utils.htmlbuild import convert_line, convert_list, convert_title, convert_content
-from rssforward.source.utils.selenium import selenium_get_content
+from rssforward.source.utils.selenium import selenium_get_content, close_driver_pool
+from rssforward.source.utils.htmlparser import make_soup
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,13 +69,16 @@ class PracujPlGenerator(RSSGenerator):
             ret_dict[outfile] = content
         return ret_dict
 
+    def close(self):
+        close_driver_pool()
+
 
 def get_offers_content(label, filter_url, filter_items, *, throw=True):
     offers_links_list = get_offers_links(filter_url, filter_items, throw=throw)
     if not offers_links_list:
         return None
 
-    feed_gen: FeedGenerator = init_feed_gen(MAIN_URL)
+    feed_gen: FeedWriter = init_feed_gen(MAIN_URL)
     feed_gen.title(label)
     feed_gen.description(label)
 
@@ -118,7 +118,7 @@ def get_offers_links(filter_url, filter_items, *, throw=True):
             message = f"unable to get content from url: {filter_url}"
             raise RuntimeError(message)
         return None
-    soup = BeautifulSoup(response_text, "html.parser")
+    soup = make_soup(response_text)
 
     offers_links_list = soup.select('a[data-test*="link-offer"]')
     items_num = min(filter_items, len(offers_links_list))
@@ -133,17 +133,14 @@ def get_offers_links(filter_url, filter_items, *, throw=True):
 
 
 def extract_offer_data(offer_url=None, content: str = None, html_out_path=None):
-    # sleep_random(3)
-
     if offer_url:
         _LOGGER.info("extracting offer data: %s", offer_url)
         content = selenium_get_content(offer_url)
         if not content:
             _LOGGER.warning("unable to get job offer content")
             return None
-    soup = BeautifulSoup(content, "html.parser")
-
-    data_dict = extract_data_dict(soup)
+    ## scan raw page for embedded data (without building DOM of the page)
+    data_dict = extract_data_dict(content)
     if data_dict is None:
         return None
     data_dict = get_nested_dict(data_dict, ["props", "pageProps"])
@@ -331,13 +328,6 @@ def convert_model(model_data):
     return f"<div>unhandled model type: {model_type}<br/>{model_data}</div>\n"
 
 
-def sleep_random(max_seconds):
-    factor = 1000
-    # ruff: noqa: S311
-    rand_secs = random.randint(1, max_seconds * factor)  # nosec
-    time.sleep(rand_secs / factor)
-
-
 # ============================================================
 
 
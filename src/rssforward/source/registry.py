@@ -0,0 +1,98 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+"""Static registry of generators.
+
+Registry allows to enumerate generators and check their requirements without importing
+generators modules (importing module loads heavy dependencies, e.g. selenium or yt_dlp).
+"""
+
+import logging
+import importlib
+import importlib.util
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GeneratorInfo:
+    """Metadata of generator."""
+
+    def __init__(self, gen_id, params=(), dependencies=(), module=None):
+        self.gen_id = gen_id
+        self.params = tuple(params)  # names of parameters accepted in 'params' of config item
+        self.dependencies = tuple(dependencies)  # third-party packages imported by module
+        self.module = module  # full name of module containing 'get_generator()' function
+        if self.module is None:
+            self.module = f"{__package__}.{gen_id}"
+
+
+## dependencies of utils and access modules used by generators
+## 'lxml' is optional (only speeds up parsing, see 'htmlparser' module), so it is not listed
+HTTP_DEPS = ("requests",)
+HTML_DEPS = ("requests", "bs4")
+BROWSER_DEPS = ("requests", "bs4", "selenium", "webdriver_manager")
+
+FILTER_PARAMS = ("filter",)
+
+_GENERATORS_LIST = [
+    GeneratorInfo("bulldogjob", params=("filter", "workers"), dependencies=HTML_DEPS),
+    GeneratorInfo("earlystage", dependencies=HTTP_DEPS),
+    GeneratorInfo("facebookpages", params=FILTER_PARAMS, dependencies=("requests", "selenium", "webdriver_manager")),
+    GeneratorInfo("justjoinit", params=("filter", "workers"), dependencies=HTML_DEPS),
+    GeneratorInfo("kidsalert", dependencies=HTTP_DEPS),
+    GeneratorInfo("librus", dependencies=(*HTML_DEPS, "librus_apix")),
+    GeneratorInfo("nofluffjobs", params=("filter", "workers"), dependencies=HTML_DEPS),
+    GeneratorInfo("pracujpl", params=FILTER_PARAMS, dependencies=BROWSER_DEPS),
+    GeneratorInfo("simonsays", dependencies=("pycurl", "certifi")),
+    GeneratorInfo("theprotocol", params=FILTER_PARAMS, dependencies=BROWSER_DEPS),
+    GeneratorInfo("umursynow", dependencies=BROWSER_DEPS),
+    GeneratorInfo("untswawpl", dependencies=HTML_DEPS),
+    GeneratorInfo("waw4free", params=("workers",), dependencies=HTML_DEPS),
+    GeneratorInfo("youtube", params=("url", "itemsperfetch", "outfile"), dependencies=("requests", "yt_dlp")),
+]
+
+_GENERATORS_DICT = {info.gen_id: info for info in _GENERATORS_LIST}
+
+
+def get_generators_ids() -> list[str]:
+    return list(_GENERATORS_DICT.keys())
+
+
+# returns 'None' if generator is not registered
+def get_generator_info(generator_id) -> GeneratorInfo:
+    return _GENERATORS_DICT.get(generator_id)
+
+
+# returns list of dependencies not installed (checked without importing them)
+def find_missing_dependencies(generator_id) -> list[str]:
+    info = get_generator_info(generator_id)
+    if info is None:
+        return []
+    return [dep for dep in info.dependencies if importlib.util.find_spec(dep) is None]
+
+
+# returns list of parameters not declared by generator
+def find_unknown_params(generator_id, generator_params_dict) -> list[str]:
+    info = get_generator_info(generator_id)
+    if info is None or not generator_params_dict:
+        return []
+    return [name for name in generator_params_dict if name not in info.params]
+
+
+def load_generator_module(generator_id):
+    """Import module of registered generator. Return 'None' if generator is not registered or can't be imported."""
+    info = get_generator_info(generator_id)
+    if info is None:
+        _LOGGER.warning("unknown generator: '%s', available: %s", generator_id, get_generators_ids())
+        return None
+    missing_deps = find_missing_dependencies(generator_id)
+    if missing_deps:
+        _LOGGER.warning("unable to load generator %s - missing packages: %s", generator_id, missing_deps)
+        return None
+    return importlib.import_module(info.module)
@@ -19,6 +19,7 @@ from rssforward.utils import (
 from rssforward.rssgenerator import RSSGenerator
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen
 from rssforward.source.utils.curl import get_curl_session, curl_post, curl_get, get_status_code
+from rssforward.source.utils.itemcache import ItemCache
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +34,7 @@ class SimonSaysGenerator(RSSGenerator):
         self._session = None
         self._token = None
         self._auth_header_list = []
+        self._item_cache = ItemCache("simonsays")
 
     def authenticate(self, login, password):
         self._session = get_curl_session(
@@ -117,6 +119,7 @@ class SimonSaysGenerator(RSSGenerator):
         gen_data = generate_classes_feed(classes_data)
         ret_dict.update(gen_data)
 
+        self._item_cache.store()
         return ret_dict
 
     def _get_student_id(self):
@@ -150,6 +153,12 @@ class SimonSaysGenerator(RSSGenerator):
                 _LOGGER.error("message id not found")
                 return None
 
+            ## messages do not change - details are downloaded only once
+            message_details_data = self._item_cache.get(msg_id)
+            if message_details_data is not None:
+                ret_list.append(message_details_data)
+                continue
+
             url = "https://simonsays.langlion.com//api/message"
             params_dict = {"id": msg_id}
             message_details_data = self._fetch_data_dict(url, params_dict)
@@ -161,6 +170,7 @@ class SimonSaysGenerator(RSSGenerator):
                 _LOGGER.error("message data not found")
                 return None
 
+            self._item_cache.set(msg_id, message_details_data)
             ret_list.append(message_details_data)
 
         return ret_list
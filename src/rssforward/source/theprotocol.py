@@ -9,22 +9,19 @@
 # pylint: disable=E0401 (import-error)
 
 import logging
-import time
 from enum import Enum, unique
 import datetime
 import pprint
 
-import random
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from rssforward.utils import convert_to_html, stringisoauto_to_date, escape_html, normalize_string
 from rssforward.rssgenerator import RSSGenerator
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen, add_data_to_feed
 from rssforward.source.utils.react import extract_data_dict, get_nested_dict
 from rssforward.source.utils.htmlbuild import convert_line, convert_list
-from rssforward.source.utils.selenium import selenium_get_content
+from rssforward.source.utils.selenium import selenium_get_content, close_driver_pool
+from rssforward.source.utils.htmlparser import make_soup
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -70,6 +67,9 @@ class TheProtocolGenerator(RSSGenerator):
             ret_dict[outfile] = content
         return ret_dict
 
+    def close(self):
+        close_driver_pool()
+
 
 def get_offers_content(label, filter_url, filter_items, *, throw=True):
     offers_links_list = get_offers_links(filter_url, filter_items, throw=throw)
@@ -101,7 +101,7 @@ def get_offers_links(filter_url, filter_items, *, throw=True):
             message = f"unable to get content from url: {filter_url}"
             raise RuntimeError(message)
         return None
-    soup = BeautifulSoup(response_text, "html.parser")
+    soup = make_soup(response_text)
 
     offers_content_list = soup.select('a[href*="szczegoly/praca"]')
     items_num = min(filter_items, len(offers_content_list))
@@ -132,17 +132,14 @@ def add_offer(feed_gen, label, offer_url=None, content=None):
 
 
 def extract_offer_data(offer_url=None, content: str = None):
-    # sleep_random(3)
-
     if offer_url:
         _LOGGER.info("extracting offer data: %s", offer_url)
         content = selenium_get_content(offer_url)
         if not content:
             _LOGGER.warning("unable to get job offer content")
             return None
-    soup = BeautifulSoup(content, "html.parser")
-
-    data_dict = extract_data_dict(soup)
+    ## scan raw page for embedded data (without building DOM of the page)
+    data_dict = extract_data_dict(content)
     if data_dict is None:
         return None
     data_dict = get_nested_dict(data_dict, ["props", "pageProps", "offer"])
@@ -287,12 +284,6 @@ def match_nested(item_list, nested_list):
     return match_nested(sub_list, nested_list[1:])
 
 
-def sleep_random(max_seconds):
-    # ruff: noqa: S311
-    rand_secs = random.randint(1, max_seconds)  # nosec
-    time.sleep(rand_secs)
-
-
 # ============================================================
 
 
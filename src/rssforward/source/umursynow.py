@@ -9,24 +9,21 @@
 # pylint: disable=E0401 (import-error)
 
 import logging
-import time
 import datetime
 
-import random
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-from feedgen.feed import FeedGenerator
-
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions
 
 from rssforward.utils import normalize_string, write_data
 from rssforward.rssgenerator import RSSGenerator
+from rssforward.rss.feedwriter import FeedWriter
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen, add_data_to_feed
 from rssforward.source.utils.htmlbuild import convert_line, convert_list, convert_title, convert_content
-from rssforward.source.utils.selenium import init_selenium_driver
+from rssforward.source.utils.selenium import get_driver_pool, close_driver_pool, driver_get
+from rssforward.source.utils.htmlparser import make_soup
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -46,13 +43,16 @@ class UMUrsynowGenerator(RSSGenerator):
         content = get_content()
         return {"news.xml": content}
 
+    def close(self):
+        close_driver_pool()
+
 
 def get_content(items_num=20, html_output=None):
     news_links = get_news_links(items_num, _throw=False)
     if not news_links:
         return None
 
-    feed_gen: FeedGenerator = init_feed_gen(MAIN_URL)
+    feed_gen: FeedWriter = init_feed_gen(MAIN_URL)
     feed_gen.title(MAIN_NAME)
     feed_gen.description(MAIN_NAME)
 
@@ -71,8 +71,8 @@ def get_content(items_num=20, html_output=None):
 def get_news_links(posts_num=9999, *, _throw=True):
     url = "https://ursynow.um.warszawa.pl/kalendarz?delta=75"
 
-    with init_selenium_driver(headless=True) as driver:
-        driver.get(url)
+    with get_driver_pool().checkout() as driver:
+        driver_get(driver, url)
 
         WebDriverWait(driver, 10).until(
             expected_conditions.visibility_of_element_located((By.CSS_SELECTOR, "div.events-search-results")),
@@ -80,7 +80,7 @@ def get_news_links(posts_num=9999, *, _throw=True):
 
         content = driver.page_source
 
-        soup = BeautifulSoup(content, "html.parser")
+        soup = make_soup(content)
         full_list = []
         articles_list = soup.find_all("li", attrs={"class": "search-results__item"})
         _LOGGER.info("got articles: %s", len(articles_list))
@@ -107,12 +107,10 @@ def add_news(feed_gen, full_url, html_output=None):
 
 
 def extract_news_data(news_url):
-    # sleep_random(3)
-
     _LOGGER.info("getting offer details: %s", news_url)
 
-    with init_selenium_driver(headless=True) as driver:
-        driver.get(news_url)
+    with get_driver_pool().checkout() as driver:
+        driver_get(driver, news_url)
 
         WebDriverWait(driver, 10).until(
             expected_conditions.visibility_of_element_located((By.CSS_SELECTOR, "div.asset-full-content")),
@@ -120,7 +118,7 @@ def extract_news_data(news_url):
 
         content = driver.page_source
 
-    soup = BeautifulSoup(content, "html.parser")
+    soup = make_soup(content)
 
     id_value = news_url.rsplit("/", 1)[-1]
 
@@ -280,12 +278,6 @@ def convert_model(model_data):
     return f"<div>unhandled model type: {model_type}<br/>{model_data}</div>\n"
 
 
-def sleep_random(max_seconds):
-    # ruff: noqa: S311
-    rand_secs = random.randint(1, max_seconds)  # nosec
-    time.sleep(rand_secs)
-
-
 # ============================================================
 
 
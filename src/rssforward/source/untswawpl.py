@@ -9,19 +9,16 @@
 # pylint: disable=E0401 (import-error)
 
 import logging
-import time
 
-import random
 from urllib.parse import urljoin
-import requests
-
-from bs4 import BeautifulSoup
-from feedgen.feed import FeedGenerator
 
 from rssforward.utils import normalize_string, string2_to_date
 from rssforward.rssgenerator import RSSGenerator
+from rssforward.rss.feedwriter import FeedWriter
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen, add_data_to_feed
+from rssforward.source.utils.httpclient import http_get
 from rssforward.source.utils.htmlbuild import convert_line, convert_list, convert_title, convert_content
+from rssforward.source.utils.htmlparser import make_soup
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,7 +44,7 @@ def get_content():
     if not news_links:
         return None
 
-    feed_gen: FeedGenerator = init_feed_gen(MAIN_URL)
+    feed_gen: FeedWriter = init_feed_gen(MAIN_URL)
     feed_gen.title(MAIN_NAME)
     feed_gen.description(MAIN_NAME)
 
@@ -64,8 +61,7 @@ def get_content():
 
 
 def get_news_links(posts_num, *, throw=True):
-    headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-    response = requests.get(MAIN_URL, headers=headers, timeout=10)
+    response = http_get(MAIN_URL, timeout=10)
 
     if response.status_code not in (200, 204):
         if throw:
@@ -76,7 +72,7 @@ def get_news_links(posts_num, *, throw=True):
     content_bytes = response.content
     content = content_bytes.decode("utf-8")
 
-    soup = BeautifulSoup(content, "html.parser")
+    soup = make_soup(content)
 
     full_list = []
     sections_list = soup.find_all("div", attrs={"class": "appBoxOuter"})
@@ -108,11 +104,9 @@ def extract_news_data(news_data=None, content: str = None):
     news_url = news_data[0]
     news_date = news_data[1]
 
-    # sleep_random(3)
     if news_url is not None:
         _LOGGER.info("getting offer details: %s", news_url)
-        headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-        response = requests.get(news_url, headers=headers, timeout=10)
+        response = http_get(news_url, timeout=10)
 
         if response.status_code not in (200, 204):
             _LOGGER.warning("unable to get job offer content")
@@ -121,7 +115,7 @@ def extract_news_data(news_data=None, content: str = None):
         content_bytes = response.content
         content = content_bytes.decode("utf-8")
 
-    soup = BeautifulSoup(content, "html.parser")
+    soup = make_soup(content)
 
     id_pos = news_url.index("id=")
     id_value = news_url[id_pos + 3 :]
@@ -260,12 +254,6 @@ def convert_model(model_data):
     return f"<div>unhandled model type: {model_type}<br/>{model_data}</div>\n"
 
 
-def sleep_random(max_seconds):
-    # ruff: noqa: S311
-    rand_secs = random.randint(1, max_seconds)  # nosec
-    time.sleep(rand_secs)
-
-
 # ============================================================
 
 
@@ -0,0 +1,42 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+# pylint: disable=E0401 (import-error)
+
+import logging
+import importlib.util
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from rssforward.tracing import trace_span
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# returns name of fastest available parser
+def find_html_parser() -> str:
+    ## C-backed lxml is much faster than pure-Python "html.parser"
+    if importlib.util.find_spec("lxml") is not None:
+        return "lxml"
+    return "html.parser"
+
+
+HTML_PARSER = find_html_parser()
+
+
+def make_soup(content, parse_only: SoupStrainer = None, parser=None) -> BeautifulSoup:
+    """Parse HTML content using fastest available parser.
+
+    'parse_only' allows to parse only matching elements of the document (e.g. SoupStrainer("script")),
+    what saves time and memory on big pages.
+    """
+    if parser is None:
+        parser = HTML_PARSER
+    with trace_span("parse html", "parse", size=len(content)):
+        return BeautifulSoup(content, parser, parse_only=parse_only)
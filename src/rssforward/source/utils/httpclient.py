@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+# pylint: disable=E0401 (import-error)
+
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from rssforward.source.utils.ratelimit import get_rate_limiter
+from rssforward.metrics import HTTP_REQUESTS, HTTP_DURATION, HTTP_RESPONSE_BYTES
+from rssforward.tracing import trace_span
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"
+DEFAULT_TIMEOUT = 30  # seconds
+
+POOL_CONNECTIONS = 16  # number of hosts with kept connections
+POOL_MAXSIZE = 8  # number of kept connections per host
+
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 1.0  # seconds, doubled on each attempt
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+_SESSION: requests.Session = None
+_SESSION_LOCK = threading.Lock()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Adapter sending requests respecting rate limit of host. Retries are done within single request slot."""
+
+    ## arguments are passed unchanged to 'HTTPAdapter.send()' (typed by requests)
+    def send(self, request, *args, **kwargs):  # noqa: ANN002, ANN003 # pylint: disable=W0221
+        host = urlparse(request.url).hostname
+        with get_rate_limiter().limit(request.url), trace_span(f"{request.method} {host}", "http", url=request.url):
+            start_time = time.perf_counter()
+            try:
+                response = super().send(request, *args, **kwargs)
+            except Exception:
+                HTTP_REQUESTS.inc(host, "error")
+                raise
+            if not kwargs.get("stream"):
+                ## body is read anyway by session
+                HTTP_RESPONSE_BYTES.inc(host, value=len(response.content))
+            HTTP_DURATION.observe(time.perf_counter() - start_time, host)
+            HTTP_REQUESTS.inc(host, str(response.status_code))
+            return response
+
+
+def create_session(user_agent=DEFAULT_USER_AGENT) -> requests.Session:
+    """Create session with pool of keep-alive connections and retry policy.
+
+    Requests are throttled by rate limiter shared by all sources.
+    Only idempotent requests (e.g. GET) are retried. Last response is returned
+    if all retries failed, so status code can be checked by the caller.
+    """
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUS,
+        raise_on_status=False,
+    )
+    adapter = RateLimitedAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = user_agent
+    return session
+
+
+# returns session shared by all sources
+def get_session() -> requests.Session:
+    # ruff: noqa: PLW0603
+    global _SESSION  # pylint: disable=W0603
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = create_session()
+        return _SESSION
+
+
+def close_session():
+    global _SESSION  # pylint: disable=W0603
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+
+# 'headers' are added to default headers of session
+def http_get(url, headers=None, params=None, timeout=DEFAULT_TIMEOUT) -> requests.Response:
+    session = get_session()
+    return session.get(url, headers=headers, params=params, timeout=timeout)
+
+
+# 'headers' are added to default headers of session
+def http_post(url, data=None, headers=None, timeout=DEFAULT_TIMEOUT) -> requests.Response:
+    session = get_session()
+    return session.post(url, data=data, headers=headers, timeout=timeout)
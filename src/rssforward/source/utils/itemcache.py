@@ -0,0 +1,111 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import os
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+from rssforward.utils import get_app_datadir, store_object_atomic, load_object_safe
+
+
+_LOGGER = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT")
+
+
+def get_itemcache_dir():
+    data_dir = get_app_datadir()
+    return os.path.join(data_dir, "itemcache")
+
+
+class ItemCache:
+    """Persistent cache of items of generator (e.g. converted details of listed offers).
+
+    Items are identified by key (e.g. item id or URL). Key should change when item changes.
+    Items not accessed since previous 'store()' are removed on store, so the cache contains
+    only items that are still present on source's listing.
+    """
+
+    def __init__(self, name, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = get_itemcache_dir()
+        self.name = name
+        self._cache_path = os.path.join(cache_dir, f"{name}.obj")
+        self._lock = threading.Lock()
+        self._items: dict[str, Any] = None
+        self._accessed: set[str] = set()
+        self._modified = False
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, default=None) -> object:
+        with self._lock:
+            self._load()
+            self._accessed.add(key)
+            value = self._items.get(key)
+            if value is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._load()
+            self._accessed.add(key)
+            self._items[key] = value
+            self._modified = True
+
+    def get_or_create(self, key, create_function: Callable[[], ItemT]) -> ItemT:
+        """Return cached item. If item is not in cache, then create it using given function.
+
+        'None' returned by 'create_function' is not stored, so item creation is repeated on next access.
+        """
+        cached_value = self.get(key)
+        if cached_value is not None:
+            return cast("ItemT", cached_value)
+        value = create_function()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def store(self):
+        """Remove items not accessed since previous call and store cache to file."""
+        with self._lock:
+            self._load()
+            _LOGGER.info(
+                "item cache %s: hits: %s misses: %s items: %s",
+                self.name,
+                self._hits,
+                self._misses,
+                len(self._accessed),
+            )
+            removed_keys = self._items.keys() - self._accessed
+            for key in removed_keys:
+                del self._items[key]
+            if self._modified or removed_keys:
+                store_object_atomic(self._items, self._cache_path)
+            self._accessed = set()
+            self._modified = False
+            self._hits = 0
+            self._misses = 0
+
+    def _load(self):
+        if self._items is not None:
+            return
+        ## corrupted cache file is treated as empty cache
+        self._items = load_object_safe(self._cache_path, {})
+
+
+# return cached item or create it if there is no cache
+def get_cached_item(item_cache: ItemCache, key, create_function: Callable[[], ItemT]) -> ItemT:
+    if item_cache is None:
+        return create_function()
+    return item_cache.get_or_create(key, create_function)
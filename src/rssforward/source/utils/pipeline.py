@@ -0,0 +1,123 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import logging
+import datetime
+from typing import Any
+from collections.abc import Callable
+
+from rssforward.source.utils.itemcache import ItemCache, get_cached_item
+from rssforward.source.utils.workers import map_concurrent
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ListingPipeline:
+    """Listing -> filter -> detail pipeline of job boards.
+
+    Items of listing (cheap metadata) are filtered first: limited to 'items_num' first items,
+    then items older than 'max_age_days' and items already found stale are skipped.
+    Details (expensive page fetch) are fetched concurrently only for remaining items.
+
+    If publish date is known only from details, then stale item is remembered in item cache
+    and its details are not fetched again.
+    """
+
+    def __init__(
+        self,
+        item_cache: ItemCache = None,
+        *,
+        items_num=None,
+        max_age_days=None,
+        workers=1,
+        skip_missing=True,
+    ):
+        self.item_cache = item_cache
+        self.items_num = items_num
+        self.max_age_days = max_age_days
+        self.workers = workers
+        self.skip_missing = skip_missing  # skip items with detail 'None', otherwise returned with 'None' detail
+
+    def run(
+        self,
+        listing: list[Any],
+        get_key: Callable[[Any], str],
+        fetch_detail: Callable[[Any], Any],
+        get_date: Callable[[Any], datetime.datetime] = None,
+        get_detail_date: Callable[[Any], datetime.datetime] = None,
+    ) -> list[tuple[Any, Any]]:
+        """Return list of pairs (listing item, detail) in order of listing.
+
+        'get_date' returns publish date of listing item, 'get_detail_date' returns publish date of detail.
+        Items with detail 'None' are skipped (or returned if 'skip_missing' is disabled). Details are cached
+        in item cache under key of listing item, missing details are not cached (fetched again in next run).
+        """
+        if self.items_num:
+            listing = listing[0 : self.items_num]
+
+        candidates = []
+        skipped_old = 0
+        skipped_seen = 0
+        for item in listing:
+            if get_date is not None and self.is_old(get_date(item)):
+                skipped_old += 1
+                continue
+            if self._is_seen_stale(get_key(item)):
+                skipped_seen += 1
+                continue
+            candidates.append(item)
+
+        _LOGGER.info(
+            "fetching details of %s items, skipped old: %s skipped seen: %s",
+            len(candidates),
+            skipped_old,
+            skipped_seen,
+        )
+
+        def get_detail(item):
+            return get_cached_item(self.item_cache, get_key(item), lambda: fetch_detail(item))
+
+        details = map_concurrent(get_detail, candidates, self.workers)
+
+        ret_list = []
+        for item, detail in zip(candidates, details, strict=True):
+            if detail is None:
+                if not self.skip_missing:
+                    ret_list.append((item, None))
+                continue
+            if get_detail_date is not None and self.is_old(get_detail_date(detail)):
+                ## do not add older items - on job boards refreshed/renewed offers change its ID, so
+                ## the offer would appear again in RSS with original publish date
+                _LOGGER.debug("skipping old item: %s", get_key(item))
+                self._set_stale(get_key(item))
+                continue
+            ret_list.append((item, detail))
+        return ret_list
+
+    def is_old(self, pub_date: datetime.datetime) -> bool:
+        if self.max_age_days is None:
+            return False
+        curr_time = datetime.datetime.now(tz=datetime.timezone.utc)
+        time_diff = curr_time - pub_date
+        diff_days = time_diff.total_seconds() / (60 * 60 * 24)
+        return diff_days > self.max_age_days
+
+    def _is_seen_stale(self, key) -> bool:
+        if self.item_cache is None:
+            return False
+        return self.item_cache.get(get_stale_key(key)) is not None
+
+    def _set_stale(self, key):
+        if self.item_cache is None:
+            return
+        self.item_cache.set(get_stale_key(key), value=True)
+
+
+def get_stale_key(key):
+    return f"stale:{key}"
@@ -0,0 +1,155 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import logging
+import threading
+import time
+import contextlib
+from collections.abc import Iterator
+from urllib.parse import urlparse
+
+from rssforward.configfile import ConfigField
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_RATE = 2.0  # requests per second
+DEFAULT_BURST = 5  # number of requests allowed at once after idle period
+DEFAULT_MAX_INFLIGHT = 4  # number of concurrent requests
+
+
+class HostLimit:
+    """Token bucket limiting rate of requests with limit of concurrent requests.
+
+    Non-positive 'rate' disables rate limiting, non-positive 'max_inflight' disables concurrency limit.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, max_inflight=DEFAULT_MAX_INFLIGHT):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._inflight = None
+        if max_inflight > 0:
+            self._inflight = threading.BoundedSemaphore(max_inflight)
+
+    def acquire(self):
+        """Block until request is allowed."""
+        if self._inflight is not None:
+            ## released in 'release()'
+            self._inflight.acquire()  # pylint: disable=R1732
+        try:
+            self._take_token()
+        except:  # noqa: E722
+            self.release()
+            raise
+
+    def release(self):
+        if self._inflight is not None:
+            self._inflight.release()
+
+    def _take_token(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait_time = (1.0 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+
+class RateLimiter:
+    """Container of limits of hosts.
+
+    'hosts_dict' - dict of host name and dict with optional 'rate', 'burst' and 'maxinflight' values
+    overriding default values. Limit of host is applied to its subdomains as well.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, max_inflight=DEFAULT_MAX_INFLIGHT, hosts_dict=None):
+        self.rate = rate
+        self.burst = burst
+        self.max_inflight = max_inflight
+        self.hosts_dict = {}
+        if hosts_dict:
+            self.hosts_dict = {host.lower(): params for host, params in hosts_dict.items()}
+        self._lock = threading.Lock()
+        self._limits: dict[str, HostLimit] = {}
+
+    @contextlib.contextmanager
+    def limit(self, url) -> Iterator[None]:
+        """Wait until request to given URL is allowed and keep the request slot until exit."""
+        host_limit = self.get_limit(url)
+        host_limit.acquire()
+        try:
+            yield
+        finally:
+            host_limit.release()
+
+    def get_limit(self, url) -> HostLimit:
+        host = urlparse(url).hostname or ""
+        config_host, host_params = self._find_host_params(host)
+        with self._lock:
+            host_limit = self._limits.get(config_host)
+            if host_limit is None:
+                host_limit = HostLimit(
+                    host_params.get(ConfigField.RATELIMIT_RATE.value, self.rate),
+                    host_params.get(ConfigField.RATELIMIT_BURST.value, self.burst),
+                    host_params.get(ConfigField.RATELIMIT_MAXINFLIGHT.value, self.max_inflight),
+                )
+                self._limits[config_host] = host_limit
+            return host_limit
+
+    # returns pair: host (or its parent domain) found in config and its params
+    def _find_host_params(self, host):
+        domain = host.lower()
+        while domain:
+            host_params = self.hosts_dict.get(domain)
+            if host_params is not None:
+                return domain, host_params
+            _sub, _sep, domain = domain.partition(".")
+        return host.lower(), {}
+
+
+_RATE_LIMITER = RateLimiter()
+_RATE_LIMITER_LOCK = threading.Lock()
+
+
+# returns limiter shared by all sources
+def get_rate_limiter() -> RateLimiter:
+    with _RATE_LIMITER_LOCK:
+        return _RATE_LIMITER
+
+
+# 'config_dict' - content of 'ratelimit' section of config file
+def configure_rate_limiter(config_dict: dict):
+    # ruff: noqa: PLW0603
+    global _RATE_LIMITER  # pylint: disable=W0603
+    if config_dict is None:
+        config_dict = {}
+    rate_limiter = RateLimiter(
+        config_dict.get(ConfigField.RATELIMIT_RATE.value, DEFAULT_RATE),
+        config_dict.get(ConfigField.RATELIMIT_BURST.value, DEFAULT_BURST),
+        config_dict.get(ConfigField.RATELIMIT_MAXINFLIGHT.value, DEFAULT_MAX_INFLIGHT),
+        config_dict.get(ConfigField.RATELIMIT_HOST.value),
+    )
+    _LOGGER.info(
+        "rate limit: %s requests/s burst: %s in flight: %s hosts: %s",
+        rate_limiter.rate,
+        rate_limiter.burst,
+        rate_limiter.max_inflight,
+        list(rate_limiter.hosts_dict.keys()),
+    )
+    with _RATE_LIMITER_LOCK:
+        _RATE_LIMITER = rate_limiter
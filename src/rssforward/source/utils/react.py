@@ -9,20 +9,78 @@
 # pylint: disable=E0401 (import-error)
 
 import logging
+import re
 import json
 
+from rssforward.tracing import trace_span
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def extract_data_dict(soup):
-    offer_json_list = soup.select('script[id="__NEXT_DATA__"]')  # some React web pages have this json embedded
-    if len(offer_json_list) < 1:
+SCRIPT_TAG_PATTERN = r"<script\b([^>]*)>"
+SCRIPT_END_PATTERN = r"</script\s*>"
+ATTRIBUTE_REGEX = re.compile(r"""([^\s=/>]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+
+
+# 'content' - HTML page as str or bytes
+def extract_data_dict(content):
+    ## some React web pages have this json embedded
+    data_dict = extract_script_json(content, {"id": "__NEXT_DATA__"})
+    if data_dict is None:
         _LOGGER.warning("unable to find job offer json")
-        return None
+    return data_dict
+
+
+def extract_script_json(content, attrs_dict: dict[str, str], key_list: list[str] = None):
+    """Decode JSON embedded in first script element with given attributes.
+
+    Raw page content is scanned, so DOM of the page is not built. 'content' can be str or bytes
+    (then decoding of whole page is not needed). If 'key_list' is given, then nested value is returned.
+    Returns 'None' if script element or nested value is not found.
+    """
+    with trace_span("extract json", "parse", size=len(content)):
+        script_content = extract_script_content(content, attrs_dict)
+        if script_content is None:
+            return None
+        data_dict = json.loads(script_content)
+    if key_list:
+        return get_nested_dict(data_dict, key_list)
+    return data_dict
+
+
+# returns content of first script element with given attributes
+def extract_script_content(content, attrs_dict: dict[str, str]):
+    is_bytes = isinstance(content, bytes)
+    tag_regex = get_regex(SCRIPT_TAG_PATTERN, is_bytes=is_bytes)
+    for tag_match in tag_regex.finditer(content):
+        attributes_str = tag_match.group(1)
+        if is_bytes:
+            attributes_str = attributes_str.decode("utf-8", errors="replace")
+        if not match_attributes(attributes_str, attrs_dict):
+            continue
+        start_pos = tag_match.end()
+        end_match = get_regex(SCRIPT_END_PATTERN, is_bytes=is_bytes).search(content, start_pos)
+        if end_match is None:
+            return None
+        return content[start_pos : end_match.start()]
+    return None
+
+
+def get_regex(pattern: str, *, is_bytes: bool) -> re.Pattern:
+    ## compiled patterns are cached by 're' module
+    if is_bytes:
+        return re.compile(pattern.encode(), re.IGNORECASE)
+    return re.compile(pattern, re.IGNORECASE)
+
 
-    json_content = offer_json_list[0].string
-    return json.loads(json_content)
+def match_attributes(attributes_str: str, attrs_dict: dict[str, str]) -> bool:
+    tag_attrs = {}
+    for attr_match in ATTRIBUTE_REGEX.finditer(attributes_str):
+        name, *values = attr_match.groups()
+        value = next((item for item in values if item is not None), "")
+        tag_attrs[name.lower()] = value
+    return all(tag_attrs.get(name) == value for name, value in attrs_dict.items())
 
 
 def get_nested_dict(data_dict, key_list):
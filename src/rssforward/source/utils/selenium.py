@@ -7,12 +7,21 @@
 #
 
 import logging
+import threading
+import time
+import contextlib
+from urllib.parse import urlparse
+from collections.abc import Iterator
 
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.firefox.options import Options
 from webdriver_manager.firefox import GeckoDriverManager
 
 from rssforward.utils import read_data, write_data
+from rssforward.source.utils.ratelimit import get_rate_limiter
+from rssforward.metrics import HTTP_REQUESTS, HTTP_DURATION
+from rssforward.tracing import trace_span
 
 
 lib_logger = logging.getLogger("selenium.webdriver")
@@ -56,6 +65,145 @@ def init_selenium_driver(*, headless=True) -> webdriver.Firefox:
 
 
 def selenium_get_content(url: str, *, headless=True):
-    with init_selenium_driver(headless=headless) as driver:
-        driver.get(url)
+    if not headless:
+        with init_selenium_driver(headless=headless) as driver:
+            driver_get(driver, url)
+            return driver.page_source
+
+    with get_driver_pool().checkout() as driver:
+        driver_get(driver, url)
         return driver.page_source
+
+
+# load page respecting rate limit of host
+def driver_get(driver: webdriver.Firefox, url: str):
+    host = urlparse(url).hostname
+    with get_rate_limiter().limit(url), trace_span(f"browser {host}", "http", url=url):
+        start_time = time.perf_counter()
+        try:
+            driver.get(url)
+        except Exception:
+            HTTP_REQUESTS.inc(host, "error")
+            raise
+        ## web driver does not give status code of page
+        HTTP_DURATION.observe(time.perf_counter() - start_time, host)
+        HTTP_REQUESTS.inc(host, "browser")
+
+
+## ======================================================
+
+
+class DriverPool:
+    """Bounded pool of long-lived headless web drivers.
+
+    Drivers are started on demand (up to 'max_size' drivers) and reused by consecutive checkouts.
+    Driver is restarted after loading 'max_pages' pages, when it does not respond or when
+    exception was raised during checkout.
+    """
+
+    class Item:
+        """Driver with number of pages loaded since start of the driver."""
+
+        def __init__(self, driver):
+            self.driver: webdriver.Firefox = driver
+            self.pages = 0
+
+    def __init__(self, max_size=1, max_pages=50):
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self._semaphore = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle: list[DriverPool.Item] = []
+        self._closed = False
+
+    @contextlib.contextmanager
+    def checkout(self) -> Iterator[webdriver.Firefox]:
+        """Borrow driver from the pool. Blocks if all drivers are in use."""
+        with self._semaphore:
+            item = self._acquire()
+            try:
+                yield item.driver
+            except:  # noqa: E722
+                # driver can be in any state (e.g. during page load) - do not reuse it
+                quit_driver(item.driver)
+                raise
+            self._release(item)
+
+    def close(self):
+        """Quit idle drivers. Drivers in use are quit when returned to the pool."""
+        with self._lock:
+            self._closed = True
+            idle_list = self._idle
+            self._idle = []
+        for item in idle_list:
+            quit_driver(item.driver)
+
+    def _acquire(self) -> "DriverPool.Item":
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                item = self._idle.pop()
+            if is_driver_alive(item.driver):
+                return item
+            _LOGGER.warning("web driver not responding - starting new one")
+            quit_driver(item.driver)
+        _LOGGER.info("starting new web driver")
+        driver = init_selenium_driver(headless=True)
+        return DriverPool.Item(driver)
+
+    def _release(self, item: "DriverPool.Item"):
+        item.pages += 1
+        with self._lock:
+            if not self._closed and item.pages < self.max_pages:
+                self._idle.append(item)
+                return
+        _LOGGER.info("quitting web driver after %s pages", item.pages)
+        quit_driver(item.driver)
+
+
+def is_driver_alive(driver: webdriver.Firefox) -> bool:
+    try:
+        _ = driver.current_url
+    except WebDriverException:
+        return False
+    return True
+
+
+def quit_driver(driver: webdriver.Firefox):
+    try:
+        driver.quit()
+    except WebDriverException:
+        _LOGGER.exception("unable to quit web driver")
+
+
+_DRIVER_POOL: DriverPool = None
+_DRIVER_POOL_SIZE = 1  # maximum number of drivers of shared pool
+_DRIVER_POOL_LOCK = threading.Lock()
+
+
+# returns pool shared by all sources
+def get_driver_pool() -> DriverPool:
+    # ruff: noqa: PLW0603
+    global _DRIVER_POOL  # pylint: disable=W0603
+    with _DRIVER_POOL_LOCK:
+        if _DRIVER_POOL is None:
+            _DRIVER_POOL = DriverPool(max_size=_DRIVER_POOL_SIZE)
+        return _DRIVER_POOL
+
+
+# set maximum number of drivers of shared pool, already created pool is closed
+def configure_driver_pool(max_size):
+    global _DRIVER_POOL_SIZE  # pylint: disable=W0603
+    _LOGGER.info("web drivers pool size: %s", max_size)
+    close_driver_pool()
+    with _DRIVER_POOL_LOCK:
+        _DRIVER_POOL_SIZE = max(1, max_size)
+
+
+def close_driver_pool():
+    global _DRIVER_POOL  # pylint: disable=W0603
+    with _DRIVER_POOL_LOCK:
+        if _DRIVER_POOL is not None:
+            _DRIVER_POOL.close()
+            _DRIVER_POOL = None
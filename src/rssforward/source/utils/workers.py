@@ -0,0 +1,29 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import logging
+from typing import Any
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def map_concurrent(function: Callable[[Any], Any], items: Iterable[Any], workers=1) -> list[Any]:
+    """Call 'function' for each item using given number of threads.
+
+    Results are returned in order of items. Exception raised by any call is propagated.
+    """
+    items = list(items)
+    workers = min(workers, len(items))
+    if workers <= 1:
+        return [function(item) for item in items]
+    _LOGGER.debug("processing %s items using %s workers", len(items), workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as executor:
+        return list(executor.map(function, items))
@@ -9,20 +9,20 @@
 # pylint: disable=E0401 (import-error)
 
 import logging
-import time
+from enum import Enum, unique
 import datetime
 
-import random
 from urllib.parse import urljoin
-import requests
 
-from bs4 import BeautifulSoup
-from feedgen.feed import FeedGenerator
-
-from rssforward.utils import normalize_string, write_data
+from rssforward.utils import normalize_string, write_data, calculate_str_hash
 from rssforward.rssgenerator import RSSGenerator
+from rssforward.rss.feedwriter import FeedWriter
 from rssforward.rss.utils import init_feed_gen, dumps_feed_gen, add_data_to_feed
+from rssforward.source.utils.httpclient import http_get
 from rssforward.source.utils.htmlbuild import convert_line, convert_list, convert_title, convert_content
+from rssforward.source.utils.itemcache import ItemCache, get_cached_item
+from rssforward.source.utils.workers import map_concurrent
+from rssforward.source.utils.htmlparser import make_soup
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,28 +32,48 @@ MAIN_NAME = "waw4free.pl"
 MAIN_URL = "https://waw4free.pl/"
 
 
+@unique
+class ParamsField(Enum):
+    WORKERS = "workers"
+
+
 class Waw4FreeGenerator(RSSGenerator):
+    def __init__(self, params_dict=None):
+        super().__init__()
+        self.params = {}
+        if params_dict:
+            self.params = params_dict.copy()
+        self.workers = self.params.get(ParamsField.WORKERS.value, 1)
+        self.item_cache = ItemCache("waw4free")
 
     def authenticate(self, _login, _password):
         return True
 
     def generate(self) -> dict[str, str]:
         _LOGGER.info("========== running %s scraper ==========", MAIN_NAME)
-        content = get_content()
+        content = get_content(item_cache=self.item_cache, workers=self.workers)
+        self.item_cache.store()
         return {"news.xml": content}
 
 
-def get_content(items_num=20):
-    news_links = get_news_links(items_num, throw=False)
-    if not news_links:
+def get_content(items_num=20, item_cache=None, workers=1):
+    news_items = get_news_items(items_num, throw=False)
+    if not news_items:
         return None
 
-    feed_gen: FeedGenerator = init_feed_gen(MAIN_URL)
+    feed_gen: FeedWriter = init_feed_gen(MAIN_URL)
     feed_gen.title(MAIN_NAME)
     feed_gen.description(MAIN_NAME)
 
-    for full_url in news_links:
-        add_news(feed_gen, full_url)
+    news_data = map_concurrent(
+        lambda news_item: get_news_data(news_item[0], item_key=news_item[1], item_cache=item_cache),
+        news_items,
+        workers,
+    )
+    for offer_data in news_data:
+        if not offer_data:
+            continue
+        add_data_to_feed(feed_gen, offer_data)
 
     try:
         content = dumps_feed_gen(feed_gen)
@@ -65,9 +85,16 @@ def get_content(items_num=20):
 
 
 def get_news_links(posts_num, *, throw=True):
-    headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-    response = requests.get("https://waw4free.pl/", headers=headers, timeout=10)
-    # response = requests.get("https://waw4free.pl/?wydarzenia=dzisiaj&kolejne_dni=tak", headers=headers, timeout=10)
+    news_items = get_news_items(posts_num, throw=throw)
+    if news_items is None:
+        return None
+    return [full_url for full_url, _item_key in news_items]
+
+
+# returns list of pairs: (url, key identifying state of item on the list)
+def get_news_items(posts_num, *, throw=True):
+    response = http_get("https://waw4free.pl/", timeout=10)
+    # response = http_get("https://waw4free.pl/?wydarzenia=dzisiaj&kolejne_dni=tak", timeout=10)
 
     if response.status_code not in (200, 204):
         if throw:
@@ -79,7 +106,7 @@ def get_news_links(posts_num, *, throw=True):
     content = content_bytes.decode("utf-8")
     write_data("/tmp/waw4free.html", content)
 
-    soup = BeautifulSoup(content, "html.parser")
+    soup = make_soup(content)
 
     full_list = []
     articles_list = soup.find_all("div", attrs={"class": "box"})
@@ -108,25 +135,30 @@ def get_news_links(posts_num, *, throw=True):
             _LOGGER.debug("skipping autopromocja item: %s", full_url)
             continue
         _LOGGER.debug("found item: %s", full_url)
-        full_list.append(full_url)
+        item_key = f"{full_url}_{calculate_str_hash(str(article))}"
+        full_list.append((full_url, item_key))
 
     items_num = min(posts_num, len(full_list))
     return full_list[0:items_num]
 
 
-def add_news(feed_gen, full_url):
-    offer_data = extract_news_data(full_url)
+def add_news(feed_gen, full_url, item_key=None, item_cache=None):
+    offer_data = get_news_data(full_url, item_key=item_key, item_cache=item_cache)
     if not offer_data:
         return
     add_data_to_feed(feed_gen, offer_data)
 
 
+def get_news_data(full_url, item_key=None, item_cache=None):
+    if item_key is None:
+        item_key = full_url
+    return get_cached_item(item_cache, item_key, lambda: extract_news_data(full_url))
+
+
 def extract_news_data(news_url=None, content=None):
-    # sleep_random(3)
     if news_url is not None:
         _LOGGER.info("getting offer details: %s", news_url)
-        headers = {"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/116.0"}
-        response = requests.get(news_url, headers=headers, timeout=10)
+        response = http_get(news_url, timeout=10)
 
         if response.status_code not in (200, 204):
             _LOGGER.warning("unable to get job offer content")
@@ -135,7 +167,7 @@ def extract_news_data(news_url=None, content=None):
         content = response.content
         content = content.decode("utf-8")
 
-    soup = BeautifulSoup(content, "html.parser")
+    soup = make_soup(content)
 
     id_value = news_url.rsplit("/", 1)[-1]
 
@@ -291,14 +323,8 @@ def convert_model(model_data):
     return f"<div>unhandled model type: {model_type}<br/>{model_data}</div>\n"
 
 
-def sleep_random(max_seconds):
-    # ruff: noqa: S311
-    rand_secs = random.randint(1, max_seconds)  # nosec
-    time.sleep(rand_secs)
-
-
 # ============================================================
 
 
-def get_generator(_gen_params=None) -> RSSGenerator:
-    return Waw4FreeGenerator()
+def get_generator(gen_params=None) -> RSSGenerator:
+    return Waw4FreeGenerator(gen_params)
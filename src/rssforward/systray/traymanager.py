@@ -16,6 +16,12 @@ from PIL import Image
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+RED_ICON = "rss-forward-red-64.png"
+YELLOW_ICON = "rss-forward-yellow-64.png"
+GREEN_ICON = "rss-forward-green-64.png"
+BLUE_ICON = "rss-forward-blue-64.png"
+GRAY_ICON = "rss-gray-64.png"
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,8 +29,9 @@ logging.getLogger("PIL.PngImagePlugin").setLevel(logging.WARNING)
 
 
 class TrayManager:
-    def __init__(self, *, server_state=True):
+    def __init__(self, *, server_state=True, trace_state=False):
         self._server_state: bool = server_state
+        self._trace_state: bool = trace_state
         ## new_state values:
         ##    - negative - invalid
         ##    - 0 - in progress
@@ -33,12 +40,10 @@ class TrayManager:
         self.server_callback = None
         self.refresh_callback = None
         self.open_log_callback = None
+        self.trace_callback = None
 
-        self.red_icon_image = load_icon("rss-forward-red-64.png")
-        self.yellow_icon_image = load_icon("rss-forward-yellow-64.png")
-        self.green_icon_image = load_icon("rss-forward-green-64.png")
-        self.blue_icon_image = load_icon("rss-forward-blue-64.png")
-        self.gray_icon_image = load_icon("rss-gray-64.png")
+        ## icons are loaded on first use
+        self._icons_dict: dict[str, Image.Image] = {}
 
         rss_server_item = pystray.MenuItem(
             "Run RSS Server",
@@ -47,10 +52,15 @@ class TrayManager:
         )
 
         rss_refresh_item = pystray.MenuItem("Refresh RSS", self._on_refresh_clicked)
+        trace_item = pystray.MenuItem(
+            "Trace generation",
+            self._on_trace_clicked,
+            checked=lambda _item: self._trace_state,
+        )
         open_log_item = pystray.MenuItem("Open log", self._on_open_log_clicked)
         quit_item = pystray.MenuItem("Quit", self._on_quit_clicked)
 
-        menu = pystray.Menu(rss_server_item, rss_refresh_item, open_log_item, quit_item)
+        menu = pystray.Menu(rss_server_item, rss_refresh_item, trace_item, open_log_item, quit_item)
 
         self.tray_icon = pystray.Icon(name="rss-forward", title="RSS Forward", menu=menu)
         self._set_icon()
@@ -76,8 +86,6 @@ class TrayManager:
             self._valid_state = -1
         self._set_icon()
 
-    ##self.yellow_icon_image
-
     # ruff: noqa: FBT001
     def set_valid(self, new_state: bool):
         self.is_error = not new_state
@@ -93,18 +101,25 @@ class TrayManager:
     def _set_icon(self):
         if self._valid_state < 0:
             _LOGGER.info("error detected - setting red icon")
-            self.tray_icon.icon = self.red_icon_image
+            self.tray_icon.icon = self._get_icon(RED_ICON)
             return
         if self._valid_state == 0:
             _LOGGER.info("in progress - setting yellow icon")
-            self.tray_icon.icon = self.yellow_icon_image
+            self.tray_icon.icon = self._get_icon(YELLOW_ICON)
             return
         if self._server_state:
             _LOGGER.info("server operational - setting blue icon")
-            self.tray_icon.icon = self.blue_icon_image
+            self.tray_icon.icon = self._get_icon(BLUE_ICON)
         else:
             _LOGGER.info("server disabled - setting green icon")
-            self.tray_icon.icon = self.green_icon_image
+            self.tray_icon.icon = self._get_icon(GREEN_ICON)
+
+    def _get_icon(self, icon_name):
+        icon_image = self._icons_dict.get(icon_name)
+        if icon_image is None:
+            icon_image = load_icon(icon_name)
+            self._icons_dict[icon_name] = icon_image
+        return icon_image
 
     def run_loop(self):
         """Execute event loop. Method have to be executed from main thread."""
@@ -125,6 +140,10 @@ class TrayManager:
     def set_open_log_callback(self, callback):
         self.open_log_callback = callback
 
+    # set callback for enable/disable tracing of generation
+    def set_trace_callback(self, callback):
+        self.trace_callback = callback
+
     # =================================================
 
     def _on_rss_server_clicked(self, _icon, item):  # pylint: disable=W0613
@@ -145,6 +164,14 @@ class TrayManager:
             return
         self.refresh_callback()
 
+    def _on_trace_clicked(self, _icon, item):  # pylint: disable=W0613
+        self._trace_state = not item.checked
+        _LOGGER.info("trace clicked to state %s", self._trace_state)
+        if self.trace_callback is None:
+            _LOGGER.info("trace callback not set")
+            return
+        self.trace_callback(self._trace_state)
+
     def _on_open_log_clicked(self, _icon, _item):  # pylint: disable=W0613
         _LOGGER.info("open log clicked")
         # icon.notify("refresh clicked")
@@ -0,0 +1,151 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import os
+import logging
+import threading
+import time
+import json
+import datetime
+import contextlib
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+TRACES_SUBDIR = "traces"
+TRACE_FILES_LIMIT = 20  # number of kept trace files (older are removed)
+
+
+class Tracer:
+    """Recorder of spans of generation cycle.
+
+    Spans are recorded only if tracing was enabled when cycle begun. Spans of the cycle
+    are dumped to file in Chrome trace format (viewable in 'chrome://tracing' or Perfetto).
+    """
+
+    def __init__(self, output_dir=None, *, enabled=False):
+        self.output_dir = output_dir
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._recording = False
+        self._start_time = 0
+        self._events: list[dict] = []
+        self._threads: dict[int, str] = {}
+
+    @property
+    def recording(self) -> bool:
+        return self._recording
+
+    def begin_cycle(self):
+        with self._lock:
+            self._recording = self.enabled
+            self._events = []
+            self._threads = {}
+            self._start_time = time.perf_counter_ns()
+
+    # returns path to trace file or 'None' if cycle was not recorded
+    def end_cycle(self):
+        with self._lock:
+            if not self._recording:
+                return None
+            self._recording = False
+            events = self._events
+            threads = self._threads
+            self._events = []
+            self._threads = {}
+
+        pid = os.getpid()
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        for event in events:
+            event["pid"] = pid
+        trace_data = {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+        return self._store(trace_data)
+
+    @contextlib.contextmanager
+    def span(self, name, category="", **args: object):
+        if not self._recording:
+            yield
+            return
+        start_time = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end_time = time.perf_counter_ns()
+            self._add_event(name, category, start_time, end_time, args)
+
+    def _add_event(self, name, category, start_time, end_time, args):
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_time - self._start_time) / 1000,  # microseconds
+            "dur": (end_time - start_time) / 1000,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        with self._lock:
+            if not self._recording:
+                return
+            self._events.append(event)
+            self._threads[thread.ident] = thread.name
+
+    def _store(self, trace_data):
+        if not self.output_dir:
+            _LOGGER.warning("unable to store trace - output directory not set")
+            return None
+        os.makedirs(self.output_dir, exist_ok=True)
+        time_string = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")  # noqa: DTZ005
+        trace_path = os.path.join(self.output_dir, f"trace-{time_string}.json")
+        with open(trace_path, "w", encoding="utf-8") as trace_file:
+            json.dump(trace_data, trace_file)
+        _LOGGER.info("generation trace stored to: %s", trace_path)
+        remove_old_traces(self.output_dir)
+        return trace_path
+
+
+def remove_old_traces(traces_dir, limit=TRACE_FILES_LIMIT):
+    files_list = [name for name in os.listdir(traces_dir) if name.startswith("trace-") and name.endswith(".json")]
+    files_list.sort()
+    for name in files_list[:-limit]:
+        os.remove(os.path.join(traces_dir, name))
+
+
+## ============================================================
+
+
+_TRACER = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _TRACER
+
+
+def configure_tracing(enabled, log_dir=None):
+    if log_dir:
+        _TRACER.output_dir = os.path.join(log_dir, TRACES_SUBDIR)
+    set_tracing_enabled(enabled)
+
+
+def set_tracing_enabled(enabled):
+    _TRACER.enabled = bool(enabled)
+    _LOGGER.info("tracing of generation enabled: %s, traces dir: %s", _TRACER.enabled, _TRACER.output_dir)
+
+
+def is_tracing_enabled() -> bool:
+    return _TRACER.enabled
+
+
+## record span of code executed within context
+def trace_span(name, category="", **args: object):
+    return _TRACER.span(name, category, **args)
@@ -11,15 +11,19 @@ import logging
 import datetime
 from collections.abc import Iterable
 import hashlib
+import gzip
+import tempfile
 import re
-import json
 import base64
 import html
-import pytz
+import pickle  # nosec
 
 from appdirs import user_data_dir
 
 import rssforward.persist
+import rssforward.dateparse
+from rssforward.dateparse import DateFormat, parse_date, parse_date_format
+from rssforward.hashing import calculate_data_hash
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -57,79 +61,71 @@ def save_recent_date(recent_datetime):
     rssforward.persist.store_object_simple(recent_datetime, recentdate_path)
 
 
-def string_to_date_general(date_string) -> datetime.datetime:
-    try:
-        return string_to_date(date_string)
-    except ValueError:
-        pass
+def get_feeddigests_path():
+    data_dir = get_app_datadir()
+    return os.path.join(data_dir, "feeddigests.obj")
+
+
+# returns dict: feed path -> digest of recently written content
+def read_feed_digests() -> dict[str, str]:
+    feeddigests_path = get_feeddigests_path()
+    return load_object_safe(feeddigests_path, {})
+
+
+def save_feed_digests(digests_dict: dict[str, str]):
+    feeddigests_path = get_feeddigests_path()
+    store_object_atomic(digests_dict, feeddigests_path)
 
+
+def string_to_date_general(date_string) -> datetime.datetime:
     try:
-        datetime_obj = datetime.datetime.fromisoformat(date_string)
-        return add_timezone(datetime_obj)
+        return parse_date(date_string)
     except ValueError:
         _LOGGER.error("unable to convert string '%s' to datetime", date_string)
         raise
 
 
 def timestamp_to_date(timestamp) -> datetime.datetime:
-    item_date = datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
-    tz_info = pytz.timezone("Europe/Warsaw")
-    return item_date.astimezone(tz=tz_info)
+    return rssforward.dateparse.timestamp_to_date(timestamp)
 
 
 # iso format: '2024-06-04T14:23:41Z'
 def stringiso_to_date(datetime_string) -> datetime.datetime:
-    item_date = datetime.datetime.fromisoformat(datetime_string)
-    return add_timezone(item_date)
+    return parse_date_format(datetime_string, DateFormat.ISO)
 
 
-# handled format: 2024-06-04T14:23:41.077Z
+# handled format: 2024-06-04T14:23:41Z
 def stringiso2_to_date(datetime_string) -> datetime.datetime:
-    item_date = datetime.datetime.strptime(datetime_string, "%Y-%m-%dT%H:%M:%SZ")
-    return add_timezone(item_date)
+    return parse_date_format(datetime_string, DateFormat.ISO_Z)
 
 
 # handled format: 2024-06-04T14:23:41.077Z
 def stringisoz_to_date(datetime_string) -> datetime.datetime:
-    item_date = datetime.datetime.strptime(datetime_string, "%Y-%m-%dT%H:%M:%S.%fZ")
-    return add_timezone(item_date)
+    return parse_date_format(datetime_string, DateFormat.ISO_FRACTION_Z)
 
 
 def stringisoauto_to_date(datetime_string) -> datetime.datetime:
-    try:
-        return stringiso2_to_date(datetime_string)
-    except ValueError:
-        pass
-    try:
-        return stringisoz_to_date(datetime_string)
-    except ValueError:
-        pass
-    return stringiso_to_date(datetime_string)
+    return parse_date(datetime_string)
 
 
 def string_to_date(date_string) -> datetime.datetime:
-    item_date = datetime.datetime.strptime(date_string, "%Y-%m-%d")
-    return add_timezone(item_date)
+    return parse_date_format(date_string, DateFormat.DATE)
 
 
 def string2_to_date(date_string) -> datetime.datetime:
-    item_date = datetime.datetime.strptime(date_string, "%d.%m.%Y")
-    return add_timezone(item_date)
+    return parse_date_format(date_string, DateFormat.DATE_DOTS)
 
 
 def string_to_datetime(datetime_string) -> datetime.datetime:
-    item_date = datetime.datetime.strptime(datetime_string, "%Y-%m-%d %H:%M:%S")
-    return add_timezone(item_date)
+    return parse_date_format(datetime_string, DateFormat.DATETIME)
 
 
 def string_to_datetime_hm(datetime_string) -> datetime.datetime:
-    item_date = datetime.datetime.strptime(datetime_string, "%Y-%m-%d %H:%M")
-    return add_timezone(item_date)
+    return parse_date_format(datetime_string, DateFormat.DATETIME_HM)
 
 
 def add_timezone(dt: datetime.datetime) -> datetime.datetime:
-    tz_info = pytz.timezone("Europe/Warsaw")
-    return tz_info.localize(dt)
+    return rssforward.dateparse.add_timezone(dt)
 
 
 def convert_to_html(content: str, *, preserve_newline=False) -> str:
@@ -164,15 +160,66 @@ def write_data(file_path, content):
         fp.write(content)
 
 
+# write content to temporary file and then replace destination file
+# readers see either old or new content, never partially written file
+def write_data_atomic(file_path, content):
+    write_bytes_atomic(file_path, content.encode("utf-8"))
+
+
+def write_bytes_atomic(file_path, data_bytes: bytes):
+    file_dir = os.path.dirname(os.path.abspath(file_path))
+    file_name = os.path.basename(file_path)
+    tmp_fd, tmp_path = tempfile.mkstemp(prefix=f".{file_name}.", suffix=".tmp", dir=file_dir)
+    try:
+        with os.fdopen(tmp_fd, "wb") as fp:
+            fp.write(data_bytes)
+        os.chmod(tmp_path, 0o644)  # noqa: S103
+        os.replace(tmp_path, file_path)
+    except:  # noqa: E722
+        os.remove(tmp_path)
+        raise
+
+
+# pickle object to file - interrupted write does not leave partially written file
+def store_object_atomic(input_object, output_file):
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    write_bytes_atomic(output_file, pickle.dumps(input_object))
+
+
+# load pickled object, returns default value if file does not exist or is corrupted
+def load_object_safe(input_file, default_value=None):
+    try:
+        return rssforward.persist.load_object_simple(input_file, default_value, silent=True)
+    except (pickle.UnpicklingError, EOFError, ValueError, TypeError, IndexError, ImportError) as exc:
+        _LOGGER.warning("unable to load corrupted file %s, reason: %s", input_file, exc)
+        return default_value
+
+
+# compress with gzip - output is deterministic (no timestamp in gzip header)
+def compress_str(content: str) -> bytes:
+    return gzip.compress(content.encode("utf-8"), mtime=0)
+
+
+# write gzip compressed content - output is deterministic (no timestamp in gzip header)
+# returns compressed data
+def write_gzip_data(file_path, content) -> bytes:
+    data_bytes = compress_str(content)
+    write_bytes_atomic(file_path, data_bytes)
+    return data_bytes
+
+
 def calculate_str_hash(content: str):
     data_bytes = content.encode("utf-8")
+    return calculate_bytes_hash(data_bytes)
+
+
+def calculate_bytes_hash(data_bytes: bytes):
     # ruff: noqa: S324
     return hashlib.md5(data_bytes).hexdigest()  # nosec
 
 
 def calculate_dict_hash(data_dict):
-    data_str = json.dumps(data_dict, sort_keys=True)
-    return calculate_str_hash(data_str)
+    return calculate_data_hash(data_dict)
 
 
 def prepare_filename(name: str):
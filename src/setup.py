@@ -35,6 +35,9 @@ additional_scripts = ["startrssforward.py"]
 requirements_path = os.path.join(SCRIPT_DIR, "requirements.txt")
 install_reqs = read_list(requirements_path)
 
+## optional packages speeding up the application, installed by: pip3 install "./src[fast]"
+extras_reqs = {"fast": read_list(os.path.join(SCRIPT_DIR, "requirements-fast.txt"))}
+
 ## every time setup info changes then version number should be increased
 
 setup(
@@ -48,4 +51,5 @@ setup(
     package_data=packages_data,
     scripts=additional_scripts,
     install_requires=install_reqs,
+    extras_require=extras_reqs,
 )
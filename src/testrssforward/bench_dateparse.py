@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import contextlib
+
+with contextlib.suppress(ImportError):
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=E0401,W0611
+    # ruff: noqa: F401
+    import __init__
+
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+
+import logging
+import datetime
+import timeit
+
+import pytz
+
+from rssforward import logger
+from rssforward.dateparse import (
+    DateFormat,
+    parse_date,
+    parse_date_format,
+    parse_dates,
+    timestamp_to_date,
+    clear_parsed_dates,
+)
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+REPEATS = 5
+ITEMS_NUM = 1000
+
+
+## implementation of 'rssforward.utils' before introducing 'dateparse' module
+def legacy_add_timezone(dt):
+    tz_info = pytz.timezone("Europe/Warsaw")
+    return tz_info.localize(dt)
+
+
+def legacy_timestamp_to_date(timestamp):
+    item_date = datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+    tz_info = pytz.timezone("Europe/Warsaw")
+    return item_date.astimezone(tz=tz_info)
+
+
+def legacy_string_to_date(date_string):
+    item_date = datetime.datetime.strptime(date_string, "%Y-%m-%d")
+    return legacy_add_timezone(item_date)
+
+
+def legacy_stringisoauto_to_date(datetime_string):
+    try:
+        item_date = datetime.datetime.strptime(datetime_string, "%Y-%m-%dT%H:%M:%SZ")
+        return legacy_add_timezone(item_date)
+    except ValueError:
+        pass
+    try:
+        item_date = datetime.datetime.strptime(datetime_string, "%Y-%m-%dT%H:%M:%S.%fZ")
+        return legacy_add_timezone(item_date)
+    except ValueError:
+        pass
+    item_date = datetime.datetime.fromisoformat(datetime_string)
+    return legacy_add_timezone(item_date)
+
+
+## parsed dates cache is cleared before each repeat, so the measurement shows cost of first generation cycle
+def measure(label, function, items_list):
+    durations = timeit.repeat(
+        lambda: [function(item) for item in items_list],
+        setup=clear_parsed_dates,
+        number=1,
+        repeat=REPEATS,
+    )
+    duration = min(durations) / len(items_list)
+    _LOGGER.info("%s: %.2f us per item", label, duration * 1000000)
+    return duration
+
+
+def measure_pair(label, legacy_function, function, items_list):
+    legacy_time = measure(f"{label} legacy", legacy_function, items_list)
+    new_time = measure(f"{label} dateparse", function, items_list)
+    _LOGGER.info("%s speedup: %.2fx", label, legacy_time / new_time)
+
+
+def main():
+    logger.configure_console()
+
+    ## naive date, so formatted strings do not contain zone (as in parsed listings)
+    start_date = datetime.datetime(2024, 1, 1, 8, 30, 15, 77000)  # noqa: DTZ001
+    dates_list = [start_date + datetime.timedelta(hours=index * 7) for index in range(ITEMS_NUM)]
+    timestamps_list = [item.timestamp() for item in dates_list]
+    date_strings = [item.strftime("%Y-%m-%d") for item in dates_list]
+    iso_z_strings = [item.strftime("%Y-%m-%dT%H:%M:%SZ") for item in dates_list]
+    iso_fraction_strings = [item.isoformat(timespec="milliseconds") + "Z" for item in dates_list]
+    iso_strings = [item.isoformat() for item in dates_list]
+
+    measure_pair("timestamp", legacy_timestamp_to_date, timestamp_to_date, timestamps_list)
+    measure_pair("date", legacy_string_to_date, lambda item: parse_date_format(item, DateFormat.DATE), date_strings)
+    measure_pair("auto iso Z", legacy_stringisoauto_to_date, parse_date, iso_z_strings)
+    measure_pair("auto iso fraction Z", legacy_stringisoauto_to_date, parse_date, iso_fraction_strings)
+    measure_pair("auto iso", legacy_stringisoauto_to_date, parse_date, iso_strings)
+
+    ## whole listing at once
+    legacy_time = min(timeit.repeat(lambda: [legacy_string_to_date(item) for item in date_strings], number=1))
+    bulk_time = min(timeit.repeat(lambda: parse_dates(date_strings), setup=clear_parsed_dates, number=1))
+    _LOGGER.info(
+        "bulk listing of %s dates: legacy: %.2f ms bulk: %.2f ms",
+        ITEMS_NUM,
+        legacy_time * 1000,
+        bulk_time * 1000,
+    )
+    _LOGGER.info("bulk speedup: %.2fx", legacy_time / bulk_time)
+
+    ## next generation cycle reads mostly the same listing
+    cached_time = min(timeit.repeat(lambda: parse_dates(date_strings), number=1))
+    _LOGGER.info("bulk listing of %s dates in next cycle: %.2f ms", ITEMS_NUM, cached_time * 1000)
+    _LOGGER.info("next cycle speedup: %.2fx", legacy_time / cached_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+"""Benchmark of generators against recorded responses.
+
+Record fixtures of generators enabled in config file (requires network and authentication):
+    bench_generators.py -c config.toml --record
+
+Execute generators against recorded fixtures 10 times:
+    bench_generators.py -c config.toml -n 10 --output results.json
+"""
+
+import contextlib
+
+with contextlib.suppress(ImportError):
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=E0401,W0611
+    # ruff: noqa: F401
+    import __init__
+
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+
+import os
+import sys
+import logging
+import argparse
+import json
+import math
+import time
+import tempfile
+import tracemalloc
+from collections import Counter
+
+from testrssforward.replay import record_responses, replay_responses
+
+from rssforward import logger
+from rssforward.utils import get_app_datadir
+from rssforward.configfile import load_config, ConfigField, ConfigKey
+from rssforward.rssmanager import get_generator, get_auth_data
+from rssforward.rssgenerator import RSSGenerator
+from rssforward.source.utils.ratelimit import configure_rate_limiter
+from rssforward.source.registry import load_generator_module
+from rssforward.dateparse import clear_parsed_dates
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+REPLAY_LOGIN = "replay"
+
+
+## run generator with application data in temporary directory (empty item caches, no recent dates)
+@contextlib.contextmanager
+def temporary_datadir():
+    prev_value = os.environ.get("XDG_DATA_HOME")
+    with tempfile.TemporaryDirectory(prefix="rssforward-bench-") as data_dir:
+        os.environ["XDG_DATA_HOME"] = data_dir
+        try:
+            yield data_dir
+        finally:
+            if prev_value is None:
+                del os.environ["XDG_DATA_HOME"]
+            else:
+                os.environ["XDG_DATA_HOME"] = prev_value
+
+
+## functions of generator module are patched when recording/replaying, so module has to be loaded before
+def import_generator_module(gen_id):
+    load_generator_module(gen_id)
+
+
+# returns pair: generated data and duration of generation in seconds
+def run_generator(gen_id, gen_params, login, password):
+    generator: RSSGenerator = get_generator(gen_id, gen_params)
+    if generator is None:
+        message = f"unable to get generator {gen_id}"
+        raise RuntimeError(message)
+    try:
+        generator.authenticate(login, password)
+        start_time = time.perf_counter()
+        gen_data = generator.generate()
+        return gen_data, time.perf_counter() - start_time
+    finally:
+        generator.close()
+
+
+def record_generator(gen_id, gen_item, fixtures_dir):
+    _LOGGER.info("recording responses of generator %s to: %s", gen_id, fixtures_dir)
+    gen_params = gen_item.get(ConfigField.GEN_PARAMS.value, {})
+    login, password = get_auth_data(gen_item.get(ConfigKey.AUTH.value, {}))
+    with temporary_datadir(), record_responses(fixtures_dir) as fixture_store:
+        gen_data, duration = run_generator(gen_id, gen_params, login, password)
+    _LOGGER.info("generator %s recorded in %.2f s, requests: %s", gen_id, duration, dict(fixture_store.counters))
+    if not gen_data:
+        _LOGGER.warning("generator %s did not generate any data", gen_id)
+
+
+def replay_generator(gen_id, gen_item, fixtures_dir):
+    gen_params = gen_item.get(ConfigField.GEN_PARAMS.value, {})
+    ## every run starts with empty in-memory caches
+    clear_parsed_dates()
+    with temporary_datadir(), replay_responses(fixtures_dir) as fixture_store:
+        gen_data, duration = run_generator(gen_id, gen_params, REPLAY_LOGIN, REPLAY_LOGIN)
+    return gen_data, duration, fixture_store.counters
+
+
+def bench_generator(gen_id, gen_item, fixtures_dir, runs_num):
+    _LOGGER.info("benchmarking generator %s using: %s", gen_id, fixtures_dir)
+    durations = []
+    counters: Counter = Counter()
+    gen_data = None
+    for _ in range(runs_num):
+        gen_data, duration, counters = replay_generator(gen_id, gen_item, fixtures_dir)
+        durations.append(duration)
+
+    ## memory is measured in separate run - tracing slows down execution
+    tracemalloc.start()
+    try:
+        replay_generator(gen_id, gen_item, fixtures_dir)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "generator": gen_id,
+        "runs": runs_num,
+        "p50": percentile(durations, 50),
+        "p95": percentile(durations, 95),
+        "peak_memory": peak_memory,
+        "requests": dict(counters),
+        "feeds": len(gen_data) if gen_data else 0,
+    }
+
+
+def percentile(values_list, percent):
+    sorted_list = sorted(values_list)
+    index = math.ceil(percent / 100 * len(sorted_list)) - 1
+    return sorted_list[max(0, index)]
+
+
+def print_results(results_list):
+    _LOGGER.info("%-16s %10s %10s %12s %6s  %s", "generator", "p50 [ms]", "p95 [ms]", "peak [MiB]", "feeds", "requests")
+    for result in results_list:
+        requests_info = ", ".join(f"{key}: {value}" for key, value in sorted(result["requests"].items()))
+        _LOGGER.info(
+            "%-16s %10.2f %10.2f %12.2f %6s  %s",
+            result["generator"],
+            result["p50"] * 1000,
+            result["p95"] * 1000,
+            result["peak_memory"] / (1024 * 1024),
+            result["feeds"],
+            requests_info,
+        )
+
+
+# returns list of pairs: fixtures name and config item of generator
+def get_generators_items(config_dict, generator_id=None):
+    ret_list = []
+    names_counter: Counter = Counter()
+    for gen_item in config_dict.get(ConfigKey.GENITEM.value, []):
+        gen_id = gen_item.get(ConfigField.GEN_ID.value)
+        if not gen_id or not gen_item.get(ConfigField.ENABLED.value, True):
+            continue
+        if generator_id is not None and gen_id != generator_id:
+            continue
+        ## the same generator can be configured multiple times
+        fixtures_name = gen_id
+        if names_counter[gen_id] > 0:
+            fixtures_name = f"{gen_id}-{names_counter[gen_id]}"
+        names_counter[gen_id] += 1
+        ret_list.append((fixtures_name, gen_item))
+    return ret_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark of generators against recorded responses")
+    parser.add_argument("-c", "--config", action="store", required=True, help="Path to config file")
+    parser.add_argument("--record", action="store_true", help="Record responses of live sites")
+    parser.add_argument(
+        "--fixtures",
+        action="store",
+        default=os.path.join(get_app_datadir(), "fixtures"),
+        help="Directory of recorded responses (default: %(default)s)",
+    )
+    parser.add_argument("-n", "--runs", action="store", type=int, default=5, help="Number of runs of each generator")
+    parser.add_argument("--generator", action="store", default=None, help="Benchmark only generator with given id")
+    parser.add_argument("--output", action="store", default=None, help="Path to JSON file to store results")
+
+    args = parser.parse_args()
+
+    logger.configure_console()
+
+    config_dict = load_config(args.config)
+    if not config_dict:
+        _LOGGER.error("unable to load config file: %s", args.config)
+        return 1
+
+    generators_list = get_generators_items(config_dict, args.generator)
+    if not generators_list:
+        _LOGGER.error("no generators to execute")
+        return 1
+
+    if args.record:
+        configure_rate_limiter(config_dict.get(ConfigKey.RATELIMIT.value))
+        for fixtures_name, gen_item in generators_list:
+            gen_id = gen_item.get(ConfigField.GEN_ID.value)
+            import_generator_module(gen_id)
+            try:
+                record_generator(gen_id, gen_item, os.path.join(args.fixtures, fixtures_name))
+            except Exception:  # pylint: disable=W0703
+                _LOGGER.exception("exception raised during execution of generator %s", gen_id)
+        return 0
+
+    results_list = []
+    for fixtures_name, gen_item in generators_list:
+        gen_id = gen_item.get(ConfigField.GEN_ID.value)
+        fixtures_dir = os.path.join(args.fixtures, fixtures_name)
+        if not os.path.isdir(fixtures_dir):
+            _LOGGER.warning("no recorded responses of generator %s in: %s", gen_id, fixtures_dir)
+            continue
+        import_generator_module(gen_id)
+        try:
+            result = bench_generator(gen_id, gen_item, fixtures_dir, args.runs)
+        except Exception:  # pylint: disable=W0703
+            _LOGGER.exception("exception raised during execution of generator %s", gen_id)
+            continue
+        result["generator"] = fixtures_name
+        results_list.append(result)
+
+    print_results(results_list)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out_file:
+            json.dump(results_list, out_file, indent=4)
+        _LOGGER.info("results stored to: %s", args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
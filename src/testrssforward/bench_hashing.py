@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import contextlib
+
+with contextlib.suppress(ImportError):
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=E0401,W0611
+    # ruff: noqa: F401
+    import __init__
+
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+
+import logging
+import json
+import hashlib
+import timeit
+
+from rssforward import logger
+from rssforward.hashing import HashMode, calculate_data_hash
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+REPEATS = 5
+ITEMS_NUM = 2000
+
+
+## implementation of 'calculate_dict_hash' before introducing 'hashing' module
+def legacy_dict_hash(data_dict):
+    data_str = json.dumps(data_dict, sort_keys=True)
+    # ruff: noqa: S324
+    return hashlib.md5(data_str.encode("utf-8")).hexdigest()  # nosec
+
+
+def generate_items():
+    return [
+        {
+            "item_date": f"2024-{index % 12 + 1:02}-{index % 28 + 1:02}",
+            "teacher": f"Nauczyciel {index % 17}",
+            "title": f"Przedmiot {index % 11}",
+            "grade": str(index % 6 + 1),
+            "semester": index % 2 + 1,
+            "description": f"Ocena za sprawdzian z działu {index} - zadania tekstowe i ułamki",
+        }
+        for index in range(ITEMS_NUM)
+    ]
+
+
+def measure(label, function, items_list):
+    durations = timeit.repeat(lambda: [function(item) for item in items_list], number=1, repeat=REPEATS)
+    duration = min(durations)
+    _LOGGER.info("%s: %.2f ms for %s items", label, duration * 1000, len(items_list))
+    return duration
+
+
+def main():
+    logger.configure_console()
+
+    items_list = generate_items()
+    legacy_time = measure("legacy", legacy_dict_hash, items_list)
+    compat_time = measure("compat", lambda item: calculate_data_hash(item, HashMode.COMPAT), items_list)
+    fast_time = measure("fast", lambda item: calculate_data_hash(item, HashMode.FAST), items_list)
+    _LOGGER.info("compat speedup: %.2fx fast speedup: %.2fx", legacy_time / compat_time, legacy_time / fast_time)
+
+
+if __name__ == "__main__":
+    main()
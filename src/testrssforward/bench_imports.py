@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+"""Benchmark of loading generators with one-item config.
+
+Compares importing modules of all generators (enumeration of 'rssforward.source' package)
+with importing only module of configured generator through registry. Each measurement
+is executed in new interpreter.
+"""
+
+import contextlib
+
+with contextlib.suppress(ImportError):
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=E0401,W0611
+    # ruff: noqa: F401
+    import __init__
+
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+
+import os
+import sys
+import logging
+import argparse
+import json
+import statistics
+import subprocess  # nosec
+
+from rssforward import logger
+from rssforward.source.registry import get_generators_ids, find_missing_dependencies
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.dirname(SCRIPT_DIR)
+
+REPEATS = 5
+
+## code executed in separate interpreter, prints JSON with duration and number of loaded modules
+MEASURE_CODE = """
+import sys, time, json
+start_time = time.perf_counter()
+import rssforward.rssmanager
+from rssforward.source.registry import load_generator_module
+for gen_id in {generators}:
+    load_generator_module(gen_id)
+duration = time.perf_counter() - start_time
+print(json.dumps({{"duration": duration, "modules": len(sys.modules)}}))
+"""
+
+
+def measure_import(generators_list, repeats=REPEATS):
+    code = MEASURE_CODE.format(generators=repr(generators_list))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    durations = []
+    modules_num = 0
+    for _ in range(repeats):
+        result = subprocess.run(  # noqa: S603 # nosec
+            [sys.executable, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result_dict = json.loads(result.stdout.strip().splitlines()[-1])
+        durations.append(result_dict["duration"])
+        modules_num = result_dict["modules"]
+    return statistics.median(durations), modules_num
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark of loading generators")
+    parser.add_argument("--generator", action="store", default="kidsalert", help="Id of configured generator")
+    parser.add_argument("-n", "--runs", action="store", type=int, default=REPEATS, help="Number of measurements")
+
+    args = parser.parse_args()
+
+    logger.configure_console()
+
+    ## generators possible to import in current environment
+    all_list = [gen_id for gen_id in get_generators_ids() if not find_missing_dependencies(gen_id)]
+    all_time, all_modules = measure_import(all_list, args.runs)
+    single_time, single_modules = measure_import([args.generator], args.runs)
+
+    _LOGGER.info("all generators (%s):     %8.2f ms, %s modules", len(all_list), all_time * 1000, all_modules)
+    _LOGGER.info("generator %-12s %8.2f ms, %s modules", args.generator + ":", single_time * 1000, single_modules)
+    _LOGGER.info("speedup: %.2fx", all_time / single_time)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
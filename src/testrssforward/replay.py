@@ -0,0 +1,263 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+"""Record and replay of responses received by generators.
+
+Recording captures raw responses of HTTP requests sent through shared session
+of 'rssforward.source.utils.httpclient' and pages loaded with 'selenium_get_content()'.
+Replaying serves the recorded responses without network access.
+
+Generators operating directly on web driver (e.g. umursynow) and generators using
+own HTTP clients are not handled.
+
+Fixtures may contain private data (e.g. school messages), so they should not be
+stored in repository.
+"""
+
+import os
+import logging
+import json
+import sys
+import threading
+import contextlib
+from collections import Counter
+from typing import cast
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+from rssforward.source.utils import httpclient
+from rssforward.source.utils import selenium
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+INDEX_FILE = "index.json"
+RESPONSES_DIR = "responses"
+
+## headers describing transfer of body - recorded body is already decoded
+SKIPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "set-cookie"}
+
+
+class FixtureStore:
+    """Responses of single generator stored in directory.
+
+    Responses are identified by key (method and URL). Responses of repeated requests
+    are served in order of recording, the last one is served if there is no more responses.
+    """
+
+    def __init__(self, fixtures_dir):
+        self.fixtures_dir = fixtures_dir
+        self._lock = threading.Lock()
+        self._entries: list[dict] = []
+        self._served: Counter = Counter()  # key -> number of served responses
+        self.counters: Counter = Counter()  # e.g. "http replayed" -> number of requests
+
+    def load(self):
+        index_path = os.path.join(self.fixtures_dir, INDEX_FILE)
+        with open(index_path, encoding="utf-8") as index_file:
+            self._entries = json.load(index_file)
+        self._served.clear()
+
+    def store(self):
+        os.makedirs(self.fixtures_dir, exist_ok=True)
+        index_path = os.path.join(self.fixtures_dir, INDEX_FILE)
+        with open(index_path, "w", encoding="utf-8") as index_file:
+            json.dump(self._entries, index_file, indent=4)
+        _LOGGER.info("recorded %s responses to: %s", len(self._entries), self.fixtures_dir)
+
+    def add(self, key, body: bytes, **entry_data: object):
+        with self._lock:
+            file_name = f"{len(self._entries):04}.bin"
+            body_path = os.path.join(self.fixtures_dir, RESPONSES_DIR, file_name)
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            with open(body_path, "wb") as body_file:
+                body_file.write(body)
+            entry = {"key": key, "file": file_name}
+            entry.update(entry_data)
+            self._entries.append(entry)
+
+    # returns pair: entry and body, 'None' if response not found
+    def get(self, key):
+        with self._lock:
+            matching = [entry for entry in self._entries if entry["key"] == key]
+            if not matching:
+                return None
+            index = min(self._served[key], len(matching) - 1)
+            self._served[key] += 1
+            entry = matching[index]
+        body_path = os.path.join(self.fixtures_dir, RESPONSES_DIR, entry["file"])
+        with open(body_path, "rb") as body_file:
+            return entry, body_file.read()
+
+    def count(self, counter_name):
+        with self._lock:
+            self.counters[counter_name] += 1
+
+
+def get_request_key(method, url):
+    return f"{method} {url}"
+
+
+## ============================================================
+
+
+class RecordingAdapter(httpclient.RateLimitedAdapter):
+    """Adapter sending requests to sites and storing received responses."""
+
+    def __init__(self, fixture_store: FixtureStore, pool_connections: int, pool_maxsize: int, max_retries: Retry):
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries)
+        self.fixture_store = fixture_store
+
+    def send(self, request, *args: object, **kwargs: object):  # pylint: disable=W0221
+        response = super().send(request, *args, **kwargs)
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in SKIPPED_HEADERS}
+        self.fixture_store.add(
+            get_request_key(request.method, request.url),
+            response.content,
+            source="http",
+            status=response.status_code,
+            reason=response.reason,
+            url=response.url,
+            headers=headers,
+        )
+        self.fixture_store.count("http recorded")
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Adapter serving recorded responses without network access."""
+
+    def __init__(self, fixture_store: FixtureStore):
+        super().__init__()
+        self.fixture_store = fixture_store
+
+    def send(self, request, *_args: object, **_kwargs: object):  # pylint: disable=W0221
+        key = get_request_key(request.method, request.url)
+        found = self.fixture_store.get(key)
+        if found is None:
+            self.fixture_store.count("http missing")
+            _LOGGER.warning("no recorded response for: %s", key)
+            message = f"no recorded response for: {key}"
+            raise requests.exceptions.ConnectionError(message, request=request)
+        self.fixture_store.count("http replayed")
+        entry, body = found
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason")
+        response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = entry.get("url", request.url)
+        response.request = request
+        response._content = body  # noqa: SLF001 # pylint: disable=W0212
+        return response
+
+    def close(self):
+        pass
+
+
+## ============================================================
+
+
+@contextlib.contextmanager
+def record_responses(fixtures_dir):
+    """Record responses received within context to given directory."""
+    fixture_store = FixtureStore(fixtures_dir)
+    orig_selenium_get_content = selenium.selenium_get_content
+
+    def create_session(*args: object, **kwargs: object) -> requests.Session:
+        session = orig_create_session(*args, **kwargs)
+        orig_adapter = cast("httpclient.RateLimitedAdapter", session.get_adapter("https://"))
+        adapter = RecordingAdapter(
+            fixture_store,
+            pool_connections=httpclient.POOL_CONNECTIONS,
+            pool_maxsize=httpclient.POOL_MAXSIZE,
+            max_retries=orig_adapter.max_retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def selenium_get_content(url: str, **kwargs: object):
+        content = orig_selenium_get_content(url, **kwargs)
+        if content is not None:
+            fixture_store.add(get_request_key("SELENIUM", url), content.encode("utf-8"), source="selenium")
+            fixture_store.count("selenium recorded")
+        return content
+
+    orig_create_session = httpclient.create_session
+    with _patched_session(create_session), _patched_function(orig_selenium_get_content, selenium_get_content):
+        try:
+            yield fixture_store
+        finally:
+            fixture_store.store()
+
+
+@contextlib.contextmanager
+def replay_responses(fixtures_dir):
+    """Serve responses recorded in given directory to requests done within context."""
+    fixture_store = FixtureStore(fixtures_dir)
+    fixture_store.load()
+    orig_selenium_get_content = selenium.selenium_get_content
+
+    def create_session(*_args: object, **_kwargs: object) -> requests.Session:
+        session = requests.Session()
+        adapter = ReplayAdapter(fixture_store)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def selenium_get_content(url: str, **_kwargs: object):
+        key = get_request_key("SELENIUM", url)
+        found = fixture_store.get(key)
+        if found is None:
+            fixture_store.count("selenium missing")
+            _LOGGER.warning("no recorded response for: %s", key)
+            return None
+        fixture_store.count("selenium replayed")
+        return found[1].decode("utf-8")
+
+    with _patched_session(create_session), _patched_function(orig_selenium_get_content, selenium_get_content):
+        yield fixture_store
+
+
+## new session is created within context and closed on exit
+@contextlib.contextmanager
+def _patched_session(create_session):
+    orig_create_session = httpclient.create_session
+    httpclient.close_session()
+    httpclient.create_session = create_session
+    try:
+        yield
+    finally:
+        httpclient.close_session()
+        httpclient.create_session = orig_create_session
+
+
+## replace function in all modules of the application
+## (generators import functions directly to own namespace)
+@contextlib.contextmanager
+def _patched_function(orig_function, new_function):
+    patched_modules = []
+    for module in list(sys.modules.values()):
+        module_name = getattr(module, "__name__", "")
+        if not module_name.startswith("rssforward."):
+            continue
+        if getattr(module, orig_function.__name__, None) is orig_function:
+            setattr(module, orig_function.__name__, new_function)
+            patched_modules.append(module)
+    try:
+        yield
+    finally:
+        for module in patched_modules:
+            setattr(module, orig_function.__name__, orig_function)
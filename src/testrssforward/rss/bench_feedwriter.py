@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import contextlib
+
+with contextlib.suppress(ImportError):
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=E0401,W0611
+    # ruff: noqa: F401
+    import __init__
+
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+
+import os
+import logging
+import datetime
+import tempfile
+import time
+import tracemalloc
+import resource
+import multiprocessing
+
+from feedgen.feed import FeedGenerator
+
+from rssforward import logger
+from rssforward.rss.feedwriter import FeedWriter
+from rssforward.rss.fragmentcache import FragmentCache
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+ENTRIES_NUM = 500
+REPEATS = 5
+
+
+def fill_feed(feed_gen):
+    feed_gen.link(href="https://example.com/")
+    feed_gen.language("pl")
+    feed_gen.title("benchmark")
+    feed_gen.description("benchmark")
+    pub_date = datetime.datetime(2024, 5, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    content = "<div><p>Lorem ipsum dolor sit amet &amp; consectetur</p><ul><li>item</li></ul></div>\n" * 40
+    for index in range(ENTRIES_NUM):
+        feed_item = feed_gen.add_entry()
+        feed_item.id(f"item_{index}")
+        feed_item.title(f"title {index}")
+        feed_item.author({"name": "author", "email": "author"})
+        feed_item.content(content)
+        feed_item.pubDate(pub_date + datetime.timedelta(minutes=index))
+        feed_item.link(href=f"https://example.com/item/{index}", rel="alternate")
+
+
+def create_cached_writer():
+    ## cache is never stored, so the file is not created
+    cache_path = os.path.join(tempfile.gettempdir(), "bench_fragmentcache.obj")
+    return FeedWriter(fragment_cache=FragmentCache(64 * 1024 * 1024, cache_path))
+
+
+## both writers are measured without pretty printing (as in 'dumps_feed_gen()')
+def dumps_feedgen(feed_gen: FeedGenerator):
+    return feed_gen.rss_str(pretty=False).decode()
+
+
+def dumps_writer(feed_gen: FeedWriter):
+    return feed_gen.dumps(pretty=False)
+
+
+# executed in separate process, so peak RSS of process is not affected by other measurements
+def measure(label, create_feed, dumps_feed):
+    logger.configure_console()
+    feed_gen = create_feed()
+    fill_feed(feed_gen)
+
+    ## 'tracemalloc' does not trace memory allocated by C libraries (e.g. lxml), so peak RSS is measured as well
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    content = dumps_feed(feed_gen)
+    _size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before  # in KB
+
+    durations = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        dumps_feed(feed_gen)
+        durations.append(time.perf_counter() - start_time)
+
+    _LOGGER.info(
+        "%s: dumps time: %.2f ms peak traced memory: %.2f MB peak RSS growth: %.2f MB content size: %.2f MB",
+        label,
+        min(durations) * 1000,
+        peak / 1024 / 1024,
+        rss_peak / 1024,
+        len(content) / 1024 / 1024,
+    )
+
+
+def run_process(label, create_feed, dumps_feed):
+    context = multiprocessing.get_context("spawn")
+    process = context.Process(target=measure, args=(label, create_feed, dumps_feed))
+    process.start()
+    process.join()
+
+
+def main():
+    logger.configure_console()
+    _LOGGER.info("dumping feed with %s entries", ENTRIES_NUM)
+    run_process("feedgen", FeedGenerator, dumps_feedgen)
+    run_process("feedwriter", FeedWriter, dumps_writer)
+    ## first dumps fills the cache, so measured time is time of dumps with warm cache
+    run_process("feedwriter + fragment cache", create_cached_writer, dumps_writer)
+
+
+if __name__ == "__main__":
+    main()
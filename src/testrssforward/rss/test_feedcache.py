@@ -0,0 +1,69 @@
+#
+# Copyright (c) 2023, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import os
+import tempfile
+
+from rssforward.rss.feedcache import FeedCache, etag_matches
+from rssforward.utils import write_data
+
+
+class FeedCacheTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.data_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        self.data_dir.cleanup()
+
+    def write_feed(self, feed_cache, name, content):
+        feed_path = os.path.join(self.data_dir.name, name)
+        write_data(feed_path, content)
+        feed_cache.update(feed_path, content)
+        return feed_path
+
+    def test_get_changed_file(self):
+        feed_cache = FeedCache()
+        feed_path = self.write_feed(feed_cache, "feed.xml", "aaa")
+        etag = feed_cache.get(feed_path).etag
+
+        write_data(feed_path, "bbbb")
+        self.assertNotEqual(etag, feed_cache.get(feed_path).etag)
+
+    def test_get_content_disabled(self):
+        feed_cache = FeedCache()
+        feed_path = self.write_feed(feed_cache, "feed.xml", "aaa")
+        self.assertIsNone(feed_cache.get_content(feed_path))
+
+    def test_get_content_lru(self):
+        feed_cache = FeedCache(max_content_size=10)
+        path1 = self.write_feed(feed_cache, "feed1.xml", "1111")
+        path2 = self.write_feed(feed_cache, "feed2.xml", "2222")
+        self.assertEqual(b"1111", feed_cache.get_content(path1).data)  # mark as recently used
+
+        path3 = self.write_feed(feed_cache, "feed3.xml", "3333")
+
+        self.assertIsNotNone(feed_cache.get_content(path1))
+        self.assertIsNone(feed_cache.get_content(path2))
+        self.assertIsNotNone(feed_cache.get_content(path3))
+        # digest is kept after content eviction
+        self.assertIsNotNone(feed_cache.get(path2))
+
+    def test_get_content_too_big(self):
+        feed_cache = FeedCache(max_content_size=2)
+        feed_path = self.write_feed(feed_cache, "feed.xml", "aaa")
+        self.assertIsNone(feed_cache.get_content(feed_path))
+
+    def test_etag_matches(self):
+        self.assertTrue(etag_matches('"aaa"', '"aaa"'))
+        self.assertTrue(etag_matches('"bbb", W/"aaa"', '"aaa"'))
+        self.assertTrue(etag_matches("*", '"aaa"'))
+        self.assertFalse(etag_matches('"bbb"', '"aaa"'))
+        self.assertFalse(etag_matches(None, '"aaa"'))
@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import re
+import datetime
+
+from feedgen.feed import FeedGenerator
+
+from rssforward.rss.feedwriter import FeedWriter
+from rssforward.rss.utils import init_feed_gen, add_data_to_feed, dumps_feed_gen
+
+
+def fill_feed(feed_gen):
+    feed_gen.title("Title & <more>")
+    feed_gen.description("description")
+    pub_date = datetime.datetime(2024, 5, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    add_data_to_feed(
+        feed_gen,
+        {
+            "id": "id_1",
+            "title": """title "1" 'a'""",
+            "author": {"name": "name", "email": "email"},
+            "content": "<p>line 1\r\nline 2</p> ]]>",
+            "pub_date": pub_date,
+            "link": "https://example.com/?a=1&b=2",
+        },
+    )
+    add_data_to_feed(
+        feed_gen,
+        {
+            "id": "id_2",
+            "title": "title 2",
+            "author": {"name": "name"},
+            "content": "zażółć",
+            "pub_date": pub_date.astimezone(datetime.timezone(datetime.timedelta(hours=2))),
+            "link": "https://example.com/2",
+        },
+    )
+
+
+# remove fields that differ between writers
+def normalize_feed(content: str):
+    content = re.sub(r"\s*<generator>.*?</generator>", "", content)
+    return re.sub(r"\s*<lastBuildDate>.*?</lastBuildDate>", "", content)
+
+
+def get_feedgen_content(pretty):
+    feed_gen = FeedGenerator()
+    feed_gen.link(href="https://example.com/")
+    feed_gen.language("pl")
+    fill_feed(feed_gen)
+    return feed_gen.rss_str(pretty=pretty).decode()
+
+
+class FeedWriterTest(unittest.TestCase):
+    def test_dumps_compatible(self):
+        feed_gen = init_feed_gen("https://example.com/")
+        fill_feed(feed_gen)
+
+        content = dumps_feed_gen(feed_gen)
+        self.assertEqual(normalize_feed(get_feedgen_content(pretty=False)), normalize_feed(content))
+        self.assertIn("<lastBuildDate>Wed, 01 May 2024 12:00:00 +0000</lastBuildDate>", content)
+
+    def test_dumps_pretty_compatible(self):
+        feed_gen = init_feed_gen("https://example.com/")
+        fill_feed(feed_gen)
+
+        content = dumps_feed_gen(feed_gen, pretty=True)
+        self.assertEqual(normalize_feed(get_feedgen_content(pretty=True)), normalize_feed(content))
+
+    def test_dumps_missing_fields(self):
+        feed_gen = FeedWriter()
+        feed_gen.title("title")
+        self.assertRaises(ValueError, feed_gen.dumps)
+
+    def test_dumps_invalid_chars(self):
+        feed_gen = init_feed_gen("https://example.com/")
+        feed_gen.title("title\x00")
+        feed_gen.description("description")
+        self.assertRaises(ValueError, feed_gen.dumps)
+
+    def test_dumps_invalid_chars_content(self):
+        for content in ("line 1\nline 2\x0b", "line 1\nline 2\ud800", "zażółć\n\uffff"):
+            feed_gen = init_feed_gen("https://example.com/")
+            feed_gen.title("title")
+            feed_gen.description("description")
+            add_data_to_feed(
+                feed_gen,
+                {
+                    "id": "id_1",
+                    "title": "title",
+                    "author": {"name": "name", "email": "email"},
+                    "content": content,
+                    "pub_date": datetime.datetime(2024, 5, 1, 12, 0, tzinfo=datetime.timezone.utc),
+                    "link": "https://example.com/1",
+                },
+            )
+            self.assertRaises(ValueError, feed_gen.dumps)
+
+    def test_pubdate_no_timezone(self):
+        feed_gen = init_feed_gen("https://example.com/")
+        feed_item = feed_gen.add_entry()
+        self.assertRaises(ValueError, feed_item.pubDate, datetime.datetime(2024, 5, 1))  # noqa: DTZ001
+        self.assertRaises(TypeError, feed_item.pubDate, "2024-05-01")
@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import os
+import tempfile
+import datetime
+
+from rssforward.rss.feedwriter import FeedWriter
+from rssforward.rss.fragmentcache import FragmentCache
+from rssforward.rss.utils import add_data_to_feed
+
+
+def create_feed(fragment_cache, content):
+    feed_gen = FeedWriter(fragment_cache=fragment_cache)
+    feed_gen.link(href="https://example.com/")
+    feed_gen.title("title")
+    feed_gen.description("description")
+    pub_date = datetime.datetime(2024, 5, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    add_data_to_feed(
+        feed_gen,
+        {
+            "id": "id_1",
+            "title": "title 1",
+            "author": {"name": "name", "email": "email"},
+            "content": content,
+            "pub_date": pub_date,
+            "link": "https://example.com/1",
+        },
+    )
+    return feed_gen
+
+
+class FragmentCacheTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.data_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.cache_path = os.path.join(self.data_dir.name, "fragmentcache.obj")
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        self.data_dir.cleanup()
+
+    def test_evict(self):
+        fragment_cache = FragmentCache(10, self.cache_path)
+        fragment_cache.set("aaa", "12345")
+        fragment_cache.set("bbb", "12345")
+        self.assertEqual("12345", fragment_cache.get("aaa"))
+
+        fragment_cache.set("ccc", "12345")
+        self.assertEqual("12345", fragment_cache.get("aaa"))
+        self.assertIsNone(fragment_cache.get("bbb"))
+
+        fragment_cache.set("ddd", "too long fragment")
+        self.assertIsNone(fragment_cache.get("ddd"))
+
+    def test_store(self):
+        fragment_cache = FragmentCache(100, self.cache_path)
+        fragment_cache.set("aaa", "fragment")
+        fragment_cache.store()
+
+        fragment_cache = FragmentCache(100, self.cache_path)
+        self.assertEqual("fragment", fragment_cache.get("aaa"))
+
+    def test_load_corrupted(self):
+        fragment_cache = FragmentCache(100, self.cache_path)
+        fragment_cache.set("aaa", "fragment")
+        fragment_cache.store()
+
+        ## e.g. crash during writing
+        with open(self.cache_path, "r+b") as cache_file:
+            cache_file.truncate(10)
+
+        fragment_cache = FragmentCache(10000, self.cache_path)
+        self.assertIsNone(fragment_cache.get("aaa"))
+        expected = create_feed(None, "content").dumps()
+        self.assertEqual(expected, create_feed(fragment_cache, "content").dumps())
+        fragment_cache.store()
+
+        fragment_cache = FragmentCache(10000, self.cache_path)
+        self.assertEqual(expected, create_feed(fragment_cache, "content").dumps())
+        self.assertEqual(1, fragment_cache.fragments_num())
+
+    def test_feed_dumps(self):
+        fragment_cache = FragmentCache(10000, self.cache_path)
+        expected = create_feed(None, "content").dumps()
+
+        self.assertEqual(expected, create_feed(fragment_cache, "content").dumps())
+        self.assertEqual(expected, create_feed(fragment_cache, "content").dumps())
+        self.assertEqual(1, fragment_cache.fragments_num())
+
+        changed_content = create_feed(fragment_cache, "changed").dumps()
+        self.assertIn("changed", changed_content)
+        self.assertEqual(2, fragment_cache.fragments_num())
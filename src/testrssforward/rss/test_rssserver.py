@@ -0,0 +1,188 @@
+#
+# Copyright (c) 2023, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import os
+import gzip
+import socket
+import tempfile
+import threading
+import urllib.request
+import urllib.error
+
+from rssforward.rss.rssserver import RSSServerManager, accepts_gzip
+from rssforward.utils import write_gzip_data
+from rssforward.rss.feedcache import FeedCache
+from rssforward.metrics import get_metrics, SERVED_REQUESTS
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("", 0))
+        return sock.getsockname()[1]
+
+
+class RSSServerManagerTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.data_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        feed_dir = os.path.join(self.data_dir.name, "gen")
+        os.makedirs(feed_dir)
+        self.feed_path = os.path.join(feed_dir, "feed.xml")
+        with open(self.feed_path, "w", encoding="utf-8") as feed_file:
+            feed_file.write("<rss>content</rss>")
+
+        started = threading.Event()
+        self.server = RSSServerManager()
+        self.server.port = get_free_port()
+        self.server.feed_cache = FeedCache()
+        self.server.metrics = get_metrics()
+        self.server.startedCallback = started.set
+        self.server.start(self.data_dir.name)
+        started.wait(5)
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        self.server.stop()
+        self.data_dir.cleanup()
+
+    def get_url(self, subpath):
+        return f"http://127.0.0.1:{self.server.port}/{subpath}"
+
+    def assert_not_modified(self, request):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            urllib.request.urlopen(request, timeout=5)  # noqa: S310 # nosec # pylint: disable=R1732
+        self.assertEqual(304, context.exception.code)
+        context.exception.close()
+
+    def test_get_feed(self):
+        with urllib.request.urlopen(self.get_url("gen/feed.xml"), timeout=5) as response:  # noqa: S310 # nosec
+            self.assertEqual(200, response.status)
+            self.assertEqual(b"<rss>content</rss>", response.read())
+
+    def test_slow_client_not_blocking(self):
+        with socket.create_connection(("127.0.0.1", self.server.port), timeout=5) as slow_client:
+            # incomplete request - server waits for rest of headers
+            slow_client.sendall(b"GET /gen/feed.xml HTTP/1.0\r\n")
+            with urllib.request.urlopen(self.get_url("gen/feed.xml"), timeout=2) as response:  # noqa: S310 # nosec
+                self.assertEqual(200, response.status)
+
+    def test_get_feed_etag(self):
+        with urllib.request.urlopen(self.get_url("gen/feed.xml"), timeout=5) as response:  # noqa: S310 # nosec
+            etag = response.headers.get("ETag")
+        self.assertTrue(etag)
+
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers={"If-None-Match": etag})  # noqa: S310
+        self.assert_not_modified(request)
+
+    def test_get_feed_etag_changed(self):
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers={"If-None-Match": '"xxx"'})  # noqa: S310
+        with urllib.request.urlopen(request, timeout=5) as response:  # noqa: S310 # nosec
+            self.assertEqual(200, response.status)
+            self.assertEqual(b"<rss>content</rss>", response.read())
+
+    def test_get_feed_gzip(self):
+        write_gzip_data(self.feed_path + ".gz", "<rss>content</rss>")
+
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers={"Accept-Encoding": "gzip"})  # noqa: S310
+        with urllib.request.urlopen(request, timeout=5) as response:  # noqa: S310 # nosec
+            self.assertEqual("gzip", response.headers.get("Content-Encoding"))
+            self.assertEqual("Accept-Encoding", response.headers.get("Vary"))
+            self.assertEqual("application/xml", response.headers.get("Content-type"))
+            self.assertEqual(b"<rss>content</rss>", gzip.decompress(response.read()))
+            gzip_etag = response.headers.get("ETag")
+
+        with urllib.request.urlopen(self.get_url("gen/feed.xml"), timeout=5) as response:  # noqa: S310 # nosec
+            self.assertIsNone(response.headers.get("Content-Encoding"))
+            self.assertEqual("Accept-Encoding", response.headers.get("Vary"))
+            self.assertNotEqual(gzip_etag, response.headers.get("ETag"))
+            self.assertEqual(b"<rss>content</rss>", response.read())
+
+    def test_get_feed_gzip_outdated(self):
+        write_gzip_data(self.feed_path + ".gz", "<rss>old</rss>")
+        os.utime(self.feed_path + ".gz", (0, 0))
+
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers={"Accept-Encoding": "gzip"})  # noqa: S310
+        with urllib.request.urlopen(request, timeout=5) as response:  # noqa: S310 # nosec
+            self.assertIsNone(response.headers.get("Content-Encoding"))
+            self.assertEqual(b"<rss>content</rss>", response.read())
+
+    def test_get_feed_memory(self):
+        self.server.feed_cache.max_content_size = 1024
+        self.server.feed_cache.update(self.feed_path, "<rss>content</rss>", gzip.compress(b"<rss>content</rss>"))
+        os.remove(self.feed_path)  # content is served from memory
+
+        with urllib.request.urlopen(self.get_url("gen/feed.xml"), timeout=5) as response:  # noqa: S310 # nosec
+            self.assertEqual(b"<rss>content</rss>", response.read())
+            etag = response.headers.get("ETag")
+
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers={"Accept-Encoding": "gzip"})  # noqa: S310
+        with urllib.request.urlopen(request, timeout=5) as response:  # noqa: S310 # nosec
+            self.assertEqual("gzip", response.headers.get("Content-Encoding"))
+            self.assertEqual(b"<rss>content</rss>", gzip.decompress(response.read()))
+
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers={"If-None-Match": etag})  # noqa: S310
+        self.assert_not_modified(request)
+
+    def test_get_feed_memory_modified_since(self):
+        self.server.feed_cache.max_content_size = 1024
+        self.server.feed_cache.update(self.feed_path, "<rss>content</rss>", gzip.compress(b"<rss>content</rss>"))
+        os.remove(self.feed_path)  # content is served from memory
+
+        with urllib.request.urlopen(self.get_url("gen/feed.xml"), timeout=5) as response:  # noqa: S310 # nosec
+            last_modified = response.headers.get("Last-Modified")
+        self.assertTrue(last_modified)
+
+        for headers in ({}, {"Accept-Encoding": "gzip"}):
+            headers["If-Modified-Since"] = last_modified
+            request = urllib.request.Request(self.get_url("gen/feed.xml"), headers=headers)  # noqa: S310
+            self.assert_not_modified(request)
+
+        headers = {"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"}
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers=headers)  # noqa: S310
+        with urllib.request.urlopen(request, timeout=5) as response:  # noqa: S310 # nosec
+            self.assertEqual(200, response.status)
+
+    def test_get_feed_gzip_modified_since(self):
+        write_gzip_data(self.feed_path + ".gz", "<rss>content</rss>")
+
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers={"Accept-Encoding": "gzip"})  # noqa: S310
+        with urllib.request.urlopen(request, timeout=5) as response:  # noqa: S310 # nosec
+            self.assertEqual("gzip", response.headers.get("Content-Encoding"))
+            last_modified = response.headers.get("Last-Modified")
+        self.assertTrue(last_modified)
+
+        headers = {"Accept-Encoding": "gzip", "If-Modified-Since": last_modified}
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers=headers)  # noqa: S310
+        self.assert_not_modified(request)
+
+        ## 'If-None-Match' takes precedence
+        headers = {"Accept-Encoding": "gzip", "If-Modified-Since": last_modified, "If-None-Match": '"xxx"'}
+        request = urllib.request.Request(self.get_url("gen/feed.xml"), headers=headers)  # noqa: S310
+        with urllib.request.urlopen(request, timeout=5) as response:  # noqa: S310 # nosec
+            self.assertEqual(200, response.status)
+
+    def test_get_metrics(self):
+        served_num = SERVED_REQUESTS.get("200")
+        with urllib.request.urlopen(self.get_url("gen/feed.xml"), timeout=5) as response:  # noqa: S310 # nosec
+            response.read()
+
+        with urllib.request.urlopen(self.get_url("metrics"), timeout=5) as response:  # noqa: S310 # nosec
+            self.assertEqual(200, response.status)
+            self.assertTrue(response.headers.get("Content-Type").startswith("text/plain; version=0.0.4"))
+            content = response.read().decode("utf-8")
+        self.assertIn("# TYPE rssforward_served_requests_total counter", content)
+        self.assertIn('rssforward_served_request_duration_seconds_count{status="200"}', content)
+        self.assertGreaterEqual(SERVED_REQUESTS.get("200"), served_num + 1)
+
+    def test_accepts_gzip(self):
+        self.assertTrue(accepts_gzip("gzip"))
+        self.assertTrue(accepts_gzip("deflate, gzip;q=0.5, br"))
+        self.assertFalse(accepts_gzip("gzip;q=0"))
+        self.assertFalse(accepts_gzip("identity"))
+        self.assertFalse(accepts_gzip(None))
@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import os
+import sys
+import unittest
+from unittest import mock
+import pkgutil
+import importlib.util
+import subprocess  # nosec
+
+import rssforward.source
+from rssforward.source import registry
+from rssforward.source.registry import (
+    get_generators_ids,
+    get_generator_info,
+    find_missing_dependencies,
+    find_unknown_params,
+)
+
+
+SRC_DIR = os.path.dirname(os.path.dirname(rssforward.__file__))
+
+
+class RegistryTest(unittest.TestCase):
+    def test_registered_modules(self):
+        ## every module of 'rssforward.source' package is registered
+        source_dir = os.path.dirname(rssforward.source.__file__)
+        modules_list = [mod_info.name for mod_info in pkgutil.iter_modules([source_dir]) if not mod_info.ispkg]
+        modules_list.remove("registry")
+        self.assertEqual(sorted(modules_list), sorted(get_generators_ids()))
+
+    def test_get_generator_info(self):
+        info = get_generator_info("youtube")
+        self.assertEqual("rssforward.source.youtube", info.module)
+        self.assertIn("yt_dlp", info.dependencies)
+        self.assertIsNone(get_generator_info("registry"))
+        self.assertIsNone(get_generator_info("unknown"))
+
+    def test_find_unknown_params(self):
+        self.assertEqual([], find_unknown_params("youtube", {"url": "xxx", "outfile": "yt.xml"}))
+        self.assertEqual(["urls"], find_unknown_params("youtube", {"urls": "xxx"}))
+        self.assertEqual([], find_unknown_params("youtube", None))
+
+    def test_load_generator_module_unknown(self):
+        self.assertIsNone(registry.load_generator_module("unknown"))
+        self.assertIsNone(registry.load_generator_module("utils"))
+
+    def test_load_generator_module_without_lxml(self):
+        ## 'lxml' is optional - HTML generators fall back to 'html.parser'
+        find_spec = importlib.util.find_spec
+
+        def find_spec_without_lxml(name, package=None):
+            if name == "lxml":
+                return None
+            return find_spec(name, package)
+
+        with mock.patch("importlib.util.find_spec", side_effect=find_spec_without_lxml):
+            for gen_id in get_generators_ids():
+                self.assertNotIn("lxml", find_missing_dependencies(gen_id), gen_id)
+            self.assertIsNotNone(registry.load_generator_module("untswawpl"))
+            self.assertIsNotNone(registry.load_generator_module("nofluffjobs"))
+
+    def test_load_generator_module_imports(self):
+        ## fresh interpreter - modules of other generators and their dependencies are not imported
+        code = (
+            "import sys\n"
+            "import rssforward.rssmanager\n"
+            "from rssforward.source.registry import load_generator_module\n"
+            "load_generator_module('kidsalert')\n"
+            "print(' '.join(sorted(sys.modules)))\n"
+        )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = SRC_DIR
+        result = subprocess.run(  # noqa: S603 # nosec
+            [sys.executable, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        modules_list = result.stdout.split()
+        self.assertIn("rssforward.source.kidsalert", modules_list)
+        self.assertNotIn("rssforward.source.youtube", modules_list)
+        self.assertNotIn("yt_dlp", modules_list)
+        self.assertNotIn("selenium", modules_list)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import contextlib
+
+with contextlib.suppress(ImportError):
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=E0401,W0611
+    # ruff: noqa: F401
+    import __init__
+
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+
+import sys
+import logging
+import timeit
+import functools
+
+from bs4 import SoupStrainer
+
+from testrssforward.data import read_data
+
+from rssforward import logger
+from rssforward.source.utils.htmlparser import make_soup, HTML_PARSER
+from rssforward.source.utils.react import extract_data_dict
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+REPEATS = 5
+
+
+def measure(label, function, number=20):
+    durations = timeit.repeat(function, number=number, repeat=REPEATS)
+    duration = min(durations) / number
+    _LOGGER.info("%s: parse time: %.2f ms", label, duration * 1000)
+    return duration
+
+
+def measure_parser(label, content, parser, parse_only=None):
+    return measure(label, lambda: make_soup(content, parse_only=parse_only, parser=parser))
+
+
+def extract_next_data_soup(content):
+    soup = make_soup(content)
+    return soup.select('script[id="__NEXT_DATA__"]')[0].string
+
+
+def main():
+    logger.configure_console()
+
+    ## saved pages to parse, path relative to 'testrssforward/data' or absolute
+    pages_list = sys.argv[1:]
+    if not pages_list:
+        pages_list = ["german.html"]
+
+    _LOGGER.info("available parser: %s", HTML_PARSER)
+    for page_path in pages_list:
+        content = read_data(page_path)
+        _LOGGER.info("parsing page: %s size: %s", page_path, len(content))
+        base_time = measure_parser("html.parser", content, "html.parser")
+        fast_time = measure_parser(HTML_PARSER, content, HTML_PARSER)
+        strainer = SoupStrainer("script")
+        strained_time = measure_parser(f"{HTML_PARSER} + SoupStrainer('script')", content, HTML_PARSER, strainer)
+        _LOGGER.info("speedup: %.2fx, with strainer: %.2fx", base_time / fast_time, base_time / strained_time)
+
+        if extract_data_dict(content) is not None:
+            ## page with embedded React state
+            soup_time = measure("__NEXT_DATA__ from soup", functools.partial(extract_next_data_soup, content))
+            scan_time = measure("__NEXT_DATA__ from raw content", functools.partial(extract_data_dict, content))
+            _LOGGER.info("embedded state speedup: %.2fx", soup_time / scan_time)
+
+
+if __name__ == "__main__":
+    main()
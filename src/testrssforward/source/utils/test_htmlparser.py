@@ -0,0 +1,42 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+from unittest import mock
+import importlib.util
+
+from bs4 import SoupStrainer
+
+from rssforward.source.utils.htmlparser import make_soup, find_html_parser
+
+
+HTML_CONTENT = """<html><body>
+<div class="box"><a href="/item">item</a></div>
+<script id="state">{"value": 1}</script>
+</body></html>"""
+
+
+class HtmlParserTest(unittest.TestCase):
+    def test_find_html_parser(self):
+        with mock.patch("importlib.util.find_spec", return_value=None):
+            self.assertEqual("html.parser", find_html_parser())
+        if importlib.util.find_spec("lxml") is not None:
+            self.assertEqual("lxml", find_html_parser())
+
+    def test_make_soup(self):
+        soup = make_soup(HTML_CONTENT)
+        self.assertEqual("/item", soup.select(".box a")[0]["href"])
+
+    def test_make_soup_fallback(self):
+        soup = make_soup(HTML_CONTENT, parser="html.parser")
+        self.assertEqual("/item", soup.select(".box a")[0]["href"])
+
+    def test_make_soup_parse_only(self):
+        soup = make_soup(HTML_CONTENT, parse_only=SoupStrainer("script", {"id": "state"}))
+        self.assertEqual([], soup.find_all("div"))
+        self.assertEqual('{"value": 1}', soup.find("script").string)
@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from rssforward.source.utils.httpclient import create_session, DEFAULT_USER_AGENT
+
+
+class CountingServer(ThreadingHTTPServer):
+    """Server keeping information about received requests."""
+
+    def __init__(self, server_address, handler_class):
+        super().__init__(server_address, handler_class)
+        self.requests_num = 0
+        self.clients: set[tuple[str, int]] = set()
+        self.user_agent: str = None
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    server: CountingServer
+
+    def do_GET(self):  # noqa: N802 # pylint: disable=C0103
+        server = self.server
+        server.requests_num += 1
+        server.clients.add(self.client_address)
+        server.user_agent = self.headers.get("User-Agent")
+        status = 503 if server.requests_num == 1 else 200
+        body = b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args: object):  # noqa: A002 # pylint: disable=W0622
+        pass
+
+
+class HttpClientTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.server = CountingServer(("127.0.0.1", 0), FlakyHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.session = create_session()
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get_retry(self):
+        url = f"http://127.0.0.1:{self.server.server_port}/"
+        response = self.session.get(url, timeout=5)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, self.server.requests_num)
+        self.assertEqual(DEFAULT_USER_AGENT, self.server.user_agent)
+
+    def test_get_keepalive(self):
+        url = f"http://127.0.0.1:{self.server.server_port}/"
+        for _ in range(4):
+            self.session.get(url, timeout=5)
+        self.assertEqual(5, self.server.requests_num)
+        # all requests sent through one connection
+        self.assertEqual(1, len(self.server.clients))
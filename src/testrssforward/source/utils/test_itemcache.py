@@ -0,0 +1,75 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import os
+import unittest
+import tempfile
+
+from rssforward.source.utils.itemcache import ItemCache, get_cached_item
+
+
+class ItemCacheTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.data_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        self.data_dir.cleanup()
+
+    def test_get_or_create(self):
+        item_cache = ItemCache("test", self.data_dir.name)
+        created = []
+
+        def create_item():
+            created.append(1)
+            return "content"
+
+        self.assertEqual("content", item_cache.get_or_create("aaa", create_item))
+        self.assertEqual("content", item_cache.get_or_create("aaa", create_item))
+        self.assertEqual(1, len(created))
+
+    def test_get_or_create_none(self):
+        item_cache = ItemCache("test", self.data_dir.name)
+        self.assertIsNone(item_cache.get_or_create("aaa", lambda: None))
+        self.assertEqual("bbb", item_cache.get_or_create("aaa", lambda: "bbb"))
+
+    def test_store(self):
+        item_cache = ItemCache("test", self.data_dir.name)
+        item_cache.set("aaa", 1)
+        item_cache.set("bbb", 2)
+        item_cache.store()
+
+        item_cache = ItemCache("test", self.data_dir.name)
+        self.assertEqual(1, item_cache.get("aaa"))
+        item_cache.store()  # 'bbb' not accessed - removed
+
+        item_cache = ItemCache("test", self.data_dir.name)
+        self.assertEqual(1, item_cache.get("aaa"))
+        self.assertIsNone(item_cache.get("bbb"))
+
+    def test_load_corrupted(self):
+        item_cache = ItemCache("test", self.data_dir.name)
+        item_cache.set("aaa", "content")
+        item_cache.store()
+
+        ## e.g. crash during writing
+        cache_path = os.path.join(self.data_dir.name, "test.obj")
+        with open(cache_path, "r+b") as cache_file:
+            cache_file.truncate(10)
+
+        item_cache = ItemCache("test", self.data_dir.name)
+        self.assertIsNone(item_cache.get("aaa"))
+        self.assertEqual("new", item_cache.get_or_create("aaa", lambda: "new"))
+        item_cache.store()
+
+        item_cache = ItemCache("test", self.data_dir.name)
+        self.assertEqual("new", item_cache.get("aaa"))
+
+    def test_get_cached_item_no_cache(self):
+        self.assertEqual("aaa", get_cached_item(None, "key", lambda: "aaa"))
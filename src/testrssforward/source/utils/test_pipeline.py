@@ -0,0 +1,105 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import tempfile
+import datetime
+
+from rssforward.source.utils.itemcache import ItemCache
+from rssforward.source.utils.pipeline import ListingPipeline
+
+
+def get_date(days_ago):
+    curr_time = datetime.datetime.now(tz=datetime.timezone.utc)
+    return curr_time - datetime.timedelta(days=days_ago)
+
+
+class ListingPipelineTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.data_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.fetched = []
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        self.data_dir.cleanup()
+
+    def fetch_detail(self, item):
+        self.fetched.append(item["id"])
+        return {"age": item["age"]}
+
+    def test_run_filter_listing(self):
+        listing = [{"id": "a", "age": 1}, {"id": "b", "age": 10}, {"id": "c", "age": 2}, {"id": "d", "age": 3}]
+        pipeline = ListingPipeline(items_num=3, max_age_days=7)
+        result = pipeline.run(
+            listing,
+            get_key=lambda item: item["id"],
+            fetch_detail=self.fetch_detail,
+            get_date=lambda item: get_date(item["age"]),
+        )
+
+        self.assertEqual(["a", "c"], [item["id"] for item, _detail in result])
+        self.assertEqual(["a", "c"], self.fetched)
+
+    def test_run_detail_date(self):
+        item_cache = ItemCache("test", self.data_dir.name)
+        listing = [{"id": "a", "age": 1}, {"id": "b", "age": 10}]
+        pipeline = ListingPipeline(item_cache, max_age_days=7, workers=2)
+
+        def run_pipeline():
+            result = pipeline.run(
+                listing,
+                get_key=lambda item: item["id"],
+                fetch_detail=self.fetch_detail,
+                get_detail_date=lambda detail: get_date(detail["age"]),
+            )
+            item_cache.store()
+            return [item["id"] for item, _detail in result]
+
+        self.assertEqual(["a"], run_pipeline())
+        self.assertEqual(["a", "b"], self.fetched)
+
+        ## details of fresh item are cached, stale item is not fetched again
+        self.assertEqual(["a"], run_pipeline())
+        self.assertEqual(["a", "b"], self.fetched)
+
+    def test_run_skip_none(self):
+        listing = [{"id": "a", "age": 1}, {"id": "b", "age": 1}]
+        pipeline = ListingPipeline()
+        result = pipeline.run(
+            listing,
+            get_key=lambda item: item["id"],
+            fetch_detail=lambda item: None if item["id"] == "a" else item,
+        )
+        self.assertEqual(["b"], [item["id"] for item, _detail in result])
+
+    def test_run_missing_fetched_again(self):
+        item_cache = ItemCache("test", self.data_dir.name)
+        listing = [{"id": "a", "age": 1}, {"id": "b", "age": 1}]
+        pipeline = ListingPipeline(item_cache, skip_missing=False)
+        failing = {"a"}
+
+        def fetch_detail(item):
+            self.fetched.append(item["id"])
+            if item["id"] in failing:
+                ## e.g. transient HTTP error
+                return None
+            return {"age": item["age"]}
+
+        def run_pipeline():
+            result = pipeline.run(listing, get_key=lambda item: item["id"], fetch_detail=fetch_detail)
+            item_cache.store()
+            return [(item["id"], detail) for item, detail in result]
+
+        self.assertEqual([("a", None), ("b", {"age": 1})], run_pipeline())
+        self.assertEqual(["a", "b"], self.fetched)
+
+        ## failed detail is fetched again in next cycle, successful one comes from cache
+        failing.clear()
+        self.assertEqual([("a", {"age": 1}), ("b", {"age": 1})], run_pipeline())
+        self.assertEqual(["a", "b", "a"], self.fetched)
@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import time
+import threading
+
+from rssforward.source.utils.ratelimit import RateLimiter
+from rssforward.source.utils.workers import map_concurrent
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_limit_burst(self):
+        limiter = RateLimiter(rate=10.0, burst=2, max_inflight=0)
+        start_time = time.perf_counter()
+        for _ in range(4):
+            with limiter.limit("https://example.com/page"):
+                pass
+        duration = time.perf_counter() - start_time
+
+        # two requests in burst, two more delayed by 0.1 sec each
+        self.assertGreater(duration, 0.15)
+        self.assertLess(duration, 0.5)
+
+    def test_limit_separate_hosts(self):
+        limiter = RateLimiter(rate=1.0, burst=1, max_inflight=0)
+        start_time = time.perf_counter()
+        with limiter.limit("https://example.com/page"):
+            pass
+        with limiter.limit("https://example.org/page"):
+            pass
+        duration = time.perf_counter() - start_time
+
+        self.assertLess(duration, 0.5)
+
+    def test_limit_host_override(self):
+        hosts_dict = {"example.com": {"rate": 0, "maxinflight": 2}}
+        limiter = RateLimiter(rate=1.0, burst=1, max_inflight=1, hosts_dict=hosts_dict)
+
+        host_limit = limiter.get_limit("https://api.example.com/page")
+        self.assertIs(host_limit, limiter.get_limit("https://example.com/other"))
+        self.assertEqual(0, host_limit.rate)
+        self.assertIsNot(host_limit, limiter.get_limit("https://example.org/page"))
+
+    def test_limit_inflight(self):
+        limiter = RateLimiter(rate=0, max_inflight=2)
+        lock = threading.Lock()
+        counter = {"current": 0, "max": 0}
+
+        def request(_item):
+            with limiter.limit("https://example.com/page"):
+                with lock:
+                    counter["current"] += 1
+                    counter["max"] = max(counter["max"], counter["current"])
+                time.sleep(0.02)
+                with lock:
+                    counter["current"] -= 1
+
+        map_concurrent(request, range(8), workers=8)
+        self.assertEqual(2, counter["max"])
@@ -0,0 +1,43 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+
+from testrssforward.data import read_data
+
+from rssforward.source.utils.react import extract_data_dict, extract_script_json
+
+
+HTML_CONTENT = """<html><head>
+<script src="main.js"></script>
+<script type='application/json' id=other>{"value": 0}</script>
+<SCRIPT type="application/json" id="serverApp-state">{"STORE": {"items": ["zażółć", "<b>"]}}</SCRIPT >
+</head><body></body></html>"""
+
+
+class ReactTest(unittest.TestCase):
+    def test_extract_script_json(self):
+        data_dict = extract_script_json(HTML_CONTENT, {"id": "serverApp-state"})
+        self.assertEqual({"STORE": {"items": ["zażółć", "<b>"]}}, data_dict)
+
+        data_dict = extract_script_json(HTML_CONTENT, {"type": "application/json"})
+        self.assertEqual({"value": 0}, data_dict)
+
+    def test_extract_script_json_bytes(self):
+        content = HTML_CONTENT.encode("utf-8")
+        items_list = extract_script_json(content, {"id": "serverApp-state"}, ["STORE", "items"])
+        self.assertEqual(["zażółć", "<b>"], items_list)
+
+    def test_extract_script_json_missing(self):
+        self.assertIsNone(extract_script_json(HTML_CONTENT, {"id": "missing"}))
+        self.assertIsNone(extract_script_json(HTML_CONTENT, {"id": "serverApp-state"}, ["STORE", "missing"]))
+
+    def test_extract_data_dict(self):
+        content = read_data("german.html")
+        data_dict = extract_data_dict(content)
+        self.assertIn("props", data_dict)
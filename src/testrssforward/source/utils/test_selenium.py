@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+from unittest import mock
+
+from selenium.common.exceptions import WebDriverException
+
+from rssforward.source.utils.selenium import DriverPool, configure_driver_pool, get_driver_pool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive: bool = True
+        self.quitted: bool = False
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            message = "dead"
+            raise WebDriverException(message)
+        return "about:blank"
+
+    def quit(self):
+        self.quitted = True
+
+
+class DriverPoolTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.drivers: list[FakeDriver] = []
+
+        def create_driver(**_kwargs: object):
+            driver = FakeDriver()
+            self.drivers.append(driver)
+            return driver
+
+        patcher = mock.patch("rssforward.source.utils.selenium.init_selenium_driver", side_effect=create_driver)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_checkout_reuse(self):
+        pool = DriverPool(max_size=1, max_pages=10)
+        for _ in range(3):
+            with pool.checkout():
+                pass
+        self.assertEqual(1, len(self.drivers))
+
+        pool.close()
+        self.assertTrue(self.drivers[0].quitted)
+
+    def test_checkout_recycle(self):
+        pool = DriverPool(max_size=1, max_pages=2)
+        for _ in range(3):
+            with pool.checkout():
+                pass
+        self.assertEqual(2, len(self.drivers))
+        self.assertTrue(self.drivers[0].quitted)
+
+    def test_checkout_dead(self):
+        pool = DriverPool(max_size=1, max_pages=10)
+        with pool.checkout() as driver:
+            self.assertIs(self.drivers[0], driver)
+            self.drivers[0].alive = False
+        with pool.checkout() as driver:
+            self.assertIs(self.drivers[1], driver)
+        self.assertTrue(self.drivers[0].quitted)
+
+    def test_checkout_exception(self):
+        pool = DriverPool(max_size=1, max_pages=10)
+        with self.assertRaises(RuntimeError), pool.checkout():
+            raise RuntimeError
+        self.assertTrue(self.drivers[0].quitted)
+        with pool.checkout() as driver:
+            self.assertIs(self.drivers[1], driver)
+
+    def test_configure_driver_pool(self):
+        configure_driver_pool(3)
+        self.addCleanup(configure_driver_pool, 1)
+        self.assertEqual(3, get_driver_pool().max_size)
+        configure_driver_pool(0)
+        self.assertEqual(1, get_driver_pool().max_size)
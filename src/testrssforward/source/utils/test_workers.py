@@ -0,0 +1,34 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import time
+
+from rssforward.source.utils.workers import map_concurrent
+
+
+def delayed_square(value):
+    # last items finish first
+    time.sleep(0.05 * (5 - value))
+    return value * value
+
+
+class WorkersTest(unittest.TestCase):
+    def test_map_concurrent_order(self):
+        start_time = time.perf_counter()
+        result = map_concurrent(delayed_square, range(5), workers=5)
+        duration = time.perf_counter() - start_time
+
+        self.assertEqual([0, 1, 4, 9, 16], result)
+        self.assertLess(duration, 0.4)
+
+    def test_map_concurrent_single(self):
+        self.assertEqual([0, 1, 4], map_concurrent(delayed_square, [0, 1, 2]))
+
+    def test_map_concurrent_empty(self):
+        self.assertEqual([], map_concurrent(delayed_square, [], workers=4))
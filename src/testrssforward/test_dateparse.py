@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import datetime
+
+import pytz
+
+from rssforward.dateparse import (
+    DateFormat,
+    detect_format,
+    parse_date,
+    parse_date_format,
+    parse_dates,
+    timestamp_to_date,
+    configure_timezone,
+)
+from rssforward.utils import string_to_date_general
+
+
+def legacy_parse(date_string, date_format):
+    if date_format is DateFormat.ISO:
+        item_date = datetime.datetime.fromisoformat(date_string)
+    else:
+        item_date = datetime.datetime.strptime(date_string, date_format.value)
+    return pytz.timezone("Europe/Warsaw").localize(item_date)
+
+
+DATES_LIST = [
+    ("2024-06-04", DateFormat.DATE),
+    ("2024-6-4", DateFormat.DATE),
+    ("04.06.2024", DateFormat.DATE_DOTS),
+    ("2024-01-04 14:23:41", DateFormat.DATETIME),
+    ("2024-06-04 14:23", DateFormat.DATETIME_HM),
+    ("2024-06-04T14:23:41Z", DateFormat.ISO_Z),
+    ("2024-06-04T14:23:41.077Z", DateFormat.ISO_FRACTION_Z),
+    ("2024-06-04T14:23:41.07Z", DateFormat.ISO_FRACTION_Z),
+    ("2024-06-04T14:23:41", DateFormat.ISO),
+]
+
+
+class DateParseTest(unittest.TestCase):
+    ## Called after testfunction was executed
+    def tearDown(self):
+        configure_timezone()
+
+    def test_parse_date_format(self):
+        for date_string, date_format in DATES_LIST:
+            with self.subTest(date_string=date_string):
+                item_date = parse_date_format(date_string, date_format)
+                self.assertEqual(legacy_parse(date_string, date_format), item_date)
+                self.assertEqual(item_date.utcoffset(), legacy_parse(date_string, date_format).utcoffset())
+
+    def test_parse_date_format_invalid(self):
+        self.assertRaises(ValueError, parse_date_format, "2024-06-04 14:23", DateFormat.DATE)
+        self.assertRaises(ValueError, parse_date_format, "2024-13-04", DateFormat.DATE)
+        self.assertRaises(ValueError, parse_date_format, "2024-06-04", DateFormat.ISO_Z)
+        self.assertRaises(ValueError, parse_date_format, "2024-06-04T14:23:41+02:00", DateFormat.ISO)
+
+    def test_detect_format(self):
+        for date_string, date_format in DATES_LIST:
+            with self.subTest(date_string=date_string):
+                self.assertEqual(date_format, detect_format(date_string))
+
+    def test_parse_date(self):
+        item_date = parse_date("2024-06-04T14:23:41.077Z")
+        self.assertEqual(legacy_parse("2024-06-04T14:23:41.077Z", DateFormat.ISO_FRACTION_Z), item_date)
+
+    def test_parse_date_not_padded(self):
+        item_date = string_to_date_general("2024-6-4")
+        self.assertEqual(legacy_parse("2024-06-04", DateFormat.DATE), item_date)
+        self.assertEqual(legacy_parse("2024-10-4", DateFormat.DATE), parse_date("2024-10-4"))
+        self.assertEqual(legacy_parse("2024-6-14", DateFormat.DATE), parse_date("2024-6-14"))
+
+    def test_parse_dates(self):
+        dates_list = ["2024-06-04", None, "2024-06-05", "2024-06-04", "2024-06-04T14:23:41Z"]
+        parsed_list = parse_dates(dates_list)
+        self.assertEqual(5, len(parsed_list))
+        self.assertIsNone(parsed_list[1])
+        self.assertEqual(legacy_parse("2024-06-05", DateFormat.DATE), parsed_list[2])
+        self.assertIs(parsed_list[0], parsed_list[3])
+        self.assertEqual(legacy_parse("2024-06-04T14:23:41Z", DateFormat.ISO_Z), parsed_list[4])
+
+    def test_timestamp_to_date(self):
+        item_date = timestamp_to_date(1717503821)
+        expected = datetime.datetime.fromtimestamp(1717503821, tz=datetime.timezone.utc)
+        expected = expected.astimezone(tz=pytz.timezone("Europe/Warsaw"))
+        self.assertEqual(expected, item_date)
+        self.assertEqual(expected.utcoffset(), item_date.utcoffset())
+
+    def test_configure_timezone(self):
+        configure_timezone("UTC")
+        item_date = parse_date("2024-06-04 14:23")
+        self.assertEqual(datetime.timedelta(0), item_date.utcoffset())
@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import json
+import hashlib
+
+from rssforward.hashing import HashMode, calculate_data_hash, canonical_form, configure_hashing, get_hash_mode
+
+
+DATA_DICT = {
+    "item_date": "2024-06-04",
+    "teacher": "Jan Kowalski",
+    "title": "Matematyka",
+    "grade": "5+",
+    "semester": 1,
+    "description": "Sprawdzian z ułamków",
+    "nested": {"b": [1, 2.5, None, True], "a": "zażółć"},
+}
+
+
+class HashingTest(unittest.TestCase):
+    ## Called after testfunction was executed
+    def tearDown(self):
+        configure_hashing()
+
+    def test_compat_hash(self):
+        ## IDs of items calculated by previous versions
+        data_str = json.dumps(DATA_DICT, sort_keys=True)
+        # ruff: noqa: S324
+        expected = hashlib.md5(data_str.encode("utf-8")).hexdigest()  # nosec
+        self.assertEqual(HashMode.COMPAT, get_hash_mode())
+        self.assertEqual(data_str, canonical_form(DATA_DICT))
+        self.assertEqual(expected, calculate_data_hash(DATA_DICT))
+        ## equal data gives the same hash
+        self.assertEqual(expected, calculate_data_hash(dict(DATA_DICT)))
+
+    def test_fast_hash(self):
+        configure_hashing("fast")
+        data_hash = calculate_data_hash(DATA_DICT)
+        self.assertEqual(32, len(data_hash))
+        self.assertNotEqual(calculate_data_hash(DATA_DICT, HashMode.COMPAT), data_hash)
+
+        ## order of keys does not matter
+        reordered = dict(reversed(list(DATA_DICT.items())))
+        self.assertEqual(data_hash, calculate_data_hash(reordered))
+
+        changed = dict(DATA_DICT)
+        changed["grade"] = "5"
+        self.assertNotEqual(data_hash, calculate_data_hash(changed))
+
+    def test_configure_invalid(self):
+        self.assertRaises(ValueError, configure_hashing, "sha")
@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import sys
+import unittest
+import logging
+import io
+import queue
+import threading
+
+from rssforward import logger
+from rssforward.logger import BoundedQueueHandler, OverflowPolicy, create_formatter
+
+
+class CountingRecord(logging.LogRecord):
+    message_counter = 0
+
+    def getMessage(self):  # noqa: N802
+        self.message_counter += 1
+        return super().getMessage()
+
+
+def make_record(msg, *args: object, level=logging.INFO):
+    return CountingRecord("test", level, __file__, 10, msg, args, None)
+
+
+def make_exc_info(value):
+    try:
+        int(value)
+    except ValueError:
+        return sys.exc_info()
+    return None
+
+
+class EmptyLineFormatterTest(unittest.TestCase):
+    def test_format(self):
+        formatter = create_formatter("%(levelname)s %(message)s")
+        record = make_record("value %s", 12)
+        self.assertEqual("INFO value 12", formatter.format(record))
+        self.assertEqual(1, record.message_counter)
+
+        ## second handler with the same formatter
+        self.assertEqual("INFO value 12", formatter.format(record))
+        self.assertEqual(1, record.message_counter)
+
+    def test_format_empty(self):
+        formatter = create_formatter("%(levelname)s %(message)s")
+        self.assertEqual("\n", formatter.format(make_record("\n")))
+
+    def test_format_exception(self):
+        formatter = create_formatter("%(levelname)s %(message)s")
+        record = logging.LogRecord("test", logging.ERROR, __file__, 10, "failed", (), make_exc_info("bad value"))
+        text = formatter.format(record)
+        self.assertTrue(text.startswith("ERROR failed\nTraceback"))
+        self.assertTrue(text.endswith("ValueError: invalid literal for int() with base 10: 'bad value'"))
+
+
+class BoundedQueueHandlerTest(unittest.TestCase):
+    def test_drop(self):
+        records_queue: queue.Queue = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(records_queue, OverflowPolicy.DROP)
+        for index in range(4):
+            handler.handle(make_record("info %s", index))
+        self.assertEqual(2, records_queue.qsize())
+        self.assertEqual(2, handler.dropped)
+
+        ## free space - next record is followed by information about dropped records
+        records_queue.get_nowait()
+        records_queue.get_nowait()
+        handler.handle(make_record("info %s", 5))
+        records_list = [records_queue.get_nowait(), records_queue.get_nowait()]
+        self.assertEqual("info 5", records_list[0].getMessage())
+        self.assertEqual("dropped 2 log records - logging queue full", records_list[1].getMessage())
+        self.assertEqual(0, handler.dropped)
+        self.assertEqual(2, handler.dropped_total)
+
+    def test_prepare(self):
+        records_queue: queue.Queue = queue.Queue()
+        handler = BoundedQueueHandler(records_queue)
+        data = [1]
+        handler.handle(make_record("data %s", data))
+        data.append(2)
+        self.assertEqual("data [1]", records_queue.get_nowait().getMessage())
+
+
+class AsyncLoggingTest(unittest.TestCase):
+    ## Called before testfunction is executed
+    def setUp(self):
+        self.root_handlers = list(logging.root.handlers)
+        self.root_level = logging.root.level
+        self.stream = io.StringIO()
+        self.handler = logging.StreamHandler(self.stream)
+        self.handler.setFormatter(create_formatter("%(levelname)s %(message)s"))
+
+    ## Called after testfunction was executed
+    def tearDown(self):
+        logger.shutdown()
+        logging.root.handlers = self.root_handlers
+        logging.root.setLevel(self.root_level)
+
+    def test_shutdown(self):
+        queue_handler = logger.start_async([self.handler], queue_size=100)
+        self.assertIsNotNone(queue_handler)
+        self.assertTrue(logger.is_async())
+        self.assertIn(queue_handler, logging.root.handlers)
+
+        logging.root.setLevel(logging.DEBUG)
+        test_logger = logging.getLogger("testrssforward.async")
+        for index in range(50):
+            test_logger.debug("message %s", index)
+
+        logger.shutdown()
+        self.assertFalse(logger.is_async())
+        self.assertNotIn(queue_handler, logging.root.handlers)
+        self.assertIn(self.handler, logging.root.handlers)
+
+        lines_list = self.stream.getvalue().splitlines()
+        self.assertEqual(50, len(lines_list))
+        self.assertEqual("DEBUG message 49", lines_list[-1])
+
+        ## logging after shutdown is synchronous
+        test_logger.info("after")
+        self.assertEqual("INFO after", self.stream.getvalue().splitlines()[-1])
+
+    def test_shutdown_queue_full(self):
+        ## handler blocks listener thread, so the queue becomes full
+        blocked_event = threading.Event()
+        write_event = threading.Event()
+
+        def block_write(_record):
+            blocked_event.set()
+            return write_event.wait()
+
+        self.handler.addFilter(block_write)
+        queue_handler = logger.start_async([self.handler], queue_size=2, overflow=OverflowPolicy.DROP)
+        self.assertIsNotNone(queue_handler)
+
+        logging.root.setLevel(logging.DEBUG)
+        test_logger = logging.getLogger("testrssforward.async")
+        test_logger.debug("message first")
+        self.assertTrue(blocked_event.wait(5))
+        for index in range(10):
+            test_logger.debug("message %s", index)
+        ## records dropped - queue is full
+        self.assertGreater(queue_handler.dropped_total, 0)
+
+        ## release listener after shutdown started to wait for space in the queue
+        threading.Timer(0.2, write_event.set).start()
+        logger.shutdown()
+        self.assertFalse(logger.is_async())
+        self.assertIn(self.handler, logging.root.handlers)
+        self.assertIn("DEBUG message", self.stream.getvalue())
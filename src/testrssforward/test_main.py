@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import os
+import sys
+import unittest
+import tempfile
+import json
+import subprocess  # nosec
+
+import rssforward
+
+
+SRC_DIR = os.path.dirname(os.path.dirname(rssforward.__file__))
+
+## maximum time in seconds from start of interpreter to first call of generator
+STARTUP_BUDGET = 1.5
+
+## executes one-shot headless mode with generator replaced by stub measuring time of first call
+## result is written to file - stdout is shared with logging thread
+STARTUP_CODE = """
+import time
+start_time = time.perf_counter()
+import sys, json, types
+from rssforward.source import registry
+
+RESULT_PATH = sys.argv[2]
+
+class StubGenerator:
+    def authenticate(self, login, password):
+        return True
+    def generate(self):
+        result = {
+            "first_call": time.perf_counter() - start_time,
+            "modules": [name for name in ("pystray", "PIL", "rssforward.rss.rssserver") if name in sys.modules],
+        }
+        with open(RESULT_PATH, "w", encoding="utf-8") as result_file:
+            json.dump(result, result_file)
+        return {}
+    def close(self):
+        pass
+
+stub_module = types.SimpleNamespace(__name__="stub", get_generator=lambda _params: StubGenerator())
+registry.load_generator_module = lambda _gen_id: stub_module
+
+from rssforward.main import main
+sys.argv = ["rssforward", "-c", sys.argv[1], "--trayicon", "False", "--startserver", "False", "--genloop", "False"]
+main()
+"""
+
+
+class StartupTest(unittest.TestCase):
+    ## Called before testfunction is executed
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+
+    ## Called after testfunction was executed
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_startup_headless(self):
+        config_path = os.path.join(self.tmp_dir.name, "config.toml")
+        result_path = os.path.join(self.tmp_dir.name, "startup.json")
+        with open(config_path, "w", encoding="utf-8") as config_file:
+            config_file.write('[general]\ndataroot = "data"\nlogdir = "log"\n\n[[item]]\ngenerator = "kidsalert"\n')
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = SRC_DIR
+        env["XDG_DATA_HOME"] = self.tmp_dir.name
+        ## tray requires graphical session - must not be touched in headless mode
+        env.pop("DISPLAY", None)
+        result = subprocess.run(  # noqa: S603 # nosec
+            [sys.executable, "-c", STARTUP_CODE, config_path, result_path],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+
+        with open(result_path, encoding="utf-8") as result_file:
+            startup_dict = json.load(result_file)
+        self.assertEqual([], startup_dict["modules"])
+        self.assertLess(startup_dict["first_call"], STARTUP_BUDGET)
@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+
+from rssforward.metrics import MetricsRegistry
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def test_render_counter(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Number of requests.", ["host", "status"])
+        counter.inc("example.com", "200")
+        counter.inc("example.com", "200")
+        counter.inc('ex"ample', "404", value=3)
+
+        content = registry.render()
+        self.assertEqual(
+            """\
+# HELP requests_total Number of requests.
+# TYPE requests_total counter
+requests_total{host="ex\\"ample",status="404"} 3
+requests_total{host="example.com",status="200"} 2
+""",
+            content,
+        )
+
+    def test_render_histogram(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("duration_seconds", "Duration.", ["generator"], buckets=[0.1, 1.0])
+        histogram.observe(0.05, "gen")
+        histogram.observe(0.1, "gen")
+        histogram.observe(0.5, "gen")
+        histogram.observe(5.0, "gen")
+        self.assertEqual(4, histogram.get_count("gen"))
+
+        content = registry.render()
+        self.assertEqual(
+            """\
+# HELP duration_seconds Duration.
+# TYPE duration_seconds histogram
+duration_seconds_bucket{generator="gen",le="0.1"} 2
+duration_seconds_bucket{generator="gen",le="1.0"} 3
+duration_seconds_bucket{generator="gen",le="+Inf"} 4
+duration_seconds_sum{generator="gen"} 5.65
+duration_seconds_count{generator="gen"} 4
+""",
+            content,
+        )
+
+    def test_clear(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("items_total", "Items.")
+        counter.inc()
+        self.assertEqual(1, counter.get())
+        registry.clear()
+        self.assertEqual(0, counter.get())
@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+import tempfile
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from testrssforward.replay import FixtureStore, record_responses, replay_responses, get_request_key
+
+from rssforward.source.utils import httpclient
+from rssforward.source.utils import selenium
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # pylint: disable=C0103
+        content = f"<html><body>{self.path} zażółć</body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *_args: object):
+        pass
+
+
+class ReplayTest(unittest.TestCase):
+    ## Called before testfunction is executed
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.server = HTTPServer(("127.0.0.1", 0), PageHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    ## Called after testfunction was executed
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def test_record_replay(self):
+        with record_responses(self.tmp_dir.name) as fixture_store:
+            response = httpclient.http_get(f"{self.base_url}/page?id=1")
+            self.assertEqual(200, response.status_code)
+        self.assertEqual(1, fixture_store.counters["http recorded"])
+
+        ## site not available
+        self.server.shutdown()
+
+        with replay_responses(self.tmp_dir.name) as fixture_store:
+            response = httpclient.http_get(f"{self.base_url}/page", params={"id": 1})
+            self.assertEqual(200, response.status_code)
+            self.assertEqual("<html><body>/page?id=1 zażółć</body></html>", response.text)
+            self.assertEqual("text/html; charset=utf-8", response.headers["content-type"])
+
+            self.assertRaises(requests.exceptions.ConnectionError, httpclient.http_get, f"{self.base_url}/other")
+        self.assertEqual(1, fixture_store.counters["http replayed"])
+        self.assertEqual(1, fixture_store.counters["http missing"])
+
+        ## original session restored
+        self.assertIsInstance(httpclient.get_session().get_adapter("https://"), httpclient.RateLimitedAdapter)
+        httpclient.close_session()
+
+    def test_replay_selenium(self):
+        orig_function = selenium.selenium_get_content
+        fixture_store = FixtureStore(self.tmp_dir.name)
+        fixture_store.add(get_request_key("SELENIUM", "https://site/a"), b"page A", source="selenium")
+        fixture_store.store()
+
+        with replay_responses(self.tmp_dir.name) as fixture_store:
+            self.assertEqual("page A", selenium.selenium_get_content("https://site/a"))
+            self.assertIsNone(selenium.selenium_get_content("https://site/b"))
+        self.assertEqual(1, fixture_store.counters["selenium replayed"])
+        self.assertEqual(1, fixture_store.counters["selenium missing"])
+        self.assertIs(orig_function, selenium.selenium_get_content)
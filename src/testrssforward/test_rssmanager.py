@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2023, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+from unittest import mock
+import os
+import time
+import tempfile
+
+from rssforward.rssgenerator import RSSGenerator
+from rssforward.rssmanager import RSSManager, ThreadedRSSManager
+from rssforward.configfile import ConfigField, ConfigKey
+
+
+class SleepGenerator(RSSGenerator):
+    def __init__(self, sleep_time, result=None):
+        self.sleep_time = sleep_time
+        self.result = result
+
+    def authenticate(self, _login, _password):
+        return True
+
+    def generate(self) -> dict[str, str]:
+        time.sleep(self.sleep_time)
+        return self.result
+
+
+class CountingManager:
+    def __init__(self, refresh_list):
+        self.refresh_list = refresh_list
+        self.counters = [0] * len(refresh_list)
+
+    def get_refresh_times(self, default_refresh_time):
+        return [default_refresh_time if item is None else item for item in self.refresh_list]
+
+    def find_generators(self, generator_id=None):
+        if generator_id is None:
+            return list(range(len(self.refresh_list)))
+        return [int(generator_id)]
+
+    def generate_data(self, gen_indexes=None):
+        for index in gen_indexes:
+            self.counters[index] += 1
+
+    def is_gen_valid(self):
+        return True
+
+
+class RSSManagerTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.data_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        for patched in ("save_recent_date", "save_feed_digests", "read_feed_digests"):
+            patcher = mock.patch(f"rssforward.rssmanager.{patched}", return_value={})
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        self.data_dir.cleanup()
+
+    def create_manager(self, generators, workers_num):
+        params = {
+            ConfigKey.GENERAL.value: {
+                ConfigField.DATAROOT.value: self.data_dir.name,
+                ConfigField.GENWORKERS.value: workers_num,
+            },
+        }
+        gen_list = [(gen_id, RSSManager.State(gen)) for gen_id, gen in generators]
+        return RSSManager(params, gen_list)
+
+    def test_generate_data_concurrent(self):
+        generators = [(f"gen{i}", SleepGenerator(0.3, {"feed.xml": "<rss/>"})) for i in range(4)]
+        manager = self.create_manager(generators, 4)
+
+        start_time = time.perf_counter()
+        manager.generate_data()
+        duration = time.perf_counter() - start_time
+
+        self.assertLess(duration, 0.9)
+        self.assertTrue(manager.is_gen_valid())
+
+    def test_generate_data_invalid(self):
+        generators = [("gen_ok", SleepGenerator(0.0, {})), ("gen_fail", SleepGenerator(0.0, None))]
+        manager = self.create_manager(generators, 2)
+
+        manager.generate_data()
+
+        self.assertFalse(manager.is_gen_valid())
+        # pylint: disable=W0212
+        states = dict(manager._generators)  # noqa: SLF001
+        self.assertTrue(states["gen_ok"].valid)
+        self.assertFalse(states["gen_fail"].valid)
+        self.assertIsNotNone(states["gen_fail"].duration)
+
+    def test_generate_data_unchanged(self):
+        generator = SleepGenerator(0.0, {"feed.xml": "<rss/>"})
+        manager = self.create_manager([("gen", generator)], 1)
+        feed_path = os.path.join(self.data_dir.name, "gen", "feed.xml")
+        # pylint: disable=W0212
+        gen_state = manager._generators[0][1]  # noqa: SLF001
+
+        manager.generate_data()
+        self.assertEqual((1, 0), (gen_state.written, gen_state.skipped))
+        os.utime(feed_path, (0, 0))
+
+        manager.generate_data()
+        self.assertEqual((0, 1), (gen_state.written, gen_state.skipped))
+        self.assertEqual(0, os.stat(feed_path).st_mtime)
+
+        generator.result = {"feed.xml": "<rss>changed</rss>"}
+        manager.generate_data()
+        self.assertEqual((1, 0), (gen_state.written, gen_state.skipped))
+        with open(feed_path, encoding="utf-8") as feed_file:
+            self.assertEqual("<rss>changed</rss>", feed_file.read())
+
+
+class ThreadedRSSManagerTest(unittest.TestCase):
+    def test_run_loop_refresh_times(self):
+        manager = CountingManager([0.1, None])
+        threaded_manager = ThreadedRSSManager(manager)
+        threaded_manager.start(10, 0)
+        time.sleep(0.45)
+        threaded_manager.stop()
+        threaded_manager.join()
+
+        self.assertGreaterEqual(manager.counters[0], 3)
+        self.assertEqual(manager.counters[1], 1)
+
+    def test_execute_single(self):
+        manager = CountingManager([10, 10])
+        threaded_manager = ThreadedRSSManager(manager)
+        threaded_manager.start(10, 0)
+        time.sleep(0.1)
+        threaded_manager.execute_single("1")
+        time.sleep(0.1)
+        threaded_manager.stop()
+        threaded_manager.join()
+
+        self.assertEqual(manager.counters, [1, 2])
@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2025, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import os
+import unittest
+import tempfile
+import json
+
+from rssforward.tracing import Tracer, remove_old_traces
+
+
+class TracerTest(unittest.TestCase):
+    ## Called before testfunction is executed
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+
+    ## Called after testfunction was executed
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cycle_disabled(self):
+        tracer = Tracer(self.tmp_dir.name, enabled=False)
+        tracer.begin_cycle()
+        with tracer.span("generate"):
+            pass
+        self.assertIsNone(tracer.end_cycle())
+        self.assertEqual([], os.listdir(self.tmp_dir.name))
+
+    def test_cycle_enabled(self):
+        tracer = Tracer(self.tmp_dir.name, enabled=True)
+        tracer.begin_cycle()
+        self.assertTrue(tracer.recording)
+        with tracer.span("cycle", "manager"), tracer.span("generate", "generator", gen_id="xxx"):
+            pass
+        trace_path = tracer.end_cycle()
+        self.assertFalse(tracer.recording)
+
+        with open(trace_path, encoding="utf-8") as trace_file:
+            trace_data = json.load(trace_file)
+        events = [event for event in trace_data["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual(["generate", "cycle"], [event["name"] for event in events])
+        self.assertEqual({"gen_id": "xxx"}, events[0]["args"])
+        self.assertGreaterEqual(events[1]["dur"], events[0]["dur"])
+        metadata = [event for event in trace_data["traceEvents"] if event["ph"] == "M"]
+        self.assertEqual(1, len(metadata))
+
+    def test_span_exception(self):
+        tracer = Tracer(self.tmp_dir.name, enabled=True)
+        tracer.begin_cycle()
+        with self.assertRaises(ValueError), tracer.span("failing"):
+            raise ValueError
+        trace_path = tracer.end_cycle()
+        with open(trace_path, encoding="utf-8") as trace_file:
+            trace_data = json.load(trace_file)
+        self.assertIn("failing", [event["name"] for event in trace_data["traceEvents"]])
+
+    def test_remove_old_traces(self):
+        for index in range(5):
+            with open(os.path.join(self.tmp_dir.name, f"trace-2025010{index}.json"), "w", encoding="utf-8"):
+                pass
+        with open(os.path.join(self.tmp_dir.name, "other.txt"), "w", encoding="utf-8"):
+            pass
+        remove_old_traces(self.tmp_dir.name, limit=2)
+        files_list = sorted(os.listdir(self.tmp_dir.name))
+        self.assertEqual(["other.txt", "trace-20250103.json", "trace-20250104.json"], files_list)
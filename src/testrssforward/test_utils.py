@@ -6,9 +6,11 @@
 # LICENSE file in the root directory of this source tree.
 #
 
+import os
 import unittest
+import tempfile
 
-from rssforward.utils import normalize_string, get_recent_date
+from rssforward.utils import normalize_string, get_recent_date, store_object_atomic, load_object_safe
 
 
 class UtilsTest(unittest.TestCase):
@@ -30,3 +32,24 @@ class UtilsTest(unittest.TestCase):
         recent = get_recent_date()
         tzinfo = recent.tzinfo
         self.assertTrue(tzinfo is not None)
+
+    def test_load_object_safe(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            object_path = os.path.join(tmp_dir, "subdir", "digests.obj")
+            self.assertEqual({}, load_object_safe(object_path, {}))
+
+            store_object_atomic({"feed.xml": "abc"}, object_path)
+            self.assertEqual({"feed.xml": "abc"}, load_object_safe(object_path, {}))
+            self.assertEqual(["digests.obj"], os.listdir(os.path.dirname(object_path)))
+
+            ## truncated file
+            with open(object_path, "rb") as object_file:
+                data_bytes = object_file.read()
+            with open(object_path, "wb") as object_file:
+                object_file.write(data_bytes[: len(data_bytes) // 2])
+            self.assertEqual({}, load_object_safe(object_path, {}))
+
+            ## garbage
+            with open(object_path, "wb") as object_file:
+                object_file.write(b"xyz")
+            self.assertEqual({}, load_object_safe(object_path, {}))
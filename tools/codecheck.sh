@@ -151,6 +151,7 @@ run_ruff() {
     ignore_errors+=(ERA001)     ## ERA001 Found commented-out code
     ignore_errors+=(PLR2004)    ## PLR2004 Magic value used in comparison, consider replacing `2` with a constant variable
     ignore_errors+=(PT009)      ## PT009 Use a regular `assert` instead of unittest-style `assertEqual`
+    ignore_errors+=(PT027)      ## PT027 Use `pytest.raises` instead of unittest-style `assertRaises`
     ignore_errors+=(RUF013)     ## RUF013 PEP 484 prohibits implicit `Optional`
     ignore_errors+=(RUF100)     ## RUF100 [*] Unused `noqa` directive (unused: `F811`)
     ignore_errors+=(TD002)      ## TD002 Missing author in TODO; try: `# TODO(<author_name>): ...` or `# TODO @<author_name>: ...`
@@ -174,6 +175,9 @@ run_ruff() {
     ignore_errors+=(PTH107)     ## PTH107 `os.remove()` should be replaced by `Path.unlink()`
     ignore_errors+=(PTH110)     ## PTH110 `os.path.exists()` should be replaced by `Path.exists()`
     ignore_errors+=(PTH119)     ## PTH119 `os.path.basename()` should be replaced by `Path.name`
+    ignore_errors+=(PTH116)     ## PTH116 `os.stat()` should be replaced by `Path.stat()`, `Path.owner()`, or `Path.group()`
+    ignore_errors+=(PTH101)     ## PTH101 `os.chmod()` should be replaced by `Path.chmod()`
+    ignore_errors+=(PTH105)     ## PTH105 `os.replace()` should be replaced by `Path.replace()`
     
     ignore_errors+=(S108)       ## S108 Probable insecure usage of temporary file or directory: "/tmp/"
     ignore_errors+=(TC001)      ## TC001 Move application import `rssforward.rssgenerator.RSSGenerator` into a type-checking block
@@ -185,6 +189,7 @@ run_ruff() {
     ignore_errors+=(C901)       ## C901 `convert_to_section` is too complex (24 > 10)
     ignore_errors+=(PLR0911)    ## PLR0911 Too many return statements (24 > 6)
     ignore_errors+=(PLR0912)    ## PLR0912 Too many branches (23 > 12)
+    ignore_errors+=(PLR0913)    ## PLR0913 Too many arguments in function definition (6 > 5)
     ignore_errors+=(PLR0915)    ## PLR0915 Too many statements (69 > 50)
 
     ignore_string="${ignore_errors[*]}"